@@ -1,10 +1,14 @@
 """
 AUTSOAR XML Package
 """
+from autosar.xml.cache import DocumentCache
+from autosar.xml.conversion import CompuMethodConverter, ConverterCache
 from autosar.xml.document import Document
 from autosar.xml.reader import Reader
+from autosar.xml.validation import ConstraintValidator, Violation
 from autosar.xml.workspace import Workspace
 from autosar.xml.writer import Writer
 
 
-__all__ = ["Document", "Reader", "Workspace", "Writer"]
+__all__ = ["CompuMethodConverter", "ConstraintValidator", "ConverterCache", "DocumentCache", "Document", "Reader",
+           "Violation", "Workspace", "Writer"]
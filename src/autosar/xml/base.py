@@ -4,28 +4,67 @@ AUTOSAR XML base classes
 
 import abc
 import re
+from array import array
+from collections.abc import Iterator
 from typing import Any, Type
 from enum import Enum
 import autosar.xml.enumeration as ar_enum
 
 
+# Attribute types that count as empty when their length is zero
+_SEQUENCE_TYPES = (list, tuple, array)
+
+# Names of all slots defined by a class and its base classes
+_slot_names_cache: dict[type, tuple[str, ...]] = {}
+
+
+def _get_slot_names(cls: type) -> tuple[str, ...]:
+    slot_names = _slot_names_cache.get(cls, None)
+    if slot_names is None:
+        names = []
+        for base_class in reversed(cls.__mro__):
+            slots = base_class.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(x for x in slots if x not in ("__dict__", "__weakref__"))
+        slot_names = tuple(names)
+        _slot_names_cache[cls] = slot_names
+    return slot_names
+
+
 class ARObject:
     """
     Base class for all AUTOSAR objects
     """
 
+    __slots__ = ()
+
+    def _iter_attributes(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yields (name, value) for all instance attributes.
+        Works the same way as vars(self).items() but also includes attributes stored in __slots__.
+        """
+        for name in _get_slot_names(type(self)):
+            try:
+                yield name, getattr(self, name)
+            except AttributeError:
+                pass  # Slot not yet assigned
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict is not None:
+            yield from instance_dict.items()
+
     @property
     def is_empty(self) -> bool:
         """
-        True if no value has been set (everything is None)
+        True if no value has been set (everything is None or an empty sequence)
         """
-        for value in vars(self).values():
-            if isinstance(value, list):
-                if len(value) > 0:
-                    return False
-            else:
-                if value is not None:
-                    return False
+        for name in _get_slot_names(type(self)):
+            value = getattr(self, name, None)
+            if value is not None and (not isinstance(value, _SEQUENCE_TYPES) or len(value) > 0):
+                return False
+        for value in getattr(self, "__dict__", {}).values():
+            if value is not None and (not isinstance(value, _SEQUENCE_TYPES) or len(value) > 0):
+                return False
         return True
 
     def is_empty_with_ignore(self, ignore_set: set) -> bool:
@@ -34,15 +73,10 @@ class ARObject:
         a list of property names to ignore during
         check
         """
-        for key in vars(self).keys():
+        for key, value in self._iter_attributes():
             if key not in ignore_set:
-                value = getattr(self, key)
-                if isinstance(value, list):
-                    if len(value) > 0:
-                        return False
-                else:
-                    if value is not None:
-                        return False
+                if value is not None and (not isinstance(value, _SEQUENCE_TYPES) or len(value) > 0):
+                    return False
         return True
 
     def _assign_optional(self, attr_name: str, value: Any, type_name: type) -> None:
@@ -169,6 +203,8 @@ class BaseRef(ARObject, abc.ABC):
     Base type for all reference classes
     """
 
+    __slots__ = ("value", "dest")
+
     def __init__(self,
                  value: str,
                  dest: ar_enum.IdentifiableSubTypes = None) -> None:
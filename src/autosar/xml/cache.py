@@ -0,0 +1,155 @@
+"""
+On-disk cache of converted ARXML documents
+"""
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, BinaryIO
+import autosar.xml.document as ar_document
+
+# Increase whenever cached data becomes incompatible with older entries
+CACHE_FORMAT_VERSION = 10
+PICKLE_PROTOCOL = 5
+HASH_CHUNK_SIZE = 0x100000
+CACHE_FILE_SUFFIX = ".arcache"
+
+
+class DocumentCache:
+    """
+    Stores documents converted by the Reader class in a directory on disk.
+
+    Each ARXML file gets its own cache entry, named after a hash of its absolute path and variant.
+    The variant is a string naming reader options that affect the converted document.
+    The entry starts with a header containing format version, file size, modification time
+    and SHA-256 of the file content, followed by the pickled document.
+    An entry is used when size and modification time matches the ARXML file.
+    If only the modification time differs, the content hash is compared instead.
+
+    When the total size of all entries exceeds max_size, least recently used entries are removed.
+    """
+
+    def __init__(self, directory: str, max_size: int = 0x40000000) -> None:
+        self.directory = directory
+        self.max_size = max_size  # in bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, file_path: str, variant: str = "") -> ar_document.Document | None:
+        """
+        Returns cached document for file_path or None if the cache has no valid entry
+        """
+        entry_path = self._entry_path(file_path, variant)
+        try:
+            stat = os.stat(file_path)
+            with open(entry_path, "rb") as fh:  # pylint: disable=invalid-name
+                header = pickle.load(fh)
+                if not self._is_valid(header, file_path, variant, stat):
+                    self.misses += 1
+                    return None
+                document = self._load_document(fh)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                TypeError, ValueError, IndexError):
+            self.misses += 1
+            return None
+        if not isinstance(document, ar_document.Document):
+            self.misses += 1
+            return None
+        try:
+            os.utime(entry_path)  # Marks entry as recently used
+        except FileNotFoundError:
+            pass  # Entry was removed after it was read, for example by another process
+        self.hits += 1
+        return document
+
+    def store(self, file_path: str, document: ar_document.Document, variant: str = "") -> None:
+        """
+        Stores document as cache entry for file_path
+        """
+        stat = os.stat(file_path)
+        header = (CACHE_FORMAT_VERSION, os.path.abspath(file_path), variant, stat.st_size, stat.st_mtime_ns,
+                  self._calc_hash(file_path))
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fh:  # pylint: disable=invalid-name
+                pickle.dump(header, fh, protocol=PICKLE_PROTOCOL)
+                pickle.dump(document, fh, protocol=PICKLE_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(file_path, variant))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes least recently used entries until total size is within max_size
+        """
+        entries = []
+        total_size = 0
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(CACHE_FILE_SUFFIX):
+                    try:
+                        stat = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue  # Entry was removed after the directory was listed
+                    entries.append((stat.st_mtime_ns, stat.st_size, dir_entry.path))
+                    total_size += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        """
+        Removes all entries
+        """
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(CACHE_FILE_SUFFIX):
+                    os.remove(dir_entry.path)
+
+    def _load_document(self, fh: BinaryIO) -> Any:
+        # Unpickling creates a large number of objects that all survive.
+        # Pausing the garbage collector avoids repeated scans of the growing object tree.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.load(fh)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _entry_path(self, file_path: str, variant: str = "") -> str:
+        key = hashlib.sha256((os.path.abspath(file_path) + "\0" + variant).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def _is_valid(self, header: tuple, file_path: str, variant: str, stat: os.stat_result) -> bool:
+        if not isinstance(header, tuple) or len(header) != 6:
+            return False
+        version, abs_path, header_variant, size, mtime_ns, content_hash = header
+        if version != CACHE_FORMAT_VERSION or abs_path != os.path.abspath(file_path) or header_variant != variant:
+            return False
+        if size != stat.st_size:
+            return False
+        if mtime_ns == stat.st_mtime_ns:
+            return True
+        return content_hash == self._calc_hash(file_path)
+
+    def _calc_hash(self, file_path: str) -> str:
+        sha = hashlib.sha256()
+        with open(file_path, "rb") as fh:  # pylint: disable=invalid-name
+            while True:
+                chunk = fh.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                sha.update(chunk)
+        return sha.hexdigest()
@@ -0,0 +1,55 @@
+"""
+Compressed ARXML files.
+Compression is selected by file name suffix: ".gz" for gzip and ".xz" for xz (LZMA).
+"""
+import gzip
+import io
+import lzma
+import os
+from typing import IO
+
+GZIP_COMPRESS_LEVEL = 6  # Same default as the gzip command line tool
+
+# Compression name and its file name suffix
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "xz": ".xz"}
+
+# Exceptions raised when reading a file that isn't valid (for example a truncated compressed file)
+READ_ERRORS = (OSError, EOFError, lzma.LZMAError)
+
+
+def is_compressed(file_path: str | os.PathLike) -> bool:
+    """
+    Returns True if the file name suffix selects a compression
+    """
+    suffix = os.path.splitext(file_path)[1].lower()
+    return suffix in COMPRESSION_SUFFIXES.values()
+
+
+def get_suffix(compression: str) -> str:
+    """
+    Returns file name suffix for a compression name
+    """
+    suffix = COMPRESSION_SUFFIXES.get(compression, None)
+    if suffix is None:
+        raise ValueError(f"Unsupported compression: '{compression}'")
+    return suffix
+
+
+def open_file(file_path: str | os.PathLike, mode: str = "rb", encoding: str | None = None) -> IO:
+    """
+    Opens file like the built-in open, compressing or decompressing data based on file name suffix.
+    Only modes "rb", "wb", "rt" and "wt" are supported for compressed files.
+    Gzip files are written without modification time so that equal content gives equal files.
+    """
+    suffix = os.path.splitext(file_path)[1].lower()
+    binary_mode = mode.replace("t", "").replace("b", "") + "b"
+    if suffix == COMPRESSION_SUFFIXES["gzip"]:
+        fh = gzip.GzipFile(file_path, binary_mode,  # pylint: disable=invalid-name
+                           compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+    elif suffix == COMPRESSION_SUFFIXES["xz"]:
+        fh = lzma.LZMAFile(file_path, binary_mode)  # pylint: disable=invalid-name
+    else:
+        return open(file_path, mode, encoding=encoding)  # pylint: disable=consider-using-with
+    if "b" in mode:
+        return fh
+    return io.TextIOWrapper(fh, encoding=encoding)
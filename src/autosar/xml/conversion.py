@@ -0,0 +1,304 @@
+"""
+Conversion of values between internal and physical representation using CompuMethod elements
+"""
+from typing import Any, Callable, Iterable
+from autosar.base import Searchable
+import autosar.xml.element as ar_element
+from autosar.xml.interval import Interval, IntervalIndex, UNBOUNDED_INTERVAL, make_interval
+
+
+def _calc_interval(scale: ar_element.CompuScale) -> Interval:
+    return make_interval(scale.lower_limit, scale.upper_limit, scale.lower_limit_type, scale.upper_limit_type)
+
+
+def _eval_polynomial(coefficients: tuple[int | float, ...], value: int | float) -> int | float:
+    """
+    Evaluates c0 + c1*x + c2*x^2 ... using Horner's method
+    """
+    result = coefficients[-1]
+    for coefficient in reversed(coefficients[:-1]):
+        result = result * value + coefficient
+    return result
+
+
+class _RationalFunction:
+    """
+    Callable implementation of CompuRational
+    """
+
+    def __init__(self, rational: ar_element.CompuRational) -> None:
+        self.numerator = tuple(rational.numerator) if rational.numerator else (0,)
+        self.denominator = tuple(rational.denominator) if rational.denominator else (1,)
+
+    def __call__(self, value: int | float) -> int | float:
+        numerator = _eval_polynomial(self.numerator, value)
+        if len(self.denominator) == 1:
+            return numerator / self.denominator[0]
+        return numerator / _eval_polynomial(self.denominator, value)
+
+    def is_linear(self) -> bool:
+        """
+        True if the function has the form (n0 + n1*x) / d0 with n1 != 0
+        """
+        return len(self.numerator) == 2 and self.numerator[1] != 0 and len(self.denominator) == 1
+
+    def inverse(self) -> "_InverseLinearFunction":
+        """
+        Returns inverse of a linear function
+        """
+        if not self.is_linear():
+            raise NotImplementedError("Only linear rational functions can be inverted")
+        return _InverseLinearFunction(self.numerator[0], self.numerator[1], self.denominator[0])
+
+
+class _InverseLinearFunction:
+    """
+    Inverse of (n0 + n1*x) / d0
+    """
+
+    def __init__(self, offset: int | float, factor: int | float, divisor: int | float) -> None:
+        self.offset = offset
+        self.factor = factor
+        self.divisor = divisor
+
+    def __call__(self, value: int | float) -> float:
+        return (value * self.divisor - self.offset) / self.factor
+
+
+class ComputationConverter:
+    """
+    Converts values using the scales of a Computation (COMPU-INTERNAL-TO-PHYS or COMPU-PHYS-TO-INTERNAL).
+
+    Scales with constant content (TEXTTABLE) give their constant as result.
+    Scales with rational content (LINEAR, SCALE_LINEAR, RAT_FUNC) evaluate their rational function.
+    A value outside all scales gives the default value of the computation or raises ValueError if there is none.
+    """
+
+    def __init__(self, computation: ar_element.Computation) -> None:
+        self._unbounded_function: _RationalFunction | None = None
+        self._default_value = None
+        self._has_default_value = False
+        if computation.default_value is not None:
+            self._default_value = computation.default_value.value
+            self._has_default_value = True
+        items = []
+        for scale in computation.compu_scales or []:
+            if scale.mask is not None:
+                raise NotImplementedError("Scales with mask (BITFIELD_TEXTTABLE) are not supported")
+            if isinstance(scale.content, ar_element.CompuConst):
+                items.append((_calc_interval(scale), scale.content.value))
+            elif isinstance(scale.content, ar_element.CompuRational):
+                items.append((_calc_interval(scale), _RationalFunction(scale.content)))
+        if len(items) == 1 and isinstance(items[0][1], _RationalFunction) and items[0][0] == UNBOUNDED_INTERVAL:
+            self._unbounded_function = items[0][1]  # Skips scale lookup
+        self._index = IntervalIndex(items)
+
+    def convert(self, value: int | float) -> int | float | str:
+        """
+        Converts a single value
+        """
+        if self._unbounded_function is not None:
+            return self._unbounded_function(value)
+        item = self._index.find(value)
+        if item is None:
+            if self._has_default_value:
+                return self._default_value
+            raise ValueError(f"Value {value} is outside all scales")
+        if isinstance(item, _RationalFunction):
+            return item(value)
+        return item
+
+    def convert_many(self, values: Iterable[int | float]) -> list[int | float | str]:
+        """
+        Converts values. Gives the same result as calling convert on each value.
+        """
+        func = self._unbounded_function
+        if func is not None and len(func.denominator) == 1:
+            if len(func.numerator) == 2:
+                offset, factor = func.numerator
+                divisor = func.denominator[0]
+                return [(value * factor + offset) / divisor for value in values]
+            return [func(value) for value in values]
+        convert = self.convert
+        return [convert(value) for value in values]
+
+
+class _InverseConverter:
+    """
+    Converts physical values to internal values by inverting the internal-to-physical scales.
+    Used when a CompuMethod doesn't have an explicit COMPU-PHYS-TO-INTERNAL computation.
+
+    Constant values (texts) map to the inverse value of their scale or to its lower limit.
+    Physical values of rational scales are mapped back through the inverse of their linear function.
+    """
+
+    def __init__(self, computation: ar_element.Computation) -> None:
+        self._constants: dict[Any, int | float] = {}
+        items = []
+        for scale in computation.compu_scales or []:
+            if isinstance(scale.content, ar_element.CompuConst):
+                if scale.inverse_value is not None:
+                    internal_value = scale.inverse_value.value
+                else:
+                    internal_value = scale.lower_limit
+                if internal_value is not None:
+                    self._constants.setdefault(scale.content.value, internal_value)
+            elif isinstance(scale.content, ar_element.CompuRational):
+                function = _RationalFunction(scale.content)
+                inverse_function = function.inverse()
+                items.append((self._calc_physical_interval(scale, function), inverse_function))
+        self._index = IntervalIndex(items)
+
+    def _calc_physical_interval(self, scale: ar_element.CompuScale, function: _RationalFunction) -> Interval:
+        lower, lower_is_open, upper, upper_is_open = _calc_interval(scale)
+        first, last = function(lower), function(upper)
+        if function.numerator[1] / function.denominator[0] < 0:
+            return (last, upper_is_open, first, lower_is_open)
+        return (first, lower_is_open, last, upper_is_open)
+
+    def convert(self, value: int | float | str) -> int | float:
+        """
+        Converts a single value
+        """
+        internal_value = self._constants.get(value, None)
+        if internal_value is not None:
+            return internal_value
+        if isinstance(value, str):
+            raise ValueError(f"No scale has the constant '{value}'")
+        function = self._index.find(value)
+        if function is None:
+            raise ValueError(f"Value {value} is outside all scales")
+        return function(value)
+
+    def convert_many(self, values: Iterable[int | float | str]) -> list[int | float]:
+        """
+        Converts values. Gives the same result as calling convert on each value.
+        """
+        convert = self.convert
+        return [convert(value) for value in values]
+
+
+class _IdenticalConverter:
+    """
+    Used for CompuMethods without computation (IDENTICAL)
+    """
+
+    def convert(self, value: Any) -> Any:
+        """
+        Returns value unchanged
+        """
+        return value
+
+    def convert_many(self, values: Iterable[Any]) -> list[Any]:
+        """
+        Returns values as list
+        """
+        return list(values)
+
+
+class CompuMethodConverter:
+    """
+    Compiled form of a CompuMethod.
+
+    Converts internal values to physical values and back.
+    If the CompuMethod has no COMPU-PHYS-TO-INTERNAL, physical-to-internal conversion is done
+    by inverting COMPU-INTERNAL-TO-PHYS. This requires scales to be either constant or linear.
+
+    The converter doesn't follow later changes to the CompuMethod, compile it again instead.
+    """
+
+    def __init__(self, compu_method: ar_element.CompuMethod) -> None:
+        if compu_method.int_to_phys is not None:
+            self._int_to_phys = ComputationConverter(compu_method.int_to_phys)
+        else:
+            self._int_to_phys = _IdenticalConverter()
+        self._phys_to_int = None
+        self._phys_to_int_computation = compu_method.phys_to_int
+        self._int_to_phys_computation = compu_method.int_to_phys
+
+    def _get_phys_to_int(self) -> ComputationConverter | _InverseConverter | _IdenticalConverter:
+        if self._phys_to_int is None:
+            if self._phys_to_int_computation is not None:
+                self._phys_to_int = ComputationConverter(self._phys_to_int_computation)
+            elif self._int_to_phys_computation is not None:
+                self._phys_to_int = _InverseConverter(self._int_to_phys_computation)
+            else:
+                self._phys_to_int = _IdenticalConverter()
+        return self._phys_to_int
+
+    def to_physical(self, value: int | float) -> int | float | str:
+        """
+        Converts internal value to physical value
+        """
+        return self._int_to_phys.convert(value)
+
+    def to_internal(self, value: int | float | str) -> int | float:
+        """
+        Converts physical value to internal value
+        """
+        return self._get_phys_to_int().convert(value)
+
+    def to_physical_many(self, values: Iterable[int | float]) -> list[int | float | str]:
+        """
+        Converts internal values to physical values
+        """
+        return self._int_to_phys.convert_many(values)
+
+    def to_internal_many(self, values: Iterable[int | float | str]) -> list[int | float]:
+        """
+        Converts physical values to internal values
+        """
+        return self._get_phys_to_int().convert_many(values)
+
+
+class ConverterCache:
+    """
+    Compiles CompuMethods on first use and keeps the result per reference string.
+
+    A cached converter is compiled again if the workspace returns a different CompuMethod
+    object for the same reference. Call clear after changing CompuMethods in place.
+    """
+
+    def __init__(self, workspace: Searchable | None = None) -> None:
+        self.workspace = workspace
+        self._converters: dict[str, tuple[ar_element.CompuMethod, CompuMethodConverter]] = {}
+
+    def get(self, compu_method: ar_element.CompuMethod | ar_element.CompuMethodRef | str) -> CompuMethodConverter:
+        """
+        Returns converter for a CompuMethod object or for a reference to one.
+        References are looked up in the workspace.
+        """
+        if isinstance(compu_method, ar_element.CompuMethod):
+            element = compu_method
+            ref_str = compu_method.ref()
+            if ref_str is None:
+                return CompuMethodConverter(element)  # Not in a package, can't be cached
+            ref_str = str(ref_str)
+        else:
+            ref_str = str(compu_method)
+            if self.workspace is None:
+                raise RuntimeError("A workspace is required to look up references")
+            element = self.workspace.find(ref_str)
+            if not isinstance(element, ar_element.CompuMethod):
+                raise KeyError(f"Reference doesn't point to a CompuMethod: '{ref_str}'")
+        cached = self._converters.get(ref_str, None)
+        if cached is not None and cached[0] is element:
+            return cached[1]
+        converter = CompuMethodConverter(element)
+        self._converters[ref_str] = (element, converter)
+        return converter
+
+    def get_function(self,
+                     compu_method: ar_element.CompuMethod | ar_element.CompuMethodRef | str,
+                     to_physical: bool = True) -> Callable[[Iterable], list]:
+        """
+        Returns a function converting sequences of values in the given direction
+        """
+        converter = self.get(compu_method)
+        return converter.to_physical_many if to_physical else converter.to_internal_many
+
+    def clear(self) -> None:
+        """
+        Removes all cached converters
+        """
+        self._converters.clear()
@@ -3,14 +3,17 @@ Classes related to AUTOSAR XML Elements
 """
 
 import re
+import math
+from array import array
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any, Union
+from typing import Any, Callable, Union
 from collections import OrderedDict
 
 
 from autosar.base import split_ref, split_ref_strict, Searchable
 from autosar.xml.base import ARObject, BaseRef
+from autosar.xml.interval import IntervalIndex, make_interval
 import autosar.xml.enumeration as ar_enum
 import autosar.xml.exception as ar_except
 from autosar.xml.reference import (SwBaseTypeRef,  # noqa F401
@@ -105,6 +108,8 @@ class NumericalValue:
     Wrapper for numerical value
     """
 
+    __slots__ = ("_value", "value_format")
+
     def __init__(self,
                  value: int | float | str,
                  value_format: ar_enum.ValueFormat = ar_enum.ValueFormat.DEFAULT
@@ -180,9 +185,57 @@ class Referrable(ARObject):
     Group AR:REFERRABLE
     """
 
+    # Token of reference strings cached in top-level objects (objects whose parent is a package collection).
+    # Using an object (rather than a constant) ensures that caches restored by pickle or deepcopy are never valid.
+    ref_cache_epoch: object = object()
+
+    __slots__ = ("_ref_cache", "_name", "_parent")
+
     def __init__(self, name: str) -> None:
-        self.name: str = name  # .SHORT-NAME
-        self.parent: Union["CollectableElement", "PackageCollection", None] = None
+        self._ref_cache: tuple[object, str] | None = None  # (parent token, reference string)
+        self._name: str = name  # .SHORT-NAME
+        self._parent: Union["CollectableElement", "PackageCollection", None] = None
+
+    @property
+    def name(self) -> str:
+        """
+        Short-name of the element
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._invalidate_ref_cache()
+        self._name = value
+        parent = self._parent
+        if isinstance(parent, Referrable):
+            parent._child_renamed()  # pylint: disable=protected-access
+
+    @property
+    def parent(self) -> Union["CollectableElement", "PackageCollection", None]:
+        """
+        Parent object
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Union["CollectableElement", "PackageCollection", None]) -> None:
+        self._invalidate_ref_cache()
+        self._parent = value
+
+    def _child_renamed(self) -> None:
+        """
+        Called after a child element has been renamed.
+        Classes that keep name indexes of their child elements override this.
+        """
+
+    def _invalidate_ref_cache(self) -> None:
+        """
+        Invalidates reference strings cached in this object and in all objects below it.
+        Each cached string is tagged with the cache of its parent (used as token).
+        Clearing this cache thus invalidates the caches below it, but no others.
+        """
+        self._ref_cache = None
 
     @property
     def short_name(self) -> str:
@@ -210,6 +263,8 @@ class MultiLanguageReferrable(Referrable):
     Group AR:MULTILANGUAGE-REFERRABLE
     """
 
+    __slots__ = ("long_name",)
+
     def __init__(self,
                  name: str,
                  long_name: Union["MultilanguageLongName", None] = None) -> None:
@@ -228,6 +283,8 @@ class Identifiable(MultiLanguageReferrable):
     Group AR:IDENTIFIABLE
     """
 
+    __slots__ = ("desc", "category", "admin_data", "introduction", "annotations", "uuid")
+
     def __init__(self,
                  name: str,
                  desc: Union["MultiLanguageOverviewParagraph", tuple[ar_enum.Language, str], str, None] = None,
@@ -269,16 +326,57 @@ class Identifiable(MultiLanguageReferrable):
         """
         Calculates reference string based on parent tree
         If a missing parent is detected during tree-traversal
-        the function as a whole will returns None
-        """
-        if self.parent is None:
+        the function as a whole will returns None.
+        The result is cached until this object or any of its parents
+        are renamed or moved.
+        """
+        # Fast path: follow the tokens up to a top-level object
+        ref_cache = self._ref_cache
+        if ref_cache is not None:
+            obj = self
+            cache = ref_cache
+            while cache is not None:
+                token = cache[0]
+                if token is Referrable.ref_cache_epoch:
+                    return ref_cache[1]
+                obj = obj._parent
+                cache = obj._ref_cache
+                if cache is not token:
+                    break
+        parent = self._parent
+        if parent is None:
             return None
+        if isinstance(parent, (Identifiable, PackageCollection)):
+            ref_cache = self._get_ref_cache()
+            return None if ref_cache is None else ref_cache[1]
         ref_parts: list[str] = [self.name]
-        self.parent.update_ref_parts(ref_parts)
+        parent.update_ref_parts(ref_parts)
         if ref_parts[-1] is None:
             return None
         return '/'.join(reversed(ref_parts))
 
+    def _get_ref_cache(self) -> tuple[object, str] | None:
+        """
+        Returns valid reference string cache, updating it if needed.
+        The cache is valid if its token is the current cache of the parent.
+        """
+        parent = self._parent
+        if isinstance(parent, Identifiable):
+            token = parent._get_ref_cache()  # pylint: disable=protected-access
+            if token is None:
+                return None
+            parent_ref_str = token[1]
+        elif isinstance(parent, PackageCollection):
+            token = Referrable.ref_cache_epoch
+            parent_ref_str = ''
+        else:
+            return None
+        ref_cache = self._ref_cache
+        if ref_cache is None or ref_cache[0] is not token:
+            ref_cache = (token, parent_ref_str + '/' + self._name)
+            self._ref_cache = ref_cache
+        return ref_cache
+
 
 class CollectableElement(Identifiable):
     """
@@ -330,6 +428,107 @@ def make_unique_name_in_list(elements: list[Referrable], base_name: str):
         return base_name
 
 
+class _NameRegistry:
+    """
+    Name index for a list of elements.
+    Used for finding elements by name and to create unique names in constant time,
+    giving the same result as make_unique_name_in_list.
+    The index is rebuilt if the list has been changed or replaced without going through the registry
+    and on first use after invalidate has been called. The owner of the list calls invalidate
+    when one of its child elements has been renamed.
+    If several elements have the same name, the first one is found.
+    """
+
+    __slots__ = ("_elements", "_count", "_is_stale", "_by_name", "_highest_index", "_has_duplicates")
+
+    suffix_re = re.compile(r'_(\d+)')
+
+    def __init__(self, elements: list[Referrable]) -> None:
+        self._elements = elements
+        self._count = 0
+        self._is_stale = False  # True if an element may have been renamed
+        self._by_name: dict[str, Referrable] = {}
+        self._highest_index: dict[str, int] = {}  # base name -> highest index found after base name
+        self._has_duplicates = False
+        self._rebuild()
+
+    def is_valid(self, elements: list[Referrable]) -> bool:
+        """
+        Returns False if the list has been replaced or elements have been added or removed
+        without using the registry
+        """
+        return elements is self._elements and self._count == len(elements)
+
+    def invalidate(self) -> None:
+        """
+        Rebuilds index on next use
+        """
+        self._is_stale = True
+
+    def get(self, name: str) -> Referrable | None:
+        """
+        Returns element with given name or None
+        """
+        if self._is_stale:
+            self._rebuild()
+        return self._by_name.get(name, None)
+
+    def rename(self, element: Referrable, name: str) -> None:
+        """
+        Renames element without causing the index to be rebuilt
+        """
+        is_stale = self._is_stale
+        element.name = name
+        self._is_stale = is_stale
+
+    def add(self, element: Referrable) -> None:
+        """
+        Registers an element that has just been appended to the list
+        """
+        self._register(element)
+        self._count += 1
+
+    def make_unique(self, base_name: str) -> str:
+        """
+        Returns a name that isn't used by any element in the list.
+        If an element named base_name already exists, it's renamed to base_name + "_0"
+        and the returned name gets the next free index.
+        """
+        if self._has_duplicates:
+            # Rare case where the list has been modified directly. The list search renames the last match.
+            name = make_unique_name_in_list(self._elements, base_name)
+            self._rebuild()
+            return name
+        unpatched_elem = self.get(base_name)
+        highest_index = self._highest_index.get(base_name, None)
+        if unpatched_elem is not None:
+            del self._by_name[base_name]
+            self.rename(unpatched_elem, base_name + '_0')
+            self._register(unpatched_elem)
+        if highest_index is not None or unpatched_elem is not None:
+            return base_name + '_' + str((highest_index or 0) + 1)
+        return base_name
+
+    def _rebuild(self) -> None:
+        self._by_name.clear()
+        self._highest_index.clear()
+        self._has_duplicates = False
+        for element in self._elements:
+            self._register(element)
+        self._count = len(self._elements)
+        self._is_stale = False
+
+    def _register(self, element: Referrable) -> None:
+        name = element.name
+        if self._by_name.setdefault(name, element) is not element:
+            self._has_duplicates = True
+        for match in self.suffix_re.finditer(name):
+            base_name = name[:match.start()]
+            index = int(match.group(1))
+            if index > self._highest_index.get(base_name, -1):
+                self._highest_index[base_name] = index
+
+
 # Common structure elements
 
 
@@ -1189,6 +1388,42 @@ class Computation(ARObject):
             self.default_value = default_value
         elif isinstance(default_value, (int, float, str)):
             self.default_value = CompuConst(default_value)
+        self._scale_index: _CompuScaleIndex | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Overrides is_empty from base class"""
+        return self.is_empty_with_ignore({"_scale_index"})
+
+    def append_compu_scale(self, compu_scale: CompuScale) -> None:
+        """
+        Appends compu scale to internal list of scales
+        """
+        if not isinstance(compu_scale, CompuScale):
+            raise TypeError(f"Invalid type for 'compu_scale': {str(type(compu_scale))}")
+        if self.compu_scales is None:
+            self.compu_scales = []
+        self.compu_scales.append(compu_scale)
+        self._scale_index = None
+
+    def find_scale(self, value: int | float) -> CompuScale | None:
+        """
+        Returns the scale whose limits contain value or None.
+        If scales overlap, the first matching scale is returned.
+        """
+        return self._get_scale_index().find_by_limits(value)
+
+    def find_scale_by_const(self, value: int | float | str) -> CompuScale | None:
+        """
+        Returns the first scale with constant content equal to value (such as a text in a TEXTTABLE) or None.
+        The limits of the returned scale give the range of values mapping to the constant.
+        """
+        return self._get_scale_index().find_by_const(value)
+
+    def _get_scale_index(self) -> "_CompuScaleIndex":
+        if self._scale_index is None or not self._scale_index.is_valid(self.compu_scales):
+            self._scale_index = _CompuScaleIndex(self.compu_scales)
+        return self._scale_index
 
     @classmethod
     def make_value_table(cls: "Computation",
@@ -1256,6 +1491,47 @@ class Computation(ARObject):
         return cls(compu_scales, default_value)
 
 
+class _CompuScaleIndex:
+    """
+    Index over the scales of a Computation.
+    Limits are searched using IntervalIndex while constants are kept in a dictionary.
+    Changes made to the list of scales without using Computation.append_compu_scale are
+    detected by comparing list object and length. Changing limits of existing scales requires
+    the index to be rebuilt manually.
+    """
+
+    __slots__ = ("_compu_scales", "_count", "_limits", "_constants")
+
+    def __init__(self, compu_scales: list[CompuScale] | None) -> None:
+        self._compu_scales = compu_scales
+        self._count = 0 if compu_scales is None else len(compu_scales)
+        self._limits = IntervalIndex([(make_interval(x.lower_limit, x.upper_limit,
+                                                     x.lower_limit_type, x.upper_limit_type), x)
+                                      for x in compu_scales or []])
+        self._constants: dict[int | float | str, CompuScale] = {}
+        for compu_scale in compu_scales or []:
+            if isinstance(compu_scale.content, CompuConst):
+                self._constants.setdefault(compu_scale.content.value, compu_scale)
+
+    def is_valid(self, compu_scales: list[CompuScale] | None) -> bool:
+        """
+        False if the list has been replaced or changed in length since the index was built
+        """
+        return compu_scales is self._compu_scales and (compu_scales is None or len(compu_scales) == self._count)
+
+    def find_by_limits(self, value: int | float) -> CompuScale | None:
+        """
+        Returns scale whose limits contain value
+        """
+        return self._limits.find(value)
+
+    def find_by_const(self, value: int | float | str) -> CompuScale | None:
+        """
+        Returns first scale with constant equal to value
+        """
+        return self._constants.get(value, None)
+
+
 class CompuMethod(ARElement):
     """
     Complex Type: AR:COMPU-METHOD
@@ -1282,6 +1558,24 @@ class CompuMethod(ARElement):
         ref_str = self._calc_ref_string()
         return None if ref_str is None else CompuMethodRef(ref_str)
 
+    def find_scale(self, internal_value: int | float) -> CompuScale | None:
+        """
+        Returns the internal-to-physical scale that applies to internal_value or None.
+        For TEXTTABLE methods, the text is found in the content of the returned scale.
+        """
+        if self.int_to_phys is None:
+            return None
+        return self.int_to_phys.find_scale(internal_value)
+
+    def find_scale_by_text(self, text: str) -> CompuScale | None:
+        """
+        Returns the first internal-to-physical scale whose constant content is text or None.
+        The range of internal values mapping to text is given by the limits of the returned scale.
+        """
+        if self.int_to_phys is None:
+            return None
+        return self.int_to_phys.find_scale_by_const(text)
+
 
 # Constraint elements
 
@@ -2423,17 +2717,26 @@ class SwValues(ARObject):
     """
     Complex type AR:SW-VALUES
     Tag variants: 'SW-VALUES-PHYS'
+
+    Large sets of plain numbers can be stored in an array.array instead of a list.
+    The array is used as-is, without copying or checking each value.
     """
 
     def __init__(self,
-                 values: list[SwValueElement] | None = None) -> None:
-        self.values = []
+                 values: list[SwValueElement] | array | None = None) -> None:
+        self.values: list[SwValueElement] | array = []
         if values is not None:
             if isinstance(values, (int, float, str, NumericalValue, ValueGroup)):
                 self.append(values)
             elif isinstance(values, list):
                 for value in values:
                     self.append(value)
+            elif isinstance(values, array):
+                if values.typecode == 'u':
+                    raise TypeError("Arrays of unicode characters are not supported")
+                self.values = values
+            else:
+                raise TypeError(f"Invalid type for values: {str(type(values))}")
 
     def append(self, value: SwValueElement) -> None:
         """
@@ -2443,11 +2746,42 @@ class SwValues(ARObject):
         - VTF
         - VF
         """
-        if isinstance(value, (int, float, str, NumericalValue, ValueGroup)):
+        if isinstance(self.values, array):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.values.append(value)
+            else:
+                raise TypeError(f"Invalid value type for array-based values: {str(type(value))}")
+        elif isinstance(value, (int, float, str, NumericalValue, ValueGroup)):
             self.values.append(value)
         else:
             raise TypeError(f"Invalid value type: {str(type(value))}")
 
+    def is_array(self) -> bool:
+        """
+        True if values are stored in an array.array
+        """
+        return isinstance(self.values, array)
+
+
+def calc_sw_values_shape(sw_array_size: ValueList | None, sw_values_phys: SwValues | None) -> tuple[int, ...] | None:
+    """
+    Returns array dimensions of calibration values.
+    The dimensions are taken from sw_array_size (SW-ARRAYSIZE) when available.
+    Otherwise the shape is the number of top-level values in sw_values_phys.
+    Returns None if neither is set.
+    Raises ValueError if sw_values_phys stores its values in an array.array with a different number
+    of values than the shape implies.
+    """
+    if sw_array_size is not None and len(sw_array_size.values) > 0:
+        shape = tuple(int(x.value if isinstance(x, NumericalValue) else x) for x in sw_array_size.values)
+        if sw_values_phys is not None and sw_values_phys.is_array():
+            if math.prod(shape) != len(sw_values_phys.values):
+                raise ValueError(f"Array of {len(sw_values_phys.values)} values doesn't match shape {shape}")
+        return shape
+    if sw_values_phys is not None:
+        return (len(sw_values_phys.values),)
+    return None
+
 
 class ValueGroup(SwValues):
     """
@@ -2500,6 +2834,13 @@ class SwAxisCont(ARObject):
         self._assign_optional_strict('sw_array_size', sw_array_size, ValueList)
         self._assign_optional_strict('sw_values_phys', sw_values_phys, SwValues)
 
+    @property
+    def shape(self) -> tuple[int, ...] | None:
+        """
+        Dimensions of values, see calc_sw_values_shape
+        """
+        return calc_sw_values_shape(self.sw_array_size, self.sw_values_phys)
+
 
 class SwValueCont(ARObject):
     """
@@ -2521,6 +2862,13 @@ class SwValueCont(ARObject):
         self._assign_optional_strict('sw_array_size', sw_array_size, ValueList)
         self._assign_optional_strict('sw_values_phys', sw_values_phys, SwValues)
 
+    @property
+    def shape(self) -> tuple[int, ...] | None:
+        """
+        Dimensions of values, see calc_sw_values_shape
+        """
+        return calc_sw_values_shape(self.sw_array_size, self.sw_values_phys)
+
 
 # --- Constant and value specifications
 
@@ -2531,6 +2879,8 @@ class ValueSpecification(ARObject):
     Base class for value specifications
     """
 
+    __slots__ = ("label",)
+
     def __init__(self, label: str | None = None) -> None:
         self.label = label  # .SHORT-LABEL
         # .VARIATION-POINT not supported
@@ -2655,6 +3005,8 @@ class NumericalValueSpecification(ValueSpecification):
     Tag variants: 'NUMERICAL-VALUE-SPECIFICATION'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, label: str | None = None, value: int | float | None = None) -> None:
         super().__init__(label)
         self.value = value
@@ -2831,17 +3183,48 @@ class ConstantReference(ValueSpecification):
 # --- Package (Partly implemented)
 
 
+class LazyElement:
+    """
+    Placeholder for a package element that is converted on first access.
+    The loader is called once, without arguments, and returns the element
+    or None if it couldn't be created. In that case, or if the loader raises an exception,
+    the placeholder is removed from its package.
+    """
+
+    __slots__ = ("name", "loader", "position")
+
+    def __init__(self, name: str, loader: Callable[[], ARElement], position: int) -> None:
+        self.name = name
+        self.loader = loader
+        self.position = position  # Position in package element list
+
+
 class Package(CollectableElement):
     """
     AR:AR-PACKAGE
+
+    Elements can be added as placeholders using append_lazy. A placeholder is replaced by
+    its element the first time the element is accessed through find, filter or the elements list.
+    Placeholders whose element couldn't be created are removed.
     """
 
     def __init__(self, name: str, **kwargs: dict) -> None:
         super().__init__(name, **kwargs)
-        self.elements: list[ARElement] = []
+        self._elements: list[ARElement | LazyElement] = []
+        self._lazy_count = 0  # Number of placeholders in _elements
         self.packages: list[Package] = []
         self._collection_map = {}
 
+    @property
+    def elements(self) -> list[ARElement]:
+        """
+        Elements of this package. Converts remaining placeholders first.
+        """
+        if self._lazy_count > 0:
+            for placeholder in [x for x in self._elements if isinstance(x, LazyElement)]:
+                self._materialize(placeholder)
+        return self._elements
+
     def append(self, item: CollectableElement):
         """
         Append element or sub-package
@@ -2854,17 +3237,69 @@ class Package(CollectableElement):
             package.parent = self
             self.packages.append(package)
             self._collection_map[package.name] = package
+            _update_collection_indexes(package)
         elif isinstance(item, ARElement):
             elem: ARElement = item
             if elem.name in self._collection_map:
                 raise ar_except.DuplicateElement(
                     f"Element with SHORT-NAME '{elem.name}' already exists in package '{self.name}'")
             elem.parent = self
-            self.elements.append(elem)
+            self._elements.append(elem)
             self._collection_map[elem.name] = elem
+            _update_collection_indexes(elem)
         else:
             raise TypeError(f"Invalid type {str(type(item))}")
 
+    def append_lazy(self, name: str, loader: Callable[[], ARElement]) -> None:
+        """
+        Appends placeholder for an element that is created by loader on first access
+        """
+        if name in self._collection_map:
+            raise ar_except.DuplicateElement(
+                f"Element with SHORT-NAME '{name}' already exists in package '{self.name}'")
+        placeholder = LazyElement(name, loader, len(self._elements))
+        self._elements.append(placeholder)
+        self._collection_map[name] = placeholder
+        self._lazy_count += 1
+
+    @property
+    def lazy_count(self) -> int:
+        """
+        Number of elements not yet converted
+        """
+        return self._lazy_count
+
+    def _materialize(self, placeholder: LazyElement) -> ARElement | None:
+        """
+        Replaces placeholder with the element created by its loader.
+        If the loader returns None, the placeholder is removed and None is returned.
+        If the loader raises an exception, the placeholder is removed before the exception propagates.
+        """
+        try:
+            elem = placeholder.loader()
+        except BaseException:
+            self._remove_placeholder(placeholder)
+            raise
+        if elem is None:
+            self._remove_placeholder(placeholder)
+            return None
+        if not isinstance(elem, ARElement):
+            raise TypeError(f"Loader of '{placeholder.name}' returned invalid type {str(type(elem))}")
+        elem.parent = self
+        self._elements[placeholder.position] = elem
+        self._collection_map[placeholder.name] = elem
+        self._lazy_count -= 1
+        _update_collection_indexes(elem)
+        return elem
+
+    def _remove_placeholder(self, placeholder: LazyElement) -> None:
+        del self._elements[placeholder.position]
+        del self._collection_map[placeholder.name]
+        self._lazy_count -= 1
+        for item in self._elements[placeholder.position:]:
+            if isinstance(item, LazyElement):
+                item.position -= 1
+
     def make_packages(self, ref: str) -> "Package":
         """
         Recursively creates sub-packages
@@ -2892,6 +3327,7 @@ class Package(CollectableElement):
         self._collection_map[name] = package
         self.packages.append(package)
         package.parent = self
+        _update_collection_indexes(package)
         return package
 
     def find(self, ref: str) -> Any:
@@ -2903,7 +3339,9 @@ class Package(CollectableElement):
         parts = ref.partition('/')
         item = self._collection_map.get(parts[0], None)
         if item is not None:
-            if len(parts[2]) > 0:
+            if isinstance(item, LazyElement):
+                item = self._materialize(item)
+            if item is not None and len(parts[2]) > 0:
                 return item.find(parts[2])
         return item
 
@@ -2912,9 +3350,12 @@ class Package(CollectableElement):
         Yields all elements whose short-name matches any of the names in
         argument list
         """
-        for elem in self.elements:
+        for elem in list(self._elements) if self._lazy_count > 0 else self._elements:
             if elem.name in names:
-                yield elem
+                if isinstance(elem, LazyElement):
+                    elem = self._materialize(elem)
+                if elem is not None:
+                    yield elem
 
     def filter_regex(self, pattern: str | re.Pattern) -> Iterator[ARElement]:
         """
@@ -2927,9 +3368,12 @@ class Package(CollectableElement):
             regex = pattern
         else:
             raise TypeError(f"pattern: Invalid type '{str(type(pattern))}'")
-        for elem in self.elements:
+        for elem in list(self._elements) if self._lazy_count > 0 else self._elements:
             if regex.match(elem.name):
-                yield elem
+                if isinstance(elem, LazyElement):
+                    elem = self._materialize(elem)
+                if elem is not None:
+                    yield elem
 
     def ref(self) -> PackageRef:
         """
@@ -3007,6 +3451,49 @@ class BehaviorSettings:
         return value
 
 
+def _update_collection_indexes(item: Identifiable) -> None:
+    """
+    Adds newly attached item (and its children) to the indexes
+    of its root collection, if that collection has any
+    """
+    root = item.parent
+    while root is not None and not isinstance(root, PackageCollection):
+        root = root.parent
+    if root is not None:
+        if root._ref_index is not None:  # pylint: disable=protected-access
+            root._index_item(item)  # pylint: disable=protected-access
+        if root._referrers_index is not None:  # pylint: disable=protected-access
+            root._index_references(item)  # pylint: disable=protected-access
+
+
+def _iter_references(item: Identifiable) -> Iterator[tuple[Identifiable, BaseRef]]:
+    """
+    Yields (owner, reference) for every reference object found in item and its children.
+    The owner is the nearest enclosing Identifiable.
+    """
+    visited = set()
+    stack = [(item, item)]
+    while stack:
+        obj, owner = stack.pop()
+        if isinstance(obj, BaseRef):
+            yield owner, obj
+            continue
+        if isinstance(obj, Identifiable):
+            if id(obj) in visited:
+                continue
+            visited.add(id(obj))
+            owner = obj
+        children = []
+        for name, value in obj._iter_attributes():  # pylint: disable=protected-access
+            if name in ("_parent", "_ref_cache", "_collection_map"):
+                continue
+            if isinstance(value, ARObject):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(x for x in value if isinstance(x, ARObject))
+        stack.extend((child, owner) for child in reversed(children))
+
+
 class PackageCollection:
     """
     Base class that maintains a collection of AUTOSAR packages
@@ -3018,6 +3505,9 @@ class PackageCollection:
         self.behavior_settings = behavior_settings
         self.packages: list[Package] = []  # .PACKAGES
         self._package_dict = {}  # internal package map
+        self._ref_index: dict[str, Identifiable] | None = None  # reference string -> element
+        # reference string -> dest -> {id(owner): owner}
+        self._referrers_index: dict[str, dict[Any, dict[int, Identifiable]]] | None = None
         if packages is not None:
             for package in packages:
                 self.append(package)
@@ -3034,6 +3524,111 @@ class PackageCollection:
             package.parent = self
             self.packages.append(package)
             self._package_dict[package.name] = package
+            if self._ref_index is not None:
+                self._index_item(package)
+            if self._referrers_index is not None:
+                self._index_references(package)
+
+    def enable_reference_index(self) -> None:
+        """
+        Builds a hash index from absolute reference string to element.
+        Once enabled, the index is kept up to date by the append-methods of
+        packages, components and compositions and find() resolves
+        most references with a single dictionary lookup.
+        """
+        self._ref_index = {}
+        for package in self.packages:
+            self._index_item(package)
+
+    def disable_reference_index(self) -> None:
+        """
+        Drops the reference index
+        """
+        self._ref_index = None
+
+    def _index_item(self, item: Identifiable) -> None:
+        """
+        Adds item and all its indexable children to the reference index
+        """
+        ref_str = item._calc_ref_string()  # pylint: disable=protected-access
+        if ref_str is None:
+            return
+        self._ref_index[ref_str] = item
+        if isinstance(item, Package):
+            for child in item.packages:
+                self._index_item(child)
+            for child in item._elements:  # pylint: disable=protected-access
+                if not isinstance(child, LazyElement):  # Placeholders are indexed when converted
+                    self._index_item(child)
+        elif isinstance(item, SwComponentType):
+            for child in item.ports:
+                self._index_item(child)
+            if isinstance(item, CompositionSwComponentType):
+                for child in item.components:
+                    self._index_item(child)
+                for child in item.connectors:
+                    self._index_item(child)
+
+    def enable_referrers_index(self) -> None:
+        """
+        (Re-)builds the index of references held by elements in this collection.
+        Once enabled, it's kept up to date by the same append-methods that maintain
+        the reference index. References that are assigned to elements after
+        they have been appended are picked up the next time this method is called.
+        """
+        self._referrers_index = {}
+        for package in self.packages:
+            self._index_references(package)
+
+    def disable_referrers_index(self) -> None:
+        """
+        Drops the referrers index
+        """
+        self._referrers_index = None
+
+    def referrers(self, ref: str | BaseRef, dest: ar_enum.IdentifiableSubTypes | None = None) -> list[Identifiable]:
+        """
+        Returns all elements holding a reference to ref.
+        Use dest to only return elements where the reference has a specific
+        destination type.
+        The index is built on first call.
+        """
+        if self._referrers_index is None:
+            self.enable_referrers_index()
+        if isinstance(ref, BaseRef):
+            ref = ref.value
+        dest_map = self._referrers_index.get(ref, None)
+        if dest_map is None:
+            return []
+        if dest is not None:
+            owners = dest_map.get(dest, None)
+            return [] if owners is None else list(owners.values())
+        if len(dest_map) == 1:
+            return list(next(iter(dest_map.values())).values())
+        result = {}
+        for owners in dest_map.values():
+            result.update(owners)
+        return list(result.values())
+
+    def _index_references(self, item: Identifiable) -> None:
+        """
+        Adds all references held by item and its children to the referrers index
+        """
+        for owner, ref in _iter_references(item):
+            dest_map = self._referrers_index.setdefault(ref.value, {})
+            dest_map.setdefault(ref.dest, {})[id(owner)] = owner
+
+    def _lookup_reference_index(self, ref: str) -> Any:
+        """
+        Returns indexed item only if it still lives at ref inside this collection
+        """
+        item = self._ref_index.get(ref, None)
+        if item is None or item._calc_ref_string() != ref:  # pylint: disable=protected-access
+            return None
+        root = item.parent
+        while root is not None and not isinstance(root, PackageCollection):
+            root = root.parent
+        return item if root is self else None
 
     def find(self, ref: str | BaseRef) -> Any:
         """
@@ -3044,6 +3639,21 @@ class PackageCollection:
         if not isinstance(ref, str):
             raise TypeError("ref: Must be either a string or a valid reference class."
                             f"Got '{str(type(ref))}'")
+        if self._ref_index is not None:
+            abs_ref = ref if ref.startswith('/') else '/' + ref
+            item = self._lookup_reference_index(abs_ref)
+            if item is None:
+                item = self._find_by_parts(ref)
+                if isinstance(item, Identifiable) and \
+                        item._calc_ref_string() == abs_ref:  # pylint: disable=protected-access
+                    self._ref_index[abs_ref] = item
+            return item
+        return self._find_by_parts(ref)
+
+    def _find_by_parts(self, ref: str) -> Any:
+        """
+        Finds item by recursively resolving each part of the reference
+        """
         if ref.startswith('/'):
             ref = ref[1:]
         parts = ref.partition('/')
@@ -4862,6 +5472,7 @@ class SwComponentType(ARElement, Searchable):
         # .SW-COMPONENT-DOCUMENTATIONS not supported
         # .CONSISTENCY-NEEDSS not supported
         self.ports: list[PortPrototypeElement] = []  # .PORTS
+        self._port_names: _NameRegistry | None = None
         # .PORT_GROUPS not yet supported
         # .SWC-MAPPING-CONSTRAINT-REFS not yet supported
         # .UNIT-GROUP-REFS not yet supported
@@ -4881,8 +5492,11 @@ class SwComponentType(ARElement, Searchable):
         Adds port to internal list of ports
         """
         if isinstance(port, PortPrototype):
+            port_names = self._get_port_names()
             port.parent = self
             self.ports.append(port)
+            port_names.add(port)
+            _update_collection_indexes(port)
         else:
             msg = "port type must be one of: ProvidePortPrototype, RequirePortPrototype, PRPortPrototype."
             raise TypeError(msg + f" Got {str(type(port))}")
@@ -4914,15 +5528,21 @@ class SwComponentType(ARElement, Searchable):
             if isinstance(port, PRPortPrototype):
                 yield port
 
+    def _child_renamed(self) -> None:
+        if self._port_names is not None:
+            self._port_names.invalidate()
+
+    def _get_port_names(self) -> _NameRegistry:
+        if self._port_names is None or not self._port_names.is_valid(self.ports):
+            self._port_names = _NameRegistry(self.ports)
+        return self._port_names
+
     def find(self, ref: str) -> Identifiable | None:
         """
         Searches port names for a match in ref
         """
         parts = ref.partition('/')
-        for elem in self.ports:
-            if elem.name == parts[0]:
-                return elem
-        return None
+        return self._get_port_names().get(parts[0])
 
     def create_p_port(self,
                       name: str,
@@ -5049,18 +5669,18 @@ class SwComponentType(ARElement, Searchable):
         """
         Finds r-port by name
         """
-        for port in self.ports:
-            if isinstance(port, (RequirePortPrototype, PRPortPrototype)) and port.name == port_name:
-                return port
+        port = self._get_port_names().get(port_name)
+        if isinstance(port, (RequirePortPrototype, PRPortPrototype)):
+            return port
         return None
 
     def find_p_port(self, port_name: str) -> ProvidePortPrototype | PRPortPrototype | None:
         """
         Finds p-port by name
         """
-        for port in self.ports:
-            if isinstance(port, (ProvidePortPrototype, PRPortPrototype)) and port.name == port_name:
-                return port
+        port = self._get_port_names().get(port_name)
+        if isinstance(port, (ProvidePortPrototype, PRPortPrototype)):
+            return port
         return None
 
     def get_data_element_in_port(self,
@@ -5232,6 +5852,8 @@ class PortInCompositionTypeInstanceRef(ARObject):
                   'REQUESTER-IREF'| 'R-PORT-IN-COMPOSITION-INSTANCE-REF'
     """
 
+    __slots__ = ("component_ref", "port_ref")
+
     def __init__(self,
                  component_ref: SwComponentPrototypeRef | None = None,
                  port_ref: PortPrototypeRef | None = None,
@@ -5338,6 +5960,8 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         super().__init__(name, **kwargs)
         self.components: list[SwComponentPrototype] = []  # .COMPONENTS
         self.connectors: list[SwConnectorElement] = []  # .CONNECTORS
+        self._component_names: _NameRegistry | None = None
+        self._connector_names: _NameRegistry | None = None
         # .CONSTANT-VALUE-MAPPING-REFS not yet supported
         # .DATA-TYPE-MAPPING-REFS not yet supported
         # .INSTANTIATION-RTE-EVENT-PROPSS not yet supported
@@ -5373,8 +5997,11 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         Appends components prototype to internal list
         """
         if isinstance(component, SwComponentPrototype):
+            component_names = self._get_component_names()
             component.parent = self
             self.components.append(component)
+            component_names.add(component)
+            _update_collection_indexes(component)
         else:
             raise TypeError(f"component: Invalid type {(str(type(component)))}")
 
@@ -5383,22 +6010,41 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         Appends components prototype to internal list
         """
         if isinstance(connector, (AssemblySwConnector, DelegationSwConnector, PassThroughSwConnector)):
+            connector_names = self._get_connector_names()
             connector.parent = self
             self.connectors.append(connector)
+            connector_names.add(connector)
+            _update_collection_indexes(connector)
         else:
             raise TypeError(f"connector: Invalid type {(str(type(connector)))}")
 
+    def _child_renamed(self) -> None:
+        super()._child_renamed()
+        if self._component_names is not None:
+            self._component_names.invalidate()
+        if self._connector_names is not None:
+            self._connector_names.invalidate()
+
+    def _get_component_names(self) -> _NameRegistry:
+        if self._component_names is None or not self._component_names.is_valid(self.components):
+            self._component_names = _NameRegistry(self.components)
+        return self._component_names
+
+    def _get_connector_names(self) -> _NameRegistry:
+        if self._connector_names is None or not self._connector_names.is_valid(self.connectors):
+            self._connector_names = _NameRegistry(self.connectors)
+        return self._connector_names
+
     def find(self, ref: str) -> Identifiable | None:
         """
         Searches components and connectors for a match in ref
         """
         parts = ref.partition('/')
-        for elem in self.components:
-            if elem.name == parts[0]:
-                return elem
-        for elem in self.connectors:
-            if elem.name == parts[0]:
-                return elem
+        elem = self._get_component_names().get(parts[0])
+        if elem is None:
+            elem = self._get_connector_names().get(parts[0])
+        if elem is not None:
+            return elem
         return super().find(ref)
 
     def create_component_prototype(self,
@@ -5440,7 +6086,89 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         assert workspace is not None
         port1, component1 = self._analyze_port_ref(workspace, port_ref1)
         port2, component2 = self._analyze_port_ref(workspace, port_ref2)
+        return self._create_connector_between(port1, component1, port2, component2)
+
+    def create_connectors(self,
+                          port_ref_pairs: list[tuple[str, str]],
+                          workspace: Searchable) -> list[SwConnectorElement]:
+        """
+        #convenience-method
+
+        Same as calling create_connector for each pair of port references in port_ref_pairs.
+        The component type of each component prototype is only looked up once in the workspace.
+        Returns list of created connectors.
+        """
+        assert workspace is not None
+        component_types: dict[str, SwComponentType] = {}
+        connectors = []
+        for port_ref1, port_ref2 in port_ref_pairs:
+            port1, component1 = self._analyze_port_ref(workspace, port_ref1, component_types)
+            port2, component2 = self._analyze_port_ref(workspace, port_ref2, component_types)
+            connectors.append(self._create_connector_between(port1, component1, port2, component2))
+        return connectors
 
+    def auto_connect(self, workspace: Searchable) -> list[SwConnectorElement]:
+        """
+        #convenience-method
+
+        Automatically creates connectors between ports that have the same name and port interface.
+        * Assembly connectors are created from provide-ports to require-ports of inner components
+        * Delegation connectors are created between ports of the composition itself and inner component
+          ports of the same direction
+
+        Port pairs that already have a connector are skipped.
+        PR-ports are not connected automatically.
+        Returns list of created connectors.
+        """
+        assert workspace is not None
+        component_types: dict[str, SwComponentType] = {}
+        provide_ports: dict[tuple[str, str], list[tuple[SwComponentPrototype, PortPrototype]]] = {}
+        require_ports: list[tuple[tuple[str, str], SwComponentPrototype, PortPrototype]] = []
+        inner_ports: dict[tuple[str, str, bool], list[tuple[SwComponentPrototype, PortPrototype]]] = {}
+        for component in self.components:
+            component_type = self._get_component_type(workspace, component, component_types)
+            for port in component_type.ports:
+                if port.port_interface_ref is None or isinstance(port, PRPortPrototype):
+                    continue
+                key = (str(port.port_interface_ref), port.name)
+                is_provide_port = isinstance(port, ProvidePortPrototype)
+                if is_provide_port:
+                    provide_ports.setdefault(key, []).append((component, port))
+                else:
+                    require_ports.append((key, component, port))
+                inner_ports.setdefault(key + (is_provide_port,), []).append((component, port))
+        connectors = []
+        for key, requester_component, require_port in require_ports:
+            for provider_component, provide_port in provide_ports.get(key, []):
+                if provider_component is requester_component:
+                    continue
+                connector_name = '_'.join([provider_component.name, provide_port.name,
+                                           requester_component.name, require_port.name])
+                if self.find(connector_name) is None:
+                    connectors.append(self._create_assembly_connector(provider_component, provide_port,
+                                                                      requester_component, require_port))
+        for outer_port in self.ports:
+            if outer_port.port_interface_ref is None or isinstance(outer_port, PRPortPrototype):
+                continue
+            is_provide_port = isinstance(outer_port, ProvidePortPrototype)
+            key = (str(outer_port.port_interface_ref), outer_port.name, is_provide_port)
+            for inner_component, inner_port in inner_ports.get(key, []):
+                if is_provide_port:
+                    connector_name = '_'.join([inner_component.name, inner_port.name, outer_port.name])
+                else:
+                    connector_name = '_'.join([outer_port.name, inner_component.name, inner_port.name])
+                if self.find(connector_name) is None:
+                    connectors.append(self._create_delegation_connector(inner_component, inner_port, outer_port))
+        return connectors
+
+    def _create_connector_between(self,
+                                  port1: PortPrototype,
+                                  component1: SwComponentPrototype | None,
+                                  port2: PortPrototype,
+                                  component2: SwComponentPrototype | None) -> SwConnectorElement:
+        """
+        Creates connector of suitable type between two analyzed port references
+        """
         if component1 is None and component2 is None:
             return self._create_pass_through_connector(port1, port2)
         elif component1 is None:
@@ -5465,9 +6193,33 @@ class CompositionSwComponentType(SwComponentType, Searchable):
             return self._create_assembly_connector(provider_component, provide_port,
                                                    requester_component, require_port)
 
+    def _get_component_type(self,
+                            workspace: Searchable,
+                            component: SwComponentPrototype,
+                            component_types: dict[str, SwComponentType] | None = None) -> SwComponentType:
+        """
+        Looks up the component type of a component prototype.
+        Found types are stored in component_types using the prototype name as key.
+        """
+        if component_types is not None:
+            component_type = component_types.get(component.name, None)
+            if component_type is not None:
+                return component_type
+        component_type = workspace.find(str(component.type_ref))
+        if component_type is None:
+            raise ValueError(f"Invalid reference: {component.type_ref}")
+        if not isinstance(component_type, SwComponentType):
+            msg = f"Reference is not a valid SwComponentType: {component.type_ref}"
+            raise ValueError(msg)
+        if component_types is not None:
+            component_types[component.name] = component_type
+        return component_type
+
     def _analyze_port_ref(self,
                           workspace: Searchable,
-                          port_ref: str) -> tuple[PortPrototype, Union[SwComponentPrototype, None]]:
+                          port_ref: str,
+                          component_types: dict[str, SwComponentType] | None = None
+                          ) -> tuple[PortPrototype, Union[SwComponentPrototype, None]]:
         """
         Analyze port reference string and attempts to determine what component
         and port are referenced.
@@ -5478,19 +6230,14 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         if len(parts) > 1:
             if len(parts) == 2:  # Format is 'component_name/port_name'?
                 port_name = parts[1]
-                for elem in self.components:
-                    if elem.name == parts[0]:
-                        component = workspace.find(str(elem.type_ref))
-                        if component is None:
-                            raise ValueError(f"Invalid reference: {elem.type_ref}")
-                        if not isinstance(component, SwComponentType):
-                            msg = f"Reference is not a valid SwComponentType: {elem.type_ref}"
-                            raise ValueError(msg)
-                        port = component.find(port_name)
-                        if (port is None) or (not isinstance(port, PortPrototype)):
-                            msg = f"Component '{component.name}' does not seem to have a port with name '{port_name}'"
-                            raise ValueError(msg)
-                        return port, elem
+                elem = self._get_component_names().get(parts[0])
+                if elem is not None:
+                    component = self._get_component_type(workspace, elem, component_types)
+                    port = component.find(port_name)
+                    if (port is None) or (not isinstance(port, PortPrototype)):
+                        msg = f"Component '{component.name}' does not seem to have a port with name '{port_name}'"
+                        raise ValueError(msg)
+                    return port, elem
             else:
                 raise ValueError(f"Invalid format: '{port_ref}'")
         else:  # Format is 'port_name'
@@ -5535,7 +6282,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         connector = DelegationSwConnector(connector_name, inner_port_iref, outer_port.ref())
         if self.find(connector_name) is not None:
             raise ValueError(f"{self.name}: Connector with name '{connector_name}' already exists")
-        self.connectors.append(connector)
+        self.append_connector(connector)
         return connector
 
     def _create_pass_through_connector(self,
@@ -5545,7 +6292,7 @@ class CompositionSwComponentType(SwComponentType, Searchable):
         connector = PassThroughSwConnector(connector_name, provide_port.ref(), require_port.ref())
         if self.find(connector_name) is not None:
             raise ValueError(f"{self.name}: Connector with name '{connector_name}' already exists")
-        self.connectors.append(connector)
+        self.append_connector(connector)
         return connector
 
 
@@ -5821,6 +6568,8 @@ class AutosarVariableRef(ARObject):
                   'AUTOSAR-VARIABLE' | 'ACCESSED-VARIABLE'
     """
 
+    __slots__ = ("ar_variable_in_impl_datatype", "ar_variable_iref", "local_variable_ref")
+
     def __init__(self,
                  ar_variable_in_impl_datatype: ArVariableInImplementationDataInstanceRef | None = None,
                  ar_variable_iref: VariableInAtomicSWCTypeInstanceRef | None = None,
@@ -5850,6 +6599,8 @@ class VariableAccess(Identifiable):
     Tag variants: 'REPLACE-WITH' | 'VARIABLE-ACCESS'
     """
 
+    __slots__ = ("accessed_variable", "scope")
+
     def __init__(self,
                  name: str,
                  accessed_variable: AutosarVariableRef | None = None,
@@ -6486,6 +7237,8 @@ class RunnableEntity(ExecutableEntity):
         self.wait_point: list[WaitPoint] = []
         # .WRITTEN-LOCAL-VARIABLES (We use a different name in our variable)
         self.write_local_variable: list[VariableAccess] = []
+        # Name registries for access point lists, created on demand
+        self._name_registries: dict[str, _NameRegistry] | None = None
 
         # Simple arguments
         self._assign_optional("can_be_invoked_concurrently", can_be_invoked_concurrently, bool)
@@ -6931,6 +7684,29 @@ class RunnableEntity(ExecutableEntity):
             if access_point:
                 self.append_server_call_point(access_point)
 
+    def _child_renamed(self) -> None:
+        if self._name_registries is not None:
+            for registry in self._name_registries.values():
+                registry.invalidate()
+
+    def _append_with_unique_name(self, list_name: str, element: Identifiable) -> None:
+        """
+        Appends element to the named access point list.
+        If the name is already taken, existing and new elements get
+        name suffixes ("_0", "_1" etc.) to make them unique.
+        """
+        elements: list[Identifiable] = getattr(self, list_name)
+        if self._name_registries is None:
+            self._name_registries = {}
+        registry = self._name_registries.get(list_name, None)
+        if registry is None or not registry.is_valid(elements):
+            registry = _NameRegistry(elements)
+            self._name_registries[list_name] = registry
+        registry.rename(element, registry.make_unique(element.name))
+        elements.append(element)
+        registry.add(element)
+        element.parent = self
+
     def append_argument(self, argument: RunnableEntityArgument) -> None:
         """
         Adds additional argument to the RunnableEntity
@@ -6947,9 +7723,7 @@ class RunnableEntity(ExecutableEntity):
         A server call result point allows a runnable to fetch the result of an asynchronous server call.
         """
         if isinstance(result_point, AsynchronousServerCallResultPoint):
-            make_unique_name_in_list(self.async_server_call_result_point, result_point.name)
-            self.async_server_call_result_point.append(result_point)
-            result_point.parent = self
+            self._append_with_unique_name("async_server_call_result_point", result_point)
         else:
             raise TypeError("result_point: Expected type AsynchronousServerCallResultPoint, "
                             f"got '{str(type(result_point))}'")
@@ -6959,9 +7733,7 @@ class RunnableEntity(ExecutableEntity):
         Implicit read access to data element of a sender-receiver port or nv-data port.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_read_access, element.name)
-            self.data_read_access.append(element)
-            element.parent = self
+            self._append_with_unique_name("data_read_access", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6971,9 +7743,7 @@ class RunnableEntity(ExecutableEntity):
         The result is passed back to the application by means of an argument in the function signature.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_receive_point_by_argument, element.name)
-            self.data_receive_point_by_argument.append(element)
-            element.parent = self
+            self._append_with_unique_name("data_receive_point_by_argument", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6983,9 +7753,7 @@ class RunnableEntity(ExecutableEntity):
         The result is passed back to the application by means of the return value.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_receive_point_by_value, element.name)
-            self.data_receive_point_by_value.append(element)
-            element.parent = self
+            self._append_with_unique_name("data_receive_point_by_value", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -6994,9 +7762,7 @@ class RunnableEntity(ExecutableEntity):
         Explicit write access to data element of a sender-receiver port or nv-data.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_send_point, element.name)
-            self.data_send_point.append(element)
-            element.parent = self
+            self._append_with_unique_name("data_send_point", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7005,9 +7771,7 @@ class RunnableEntity(ExecutableEntity):
         Implicit write access to data element of a sender-receiver port or nv-data port.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.data_write_access, element.name)
-            self.data_write_access.append(element)
-            element.parent = self
+            self._append_with_unique_name("data_write_access", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7027,9 +7791,7 @@ class RunnableEntity(ExecutableEntity):
         Internal triggering point
         """
         if isinstance(element, InternalTriggeringPoint):
-            make_unique_name_in_list(self.internal_triggering_point, element.name)
-            self.internal_triggering_point.append(element)
-            element.parent = self
+            self._append_with_unique_name("internal_triggering_point", element)
         else:
             raise TypeError(f"element: Expected type InternalTriggeringPoint, got '{str(type(element))}'")
 
@@ -7049,9 +7811,7 @@ class RunnableEntity(ExecutableEntity):
         Mode switch point
         """
         if isinstance(element, ModeSwitchPoint):
-            make_unique_name_in_list(self.mode_switch_point, element.name)
-            self.mode_switch_point.append(element)
-            element.parent = self
+            self._append_with_unique_name("mode_switch_point", element)
         else:
             raise TypeError(f"element: Expected type ModeSwitchPoint, got '{str(type(element))}'")
 
@@ -7060,9 +7820,7 @@ class RunnableEntity(ExecutableEntity):
         Read access to parameter which may either be local or within a PortPrototype.
         """
         if isinstance(element, ParameterAccess):
-            make_unique_name_in_list(self.parameter_access, element.name)
-            self.parameter_access.append(element)
-            element.parent = self
+            self._append_with_unique_name("parameter_access", element)
         else:
             raise TypeError(f"element: Expected type ParameterAccess, got '{str(type(element))}'")
 
@@ -7071,9 +7829,7 @@ class RunnableEntity(ExecutableEntity):
         Read access to a local variable in the role of ImplicitInterRunnableVariable or ExplicitInterRunnableVariable.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.read_local_variable, element.name)
-            self.read_local_variable.append(element)
-            element.parent = self
+            self._append_with_unique_name("read_local_variable", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7082,9 +7838,7 @@ class RunnableEntity(ExecutableEntity):
         Write access to a local varaible in the role of ImplicitInterRunnableVariable or ExplicitInterRunnableVariable.
         """
         if isinstance(element, VariableAccess):
-            make_unique_name_in_list(self.write_local_variable, element.name)
-            self.write_local_variable.append(element)
-            element.parent = self
+            self._append_with_unique_name("write_local_variable", element)
         else:
             raise TypeError(f"element: Expected type VariableAccess, got '{str(type(element))}'")
 
@@ -7093,9 +7847,7 @@ class RunnableEntity(ExecutableEntity):
         Access to call a server operation of a client-server port.
         """
         if isinstance(element, ServerCallPoint):
-            make_unique_name_in_list(self.server_call_point, element.name)
-            self.server_call_point.append(element)
-            element.parent = self
+            self._append_with_unique_name("server_call_point", element)
         else:
             raise TypeError("element: Expected type AsynchronousServerCallPoint or SynchronousServerCallPoint, "
                             f"got '{str(type(element))}'")
@@ -7105,9 +7857,7 @@ class RunnableEntity(ExecutableEntity):
         WaitPoint associated with the RunnableEntity
         """
         if isinstance(element, WaitPoint):
-            make_unique_name_in_list(self.wait_point, element.name)
-            self.wait_point.append(element)
-            element.parent = self
+            self._append_with_unique_name("wait_point", element)
         else:
             raise TypeError(f"element: Expected type WaitPoint, got '{str(type(element))}'")
 
@@ -7890,6 +8640,7 @@ class SwcInternalBehavior(InternalBehavior):
         # .AR-TYPED-PER-INSTANCE-MEMORYS (not yet implemented)
         # .EVENTS
         self.events: list[RteEvent] = []
+        self._event_names: _NameRegistry | None = None
         # .EXCLUSIVE-AREA-POLICYS (not yet implemented)
         # .EXPLICIT-INTER-RUNNABLE-VARIABLES (not yet implemented)
         # .HANDLE-TERMINATION-AND-RESTART (not yet implemented)
@@ -7902,6 +8653,7 @@ class SwcInternalBehavior(InternalBehavior):
         self.port_api_options: OrderedDict[PortApiOption] = OrderedDict()
         # .RUNNABLES
         self.runnables: list[RunnableEntity] = []
+        self._runnable_names: _NameRegistry | None = None
         # .SERVICE-DEPENDENCYS (not yet implemented)
         # .SHARED-PARAMETERS (not yet implemented)
         # .SUPPORTS-MULTIPLE-INSTANTIATION (not yet implemented)
@@ -7960,8 +8712,13 @@ class SwcInternalBehavior(InternalBehavior):
         Adds runnable to internal list of runnables
         """
         if isinstance(runnable, RunnableEntity):
+            runnable_names = self._get_runnable_names()
+            if runnable_names.get(runnable.name) is not None:
+                raise ar_except.DuplicateElement(
+                    f"Runnable with SHORT-NAME '{runnable.name}' already exists in '{self.name}'")
             runnable.parent = self
             self.runnables.append(runnable)
+            runnable_names.add(runnable)
         else:
             raise TypeError(f"runnable must be of type RunnableEntity. Got {str(type(runnable))}")
 
@@ -7970,11 +8727,32 @@ class SwcInternalBehavior(InternalBehavior):
         Adds event to internal list of events
         """
         if isinstance(event, RteEvent):
+            event_names = self._get_event_names()
+            if event_names.get(event.name) is not None:
+                raise ar_except.DuplicateElement(
+                    f"Event with SHORT-NAME '{event.name}' already exists in '{self.name}'")
             event.parent = self
             self.events.append(event)
+            event_names.add(event)
         else:
             raise TypeError(f"event must derive from RteEvent. Got {str(type(event))}")
 
+    def _child_renamed(self) -> None:
+        if self._runnable_names is not None:
+            self._runnable_names.invalidate()
+        if self._event_names is not None:
+            self._event_names.invalidate()
+
+    def _get_runnable_names(self) -> _NameRegistry:
+        if self._runnable_names is None or not self._runnable_names.is_valid(self.runnables):
+            self._runnable_names = _NameRegistry(self.runnables)
+        return self._runnable_names
+
+    def _get_event_names(self) -> _NameRegistry:
+        if self._event_names is None or not self._event_names.is_valid(self.events):
+            self._event_names = _NameRegistry(self.events)
+        return self._event_names
+
     def append_port_api_option(self, element: PortApiOption) -> None:
         """
         Generation options for port-related calls in the RTE.
@@ -8052,19 +8830,15 @@ class SwcInternalBehavior(InternalBehavior):
         """
         Find runnable by name. Returns None if no runnable is found.
         """
-        for runnable in self.runnables:
-            if runnable.name == name:
-                return runnable
-        return None
+        return self._get_runnable_names().get(name)
 
     def _make_unique_event_name(self, event_name: str) -> str:
         """
         Checks if event_name is unique in internal event list.
         If not, then it automatically starts to add an integer-based name suffix ("_0", "_1" etc.).
         Calling this function could potentially invalidate existing event references.
-        Note: Not yet implemented
         """
-        return make_unique_name_in_list(self.events, event_name)
+        return self._get_event_names().make_unique(event_name)
 
     def create_background_event(self,
                                 runnable_name: str,
@@ -0,0 +1,98 @@
+"""
+Interval search used for COMPU-SCALE limits
+"""
+import math
+from bisect import bisect_right
+from typing import Any
+import autosar.xml.enumeration as ar_enum
+
+Interval = tuple[float, bool, float, bool]  # (lower, lower_is_open, upper, upper_is_open)
+UNBOUNDED_INTERVAL: Interval = (-math.inf, False, math.inf, False)
+
+
+def _limit_to_float(limit: int | float | str | None, default: float) -> float:
+    if limit is None:
+        return default
+    if isinstance(limit, str):
+        return float(limit)  # Accepts strings such as "INF" and "-INF"
+    return limit
+
+
+def make_interval(lower_limit: int | float | str | None,
+                  upper_limit: int | float | str | None,
+                  lower_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED,
+                  upper_limit_type: ar_enum.IntervalType = ar_enum.IntervalType.CLOSED) -> Interval:
+    """
+    Creates interval from limits. Missing limits are treated as infinite.
+    """
+    return (_limit_to_float(lower_limit, -math.inf),
+            lower_limit_type == ar_enum.IntervalType.OPEN,
+            _limit_to_float(upper_limit, math.inf),
+            upper_limit_type == ar_enum.IntervalType.OPEN)
+
+
+def is_inside(value: int | float, interval: Interval) -> bool:
+    """
+    True if value is inside interval
+    """
+    lower, lower_is_open, upper, upper_is_open = interval
+    if value < lower or (lower_is_open and value == lower):
+        return False
+    if value > upper or (upper_is_open and value == upper):
+        return False
+    return True
+
+
+def _is_empty_interval(interval: Interval) -> bool:
+    lower, lower_is_open, upper, upper_is_open = interval
+    return lower > upper or (lower == upper and (lower_is_open or upper_is_open))
+
+
+def _is_overlapping(first: Interval, second: Interval) -> bool:
+    """
+    True if the intervals share at least one value. first must not start after second.
+    """
+    _, _, upper, upper_is_open = first
+    lower, lower_is_open, _, _ = second
+    if lower < upper:
+        return True
+    return lower == upper and not (upper_is_open or lower_is_open)
+
+
+class IntervalIndex:
+    """
+    Finds the item whose interval contains a value.
+    Intervals are sorted by lower limit and searched using bisect.
+    If any intervals overlap, the items are searched linearly in their original order instead
+    so that the first matching item is selected.
+    """
+
+    def __init__(self, items: list[tuple[Interval, Any]]) -> None:
+        items = [x for x in items if not _is_empty_interval(x[0])]
+        self._items = items
+        self._sorted = sorted(items, key=lambda x: (x[0][0], x[0][1]))
+        self._lower_limits = [x[0][0] for x in self._sorted]
+        self.is_overlapping = any(_is_overlapping(self._sorted[i][0], self._sorted[i + 1][0])
+                                  for i in range(len(self._sorted) - 1))
+
+    def find(self, value: int | float) -> Any:
+        """
+        Returns item whose interval contains value or None
+        """
+        if self.is_overlapping or value != value:  # NaN is never inside any interval
+            for interval, item in self._items:
+                if is_inside(value, interval):
+                    return item
+            return None
+        pos = bisect_right(self._lower_limits, value) - 1
+        # Without overlaps, only the last interval starting at or below value can contain it.
+        # The exception is an interval with open lower limit equal to value, then the one before it is checked.
+        for i in (pos, pos - 1):
+            if i < 0:
+                break
+            interval, item = self._sorted[i]
+            if is_inside(value, interval):
+                return item
+            if interval[0] < value:
+                break
+        return None
@@ -1,20 +1,43 @@
 """
 ARXML reader module
 """
+import functools
+import mmap
 import os
 import re
 import sys
+import zipfile
+from array import array
 # pylint: disable=duplicate-code
-from typing import Iterable, Union, Any
+from typing import BinaryIO, Iterable, Iterator, Union, Any
 import lxml.etree as ElementTree
 import autosar.base as ar_base
 import autosar.xml.document as ar_document
+from autosar.xml.cache import DocumentCache
+import autosar.xml.compression as ar_compression
 import autosar.xml.exception as ar_exception
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
 
+AUTOSAR_NAMESPACE = 'http://autosar.org/schema/r4.0'
+READ_CHUNK_SIZE = 0x100000  # Number of bytes passed to XML parser at a time
+
+default_namespace_re = re.compile(rb'\s+xmlns\s*=\s*("|\')http://autosar\.org/schema/r4\.0\1')
+# Used in lazy mode to locate elements without building an element tree.
+# Groups of a tag: end-tag marker, name, attributes, empty-element marker. Comments and similar markup have no groups.
+xml_markup_re = re.compile(rb'<(?:!--.*?-->|!\[CDATA\[.*?\]\]>|\?.*?\?>|!DOCTYPE[^>]*>|'
+                           rb'(/?)([^\s/>]+)((?:[^>"\']|"[^"]*"|\'[^\']*\')*?)(/?)>)', re.S)
+# SHORT-NAME holding plain text (without entity references) as first child, matched after the parent start-tag
+first_short_name_re = re.compile(rb'(?:\s|<!--.*?-->|<\?.*?\?>)*<SHORT-NAME\s*>([^<&]*)</SHORT-NAME\s*>', re.S)
+plain_first_short_name_re = re.compile(rb'\s*<SHORT-NAME>([^<&]*)</SHORT-NAME>')  # Faster match for the usual case
+xml_encoding_re = re.compile(rb'<\?xml[^>]*encoding\s*=\s*("|\')([A-Za-z0-9._\-]+)\1')
+# Decimal number with fraction part and without exponent, such as "-1.25"
+decimal_fraction_re = re.compile(r'\s*[+-]?(\d+\.\d*|\.\d+)\s*')
+
 # Type aliases
 
+XmlBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
 MultiLanguageOverviewParagraph = ar_element.MultiLanguageOverviewParagraph
 ProvidePortComSpecElement = Union[ar_element.SenderComSpec,
                                   ar_element.ModeSwitchSenderComSpec,
@@ -48,43 +71,45 @@ RteEventElement = Union[ar_element.AsynchronousServerCallReturnsEvent,
 # Helper classes
 
 
-class WrappedElement:
-    """
-    Wrapped XML Element
-    """
-
-    def __init__(self, elem: ElementTree.Element) -> None:
-        self._elem = elem
-        self.is_accessed: bool = False
-
-    @property
-    def elem(self) -> ElementTree.Element:
-        """
-        Returns element with some book-keeping
-        """
-        self.is_accessed = True
-        return self._elem
-
-
 class ChildElementMap:
     """
-    Container for ARXML child elements
+    Container for ARXML child elements.
+
+    Child elements are indexed by tag name the first time they are looked up.
+    Only the first child element of each tag name is indexed.
+    Accessed child elements are tracked in a bitmask where each bit corresponds to
+    a position in the list of indexed child elements.
     """
 
+    __slots__ = ('_parent', '_index', '_children', '_accessed')
+
     def __init__(self, elem: ElementTree.Element) -> None:
-        self.elements: dict[str, WrappedElement] = {}
-        for child_elem in elem.findall('./*'):
-            tag = str(child_elem.tag)
-            if tag not in self.elements:
-                self.elements[tag] = WrappedElement(child_elem)
+        self._parent = elem
+        self._index: dict[str, int] | None = None
+        self._children: list[ElementTree.Element] | None = None
+        self._accessed: int = 0
+
+    def _build_index(self) -> None:
+        index: dict[str, int] = {}
+        children: list[ElementTree.Element] = []
+        for child_elem in self._parent.iterchildren(ElementTree.Element):
+            tag = child_elem.tag
+            if tag not in index:
+                index[tag] = len(children)
+                children.append(child_elem)
+        self._index = index
+        self._children = children
 
     def get(self, tag: str) -> ElementTree.Element:
         """
-        Returns unwrapped element if it exists
+        Returns child element if it exists
         """
-        wrapped = self.elements.get(tag, None)
-        if wrapped is not None:
-            return wrapped.elem
+        if self._index is None:
+            self._build_index()
+        pos = self._index.get(tag, None)
+        if pos is not None:
+            self._accessed |= 1 << pos
+            return self._children[pos]
         return None
 
     def skip(self, tag: str) -> None:
@@ -94,15 +119,167 @@ class ChildElementMap:
         but where we don't want to warn about them not being
         supported.
         """
-        wrapped = self.elements.get(tag, None)
-        if wrapped is not None:
-            wrapped.is_accessed = True
+        if self._index is None:
+            self._build_index()
+        pos = self._index.get(tag, None)
+        if pos is not None:
+            self._accessed |= 1 << pos
+
+    def unaccessed(self) -> Iterator[ElementTree.Element]:
+        """
+        Yields child elements that haven't been accessed using get or skip
+        """
+        if self._index is None:
+            self._build_index()
+        for pos, child_elem in enumerate(self._children):
+            if not self._accessed & (1 << pos):
+                yield child_elem
 
-    def values(self) -> Iterable[WrappedElement]:
+
+class _PackageFilter:
+    """
+    Decides which packages to read based on lists of package references.
+
+    A package is read if it's at or below an included reference and not at or below an excluded one.
+    Parents of included packages are created but their own elements are not read.
+    """
+
+    SKIP = 0
+    PARENT_ONLY = 1
+    READ = 2
+
+    def __init__(self, include: Iterable[str] | None, exclude: Iterable[str] | None) -> None:
+        self.include = None if include is None else sorted(str(x).rstrip("/") for x in include)
+        self.exclude = [] if exclude is None else sorted(str(x).rstrip("/") for x in exclude)
+
+    def match(self, package_ref: str) -> int:
         """
-        Returns values of inner dict
+        Returns one of SKIP, PARENT_ONLY or READ
         """
-        return self.elements.values()
+        for excluded in self.exclude:
+            if package_ref == excluded or package_ref.startswith(excluded + "/"):
+                return self.SKIP
+        if self.include is None:
+            return self.READ
+        for included in self.include:
+            if package_ref == included or package_ref.startswith(included + "/"):
+                return self.READ
+        for included in self.include:
+            if included.startswith(package_ref + "/"):
+                return self.PARENT_ONLY
+        return self.SKIP
+
+
+class _LazySource:
+    """
+    Memory-mapped ARXML file used in lazy mode.
+
+    Elements are located by scanning the file for markup. Only the elements that are
+    actually needed are parsed, each one separately from its own range of bytes.
+    The file is closed once all elements waiting to be parsed have been released.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.file_base_name = os.path.basename(file_path)
+        with open(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+            self.data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        match = xml_encoding_re.match(self.data, 0, min(len(self.data), 200))
+        self.encoding = match.group(2).decode("ascii") if match is not None else "utf-8"
+        self._line_pos = 0
+        self._line_number = 1
+        self._tag_patterns: dict[bytes, tuple[re.Pattern, re.Pattern]] = {}
+        self.pending = 0  # Number of elements waiting to be parsed
+
+    def release(self) -> None:
+        """
+        Marks one pending element as done. Closes the file after the last one.
+        """
+        self.pending -= 1
+        if self.pending == 0:
+            self.data.close()
+
+    def next_tag(self, pos: int) -> re.Match:
+        """
+        Returns next start-tag or end-tag at or after pos
+        """
+        while True:
+            match = xml_markup_re.search(self.data, pos)
+            if match is None:
+                raise ar_exception.ParseError(f"{self.file_base_name}: Unexpected end of file")
+            if match.group(2) is not None:
+                return match
+            pos = match.end()
+
+    def find_end(self, match: re.Match) -> int:
+        """
+        Returns position after the end-tag of the element whose start-tag is match.
+        Nested elements with the same tag name are skipped, as are comments, CDATA sections
+        and processing instructions.
+        """
+        if match.group(4):
+            return match.end()
+        tag = match.group(2)
+        data = self.data
+        pos = match.end()
+        patterns = self._tag_patterns.get(tag, None)
+        if patterns is None:
+            escaped_tag = re.escape(tag)
+            # Markup that requires the slow path: comments, CDATA sections, processing instructions and namesakes
+            special_pattern = re.compile(rb'<(?:[!?]|' + escaped_tag + rb'[\s/>])')
+            # Groups: end-tag marker, empty-element marker. Comments and similar markup have no groups.
+            other_markup = rb'<(?:!--.*?-->|!\[CDATA\[.*?\]\]>|\?.*?\?>|(/?)'
+            attributes = rb'(?:\s(?:[^>"\']|"[^"]*"|\'[^\']*\')*?)?(/?)>)'
+            patterns = (special_pattern, re.compile(other_markup + escaped_tag + attributes, re.S))
+            self._tag_patterns[tag] = patterns
+        special_pattern, tag_pattern = patterns
+        end_tag = b'</' + tag + b'>'
+        end = data.find(end_tag, pos)
+        if end >= 0 and special_pattern.search(data, pos, end) is None:
+            return end + len(end_tag)
+        depth = 1
+        while True:
+            nested = tag_pattern.search(data, pos)
+            if nested is None:
+                raise ar_exception.ParseError(
+                    f"{self.file_base_name}({self.line_at(match.start())}): Missing end-tag for <{tag.decode()}>")
+            pos = nested.end()
+            if nested.group(1):
+                depth -= 1
+                if depth == 0:
+                    return pos
+            elif nested.group(1) is not None and not nested.group(2):
+                depth += 1
+
+    def find_short_name(self, match: re.Match, end: int) -> str | None:
+        """
+        Returns short name of the element whose start-tag is match and that ends at end.
+        Returns None if the first child element isn't a SHORT-NAME holding plain text.
+        """
+        name_match = plain_first_short_name_re.match(self.data, match.end(), end)
+        if name_match is None:
+            name_match = first_short_name_re.match(self.data, match.end(), end)
+        if name_match is None:
+            return None  # Entity references and other markup are left to the XML parser
+        return name_match.group(1).strip().decode(self.encoding)
+
+    def line_at(self, pos: int) -> int:
+        """
+        Returns line number at pos. Fastest when called with increasing positions.
+        """
+        if pos < self._line_pos:
+            self._line_pos, self._line_number = 0, 1
+        self._line_number += self.data[self._line_pos:pos].count(b'\n')
+        self._line_pos = pos
+        return self._line_number
+
+    def parse(self, start: int, end: int, tail: bytes = b'') -> ElementTree.Element:
+        """
+        Parses bytes between start and end as a stand-alone XML element.
+        The tail is appended, which can be used to close an element that has been cut short.
+        """
+        parser = ElementTree.XMLParser(encoding=self.encoding)
+        return ElementTree.fromstring(self.data[start:end] + tail, parser)
 
 
 # Reader class
@@ -116,17 +293,33 @@ class Reader:
     def __init__(self,
                  warn_on_unprocessed_element: bool = True,
                  use_full_path_on_warning: bool = False,
-                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION) -> None:
+                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION,
+                 track_unprocessed_elements: bool = True,
+                 cache: DocumentCache | None = None,
+                 sw_values_as_arrays: bool = False,
+                 include_packages: Iterable[str] | None = None,
+                 exclude_packages: Iterable[str] | None = None,
+                 element_types: Iterable[str | type] | None = None,
+                 skip_documentation: bool = False) -> None:
         self.xml_root: ElementTree.Element = None
         self.file_path: str = None
         self.file_base_name: str = None
         self.warn_on_unprocessed_element = warn_on_unprocessed_element
+        # Set to False to skip all book-keeping of unprocessed elements
+        self.track_unprocessed_elements = track_unprocessed_elements
+        # Optional on-disk cache of converted documents, used by read_file
+        self.cache = cache
+        # Set to True to store calibration values (SW-VALUES-PHYS) consisting only of plain numbers in array.array
+        self.sw_values_as_arrays = sw_values_as_arrays
+        # Set to True to skip documentation (DESC, INTRODUCTION, ANNOTATIONS, LONG-NAME and ADMIN-DATA)
+        self.skip_documentation = skip_documentation
         self.use_full_path_on_warning = use_full_path_on_warning
         self.observed_unsupported_elements = None
         self.schema_file: str = ''
         self.schema_version = schema_version
         self.document: ar_document.Document = None
         self.stop_on_error = False
+        self._line_offset = 0  # Added to source lines of elements parsed in lazy mode
         self.switcher_collectable = {  # Collectable elements
             # CompuMethod
             'COMPU-METHOD': self._read_compu_method,
@@ -346,33 +539,163 @@ class Reader:
             "ParameterDataPrototype": self._read_parameter_data_prototype,
             "VariableDataPrototype": self._read_variable_data_prototype,
         }
+        # Optional filters. Packages and elements not matching them are skipped without being converted.
+        self.package_filter: _PackageFilter | None = None
+        if include_packages is not None or exclude_packages is not None:
+            self.package_filter = _PackageFilter(include_packages, exclude_packages)
+        self.element_tags: set[str] | None = None
+        if element_types is not None:
+            self.element_tags = self._get_element_tags(element_types)
 
-    def read_file(self, file_path: str, stop_on_error: bool = False) -> ar_document.Document:
+    def read_file(self,
+                  file_path: str | os.PathLike | BinaryIO,
+                  stop_on_error: bool = False,
+                  streaming: bool = False,
+                  lazy: bool = False) -> ar_document.Document:
         """
-        Reads ARXML document file
+        Reads ARXML document file.
+
+        Instead of a path, an open binary file object can be given. Such files are read in chunks
+        from the current position. The cache and lazy mode are only available for file paths.
+
+        Files with suffix ".gz" (gzip) or ".xz" are decompressed while being parsed.
+        Lazy mode isn't available for compressed files.
+
+        When streaming is True the file is parsed incrementally. Package elements are converted
+        as soon as their end-tags have been parsed, after which their XML data is discarded.
+        Peak memory usage then scales with the largest single element instead of the file size.
+
+        When lazy is True the file is only scanned for packages and the positions of their elements.
+        Package elements are parsed and converted the first time they are accessed, either
+        by find, filter or through the elements list of their package. Errors in an element are
+        raised at that point. The file is kept open (memory-mapped) and must not be modified
+        until all elements have been converted. The cache is not used in lazy mode.
+
+        If the reader has a cache and it contains a valid entry for the file, the document
+        is loaded from cache without parsing the XML.
+
+        Packages and elements excluded by the reader options include_packages, exclude_packages
+        and element_types are skipped before they are converted. In streaming mode, their XML data
+        is discarded as soon as it has been parsed.
         """
         self.document = None
-        self.xml_root = ElementTree.ElementTree().parse(file_path)
-        self.file_path = file_path
-        self.file_base_name = os.path.basename(file_path)
         self.observed_unsupported_elements = set()
         self.stop_on_error = stop_on_error
-        self._clean_namespace('http://autosar.org/schema/r4.0')
+        if streaming and lazy:
+            raise ValueError("Options streaming and lazy can't be combined")
+        if hasattr(file_path, "read"):
+            if lazy:
+                raise ValueError("Lazy mode requires a file path")
+            self.file_path = str(getattr(file_path, "name", ""))
+            self.file_base_name = os.path.basename(self.file_path)
+            if streaming:
+                self._read_file_streaming(file_path)
+            else:
+                self._read_file_tree(file_path)
+            return self.document
+        self.file_path = os.fspath(file_path)
+        self.file_base_name = os.path.basename(self.file_path)
+        file_path = self.file_path
+        if lazy:
+            if ar_compression.is_compressed(file_path):
+                raise ValueError("Lazy mode requires an uncompressed file")
+            self._read_file_lazy(file_path)
+            return self.document
+        if self.cache is not None:
+            self.document = self.cache.load(file_path, self._cache_variant())
+            if self.document is not None:
+                return self.document
+        with ar_compression.open_file(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+            if streaming:
+                self._read_file_streaming(fh)
+            else:
+                self._read_file_tree(fh)
+        if self.cache is not None:
+            self.cache.store(file_path, self.document, self._cache_variant())
+        return self.document
+
+    def read_zip(self,
+                 file_path: str | os.PathLike,
+                 stop_on_error: bool = False,
+                 streaming: bool = False) -> Iterator[tuple[str, ar_document.Document]]:
+        """
+        Reads ARXML documents stored in a zip file, without extracting them to disk.
+        Yields member name and document for each member with suffix ".arxml", in archive order.
+        """
+        with zipfile.ZipFile(file_path) as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(".arxml"):
+                    continue
+                with zip_file.open(info) as fh:  # pylint: disable=invalid-name
+                    document = self.read_file(fh, stop_on_error, streaming)
+                yield info.filename, document
+
+    def _read_file_tree(self, fh: BinaryIO) -> None:  # pylint: disable=invalid-name
+        """
+        Parses entire file into an element tree before reading packages
+        """
+        self.xml_root = self._parse_chunks(self._read_chunks(fh))
         self._read_root_element()
         self._read_packages()
-        return self.document
 
-    def read_str(self, xml: str, stop_on_error: bool = False) -> None | ar_document.Document:
+    def _cache_variant(self) -> str:
+        """
+        Names reader options that change the converted document.
+        Documents read with different options are cached separately.
+        """
+        options = []
+        if self.sw_values_as_arrays:
+            options.append("sw_values_as_arrays")
+        if self.skip_documentation:
+            options.append("skip_documentation")
+        if self.package_filter is not None:
+            if self.package_filter.include is not None:
+                options.append("include_packages=" + ",".join(self.package_filter.include))
+            if self.package_filter.exclude:
+                options.append("exclude_packages=" + ",".join(self.package_filter.exclude))
+        if self.element_tags is not None:
+            options.append("element_types=" + ",".join(sorted(self.element_tags)))
+        return ";".join(options)
+
+    def _get_element_tags(self, element_types: Iterable[str | type]) -> set[str]:
+        """
+        Converts element types given as XML tags or element classes to a set of XML tags.
+        A class selects all collectable elements whose class is the same or derived from it.
+        """
+        tags = set()
+        for element_type in element_types:
+            if isinstance(element_type, str):
+                if element_type not in self.switcher_collectable:
+                    raise ValueError(f"Not a supported package element: '{element_type}'")
+                tags.add(element_type)
+            elif isinstance(element_type, type):
+                matching_tags = [tag for tag, read_method in self.switcher_collectable.items()
+                                 if issubclass(read_method.__annotations__["return"], element_type)]
+                if not matching_tags:
+                    raise ValueError(f"Not a supported package element: '{element_type.__name__}'")
+                tags.update(matching_tags)
+            else:
+                raise TypeError(f"Invalid type for element_types: {str(type(element_type))}")
+        return tags
+
+    def read_str(self, xml: str | XmlBuffer | BinaryIO, stop_on_error: bool = False) -> None | ar_document.Document:
         """
         Reads ARXML document from string.
+
+        Besides str, the XML can be given as bytes-like object (bytes, bytearray, memoryview or mmap)
+        or as binary file object. Such data is passed to the parser in chunks without copying it first.
         """
         self.observed_unsupported_elements = set()
         self.document = None
-        self.xml_root = ElementTree.fromstring(bytes(xml, encoding="utf-8"))
+        if isinstance(xml, str):
+            self.xml_root = self._parse_chunks(self._split_chunks(xml.encode("utf-8")))
+        elif hasattr(xml, "read") and not isinstance(xml, mmap.mmap):
+            self.xml_root = self._parse_chunks(self._read_chunks(xml))
+        else:
+            self.xml_root = self._parse_chunks(self._split_chunks(xml))
         self.file_path = ""
         self.file_base_name = ""
         self.stop_on_error = stop_on_error
-        self._clean_namespace('http://autosar.org/schema/r4.0')
         self._read_root_element()
         self._read_packages()
         return self.document
@@ -399,20 +722,21 @@ class Reader:
         """
         Reports about unprocessed child elements
         """
-        for xml_elem in [x.elem for x in xml_elements.values() if not x.is_accessed]:
-            assert xml_elem is not None
-            self._report_unprocessed_element(xml_elem)
+        if self.track_unprocessed_elements:
+            for xml_elem in xml_elements.unaccessed():
+                self._report_unprocessed_element(xml_elem)
 
     def _report_unprocessed_element(self, xml_elem: ElementTree.Element):
         """
         Reports about a single child element
         """
-        if xml_elem.tag not in self.observed_unsupported_elements:
+        if self.track_unprocessed_elements and xml_elem.tag not in self.observed_unsupported_elements:
             self.observed_unsupported_elements.add(xml_elem.tag)
             if self.warn_on_unprocessed_element:
                 if self.file_path is not None:
                     file = self.file_path if self.use_full_path_on_warning else self.file_base_name
-                    print(f"{file}({xml_elem.sourceline}): Unprocessed element <{xml_elem.tag}>", file=sys.stderr)
+                    line = xml_elem.sourceline + self._line_offset
+                    print(f"{file}({line}): Unprocessed element <{xml_elem.tag}>", file=sys.stderr)
                 else:
                     print(f"Unprocessed element <{xml_elem.tag}>", file=sys.stderr)
 
@@ -421,7 +745,7 @@ class Reader:
         Generates an error message with file-name and source-line
         """
         file = self.file_path if self.use_full_path_on_warning else self.file_base_name
-        header = f"{file}({element.sourceline}): "
+        header = f"{file}({element.sourceline + self._line_offset}): "
         return header + message
 
     def _raise_parse_error(self, element: ElementTree.Element, message: str):
@@ -430,13 +754,74 @@ class Reader:
         """
         raise ar_exception.ParseError(self._element_error_message(element, message))
 
-    def _clean_namespace(self, namespace: str) -> None:
+    def _read_chunks(self, fh: BinaryIO) -> Iterator[bytes]:  # pylint: disable=invalid-name
+        """
+        Reads binary file in chunks suitable for the XML parser.
+        The default namespace declaration is removed from the first chunk.
+        """
+        yield self._remove_default_namespace(fh.read(READ_CHUNK_SIZE))
+        while True:
+            chunk = fh.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def _split_chunks(self, data: XmlBuffer) -> Iterator[bytes]:
+        """
+        Splits buffer into chunks suitable for the XML parser.
+        Only one chunk at a time is copied out of the buffer.
+        The default namespace declaration is removed from the first chunk.
+        """
+        with memoryview(data) as view, view.cast("B") as byte_view:
+            yield self._remove_default_namespace(byte_view[:READ_CHUNK_SIZE].tobytes())
+            for pos in range(READ_CHUNK_SIZE, len(byte_view), READ_CHUNK_SIZE):
+                yield byte_view[pos:pos + READ_CHUNK_SIZE].tobytes()
+
+    def _remove_default_namespace(self, data: bytes) -> bytes:
+        """
+        Removes declaration of the AUTOSAR XML namespace from the start-tag of the root element.
+        This makes the XML parser generate tag names without namespace prefix
+        so that no extra pass over the element tree is needed to clean them.
+        """
+        begin = data.find(b'<AUTOSAR')
+        if begin >= 0:
+            end = data.find(b'>', begin)
+            if end > 0:
+                match = default_namespace_re.search(data, begin, end)
+                if match is not None:
+                    return data[:match.start()] + data[match.end():]
+        return data
+
+    def _parse_chunks(self, chunks: Iterable[bytes]) -> ElementTree.Element:
+        """
+        Parses XML document passed in chunks, returning the root element.
+        """
+        parser = ElementTree.XMLParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        xml_root = parser.close()
+        if self._get_namespace(xml_root) is not None:
+            # Namespace declaration wasn't found in the expected place
+            self._clean_namespace(AUTOSAR_NAMESPACE, xml_root)
+        return xml_root
+
+    def _get_namespace(self, xml_elem: ElementTree.Element) -> str | None:
+        """
+        Returns namespace part of the element tag, if any
+        """
+        tag = xml_elem.tag
+        return tag[1:tag.index('}')] if tag[0] == '{' else None
+
+    def _clean_namespace(self, namespace: str, xml_elem: ElementTree.Element | None = None) -> None:
         """
         Removes XML namespace in place.
+        Cleans the entire document unless a sub-tree is given.
         """
         wrapped = '{' + namespace + '}'
         wrapped_len = len(wrapped)
-        for elem in self.xml_root.iter():
+        if xml_elem is None:
+            xml_elem = self.xml_root
+        for elem in xml_elem.iter():
             if isinstance(elem.tag, str) and elem.tag.startswith(wrapped):
                 elem.tag = elem.tag[wrapped_len:]
 
@@ -487,7 +872,7 @@ class Reader:
         else:
             raise ar_exception.ParseError(
                 "Missing required element SHORT-NAME")
-        xml_long_name = element_map.get('LONG-NAME')
+        xml_long_name = self._get_documentation(element_map, 'LONG-NAME')
         if xml_long_name is not None:
             data['long_name'] = self._read_multi_language_long_name(
                 xml_long_name)
@@ -497,7 +882,7 @@ class Reader:
         Reads group AR:MULTILANGUAGE-REFERRABLE
         Type: Abstract
         """
-        xml_long_name = element_map.get('LONG-NAME')
+        xml_long_name = self._get_documentation(element_map, 'LONG-NAME')
         if xml_long_name is not None:
             data['long_name'] = self._read_multi_language_long_name(xml_long_name)
 
@@ -508,23 +893,32 @@ class Reader:
         """
         self._read_identifiable_attributes(attr, data)
         xml_child: ElementTree.Element | None = None
-        xml_child = element_map.get('DESC')
+        xml_child = self._get_documentation(element_map, 'DESC')
         if xml_child is not None:
             data['desc'] = self._read_multi_language_overview_paragraph(
                 xml_child)
         xml_child = element_map.get('CATEGORY')
         if xml_child is not None:
             data['category'] = xml_child.text
-        xml_child = element_map.get('ADMIN-DATA')
+        xml_child = self._get_documentation(element_map, 'ADMIN-DATA')
         if xml_child is not None:
             data['admin_data'] = self._read_admin_data(xml_child)
-        xml_child = element_map.get('INTRODUCTION')
+        xml_child = self._get_documentation(element_map, 'INTRODUCTION')
         if xml_child is not None:
             data['introduction'] = self._read_documentation_block(xml_child)
-        xml_child = element_map.get('ANNOTATIONS')
+        xml_child = self._get_documentation(element_map, 'ANNOTATIONS')
         if xml_child is not None:
             data['annotations'] = self._read_annotations(xml_child)
 
+    def _get_documentation(self, element_map: ChildElementMap, tag: str) -> ElementTree.Element | None:
+        """
+        Returns documentation child element or None if the reader skips documentation
+        """
+        if self.skip_documentation:
+            element_map.skip(tag)
+            return None
+        return element_map.get(tag)
+
     def _read_identifiable_attributes(self, attr: dict, data: dict) -> None:
         uuid = attr.get('UUID', None)
         if uuid is not None:
@@ -616,32 +1010,63 @@ class Reader:
         for xml_node in self.xml_root.findall('./AR-PACKAGES/*'):
             if xml_node.tag == 'AR-PACKAGE':
                 package = self._read_package(xml_node)
-                self.document.append(package)
+                if package is not None:
+                    self.document.append(package)
+
+    def _read_package(self,
+                      elem: ElementTree.Element,
+                      parent_ref: str | None = None) -> ar_element.Package | None:
+        """
+        Reads AR:AR-PACKAGE.
+        Returns None if the package is excluded by the package filter.
+        """
+        package_ref = None
+        read_elements = True
+        if self.package_filter is not None:
+            package_ref = (parent_ref or "") + "/" + elem.findtext('SHORT-NAME', '')
+            action = self.package_filter.match(package_ref)
+            if action == _PackageFilter.SKIP:
+                return None
+            read_elements = action == _PackageFilter.READ
+        child_elements = ChildElementMap(elem)
+        package = self._read_package_header(child_elements, elem.attrib)
+        self._read_package_group(child_elements, package, package_ref, read_elements)
+        self._report_unprocessed_elements(child_elements)
+        if not read_elements and not package.packages:
+            return None  # Parent of included packages that weren't found
+        return package
 
-    def _read_package(self, elem: ElementTree.Element) -> ar_element.Package:
+    def _read_package_header(self, child_elements: ChildElementMap, attr: dict) -> ar_element.Package:
+        """
+        Creates package from all child elements that precedes AR:AR-PACKAGE.ELEMENTS
+        """
         data = {}
-        child_elements = ChildElementMap(elem)
         self._read_referrable(child_elements, data)
         self._read_multi_language_referrable(child_elements, data)
-        self._read_identifiable(child_elements, elem.attrib, data)
-        package = ar_element.Package(**data)
-        self._read_package_group(child_elements, package)
-        self._report_unprocessed_elements(child_elements)
-        return package
+        self._read_identifiable(child_elements, attr, data)
+        return ar_element.Package(**data)
 
-    def _read_package_group(self, element_map: ChildElementMap, package: ar_element.Package) -> None:
+    def _read_package_group(self,
+                            element_map: ChildElementMap,
+                            package: ar_element.Package,
+                            package_ref: str | None = None,
+                            read_elements: bool = True) -> None:
         """
         Reads group AR:AR-PACKAGE
         Type: Utility
         """
         # REFERECE-BASES not implemented
-        xml_elements = element_map.get('ELEMENTS')
+        if read_elements:
+            xml_elements = element_map.get('ELEMENTS')
+        else:
+            xml_elements = None
+            element_map.skip('ELEMENTS')
         xml_packages = element_map.get('AR-PACKAGES')
         # VARIATION-POINT will not be supported
         if xml_elements is not None:
             self._read_package_elements(package, xml_elements)
         if xml_packages is not None:
-            self._read_sub_packages(package, xml_packages)
+            self._read_sub_packages(package, xml_packages, package_ref)
 
     def _read_package_elements(self, package: ar_element.Package, xml_elements: ElementTree.Element) -> None:
         """
@@ -649,38 +1074,404 @@ class Reader:
         Type: Utility
         """
         for xml_child_elem in xml_elements.findall('./*'):
-            read_method = self.switcher_collectable.get(
-                xml_child_elem.tag, None)
-            if read_method is not None:
-                try:
-                    element = read_method(xml_child_elem)
-                    assert isinstance(element, ar_element.ARElement)
-                    package.append(element)
-                except ar_exception.ParseError as exc:
-                    msg = "Parse error encountered while reading element starting on this line"
-                    message = self._element_error_message(xml_child_elem, msg)
-                    if self.stop_on_error:
-                        raise ar_exception.ParseError(message) from exc
-                    print(message + ":")
-                    print("    " + str(exc))
-                except ar_exception.DuplicateElement as exc:
-                    message = self._element_error_message(xml_child_elem,
-                                                          str(exc))
-                    if self.stop_on_error:
-                        raise ar_exception.DuplicateElement(message) from exc
-                    print(message)
-            else:
+            self._read_package_element(package, xml_child_elem)
+
+    def _read_package_element(self, package: ar_element.Package, xml_child_elem: ElementTree.Element) -> None:
+        """
+        Reads a single element from AR:AR-PACKAGE.ELEMENTS and appends it to package
+        """
+        if self.element_tags is not None and xml_child_elem.tag not in self.element_tags:
+            if xml_child_elem.tag not in self.switcher_collectable:
                 self._report_unprocessed_element(xml_child_elem)
+            return
+        read_method = self.switcher_collectable.get(xml_child_elem.tag, None)
+        if read_method is not None:
+            try:
+                element = read_method(xml_child_elem)
+                assert isinstance(element, ar_element.ARElement)
+                package.append(element)
+            except ar_exception.ParseError as exc:
+                msg = "Parse error encountered while reading element starting on this line"
+                message = self._element_error_message(xml_child_elem, msg)
+                if self.stop_on_error:
+                    raise ar_exception.ParseError(message) from exc
+                print(message + ":")
+                print("    " + str(exc))
+            except ar_exception.DuplicateElement as exc:
+                message = self._element_error_message(xml_child_elem,
+                                                      str(exc))
+                if self.stop_on_error:
+                    raise ar_exception.DuplicateElement(message) from exc
+                print(message)
+        else:
+            self._report_unprocessed_element(xml_child_elem)
 
-    def _read_sub_packages(self, package: ar_element.Package, xml_packages: ElementTree.Element) -> None:
+    def _read_sub_packages(self,
+                           package: ar_element.Package,
+                           xml_packages: ElementTree.Element,
+                           package_ref: str | None = None) -> None:
         """
         Reads AR:AR-PACKAGE.ELEMENTS
         Type: Utility
         """
         for xml_child_package in xml_packages.findall('./AR-PACKAGE'):
-            child_package = self._read_package(xml_child_package)
-            assert isinstance(child_package, ar_element.Package)
-            package.append(child_package)
+            child_package = self._read_package(xml_child_package, package_ref)
+            if child_package is not None:
+                package.append(child_package)
+
+    # AUTOSAR Package (streaming mode)
+
+    def _read_file_streaming(self, fh: BinaryIO) -> None:  # pylint: disable=invalid-name
+        """
+        Reads packages using an incremental (pull) parser.
+        Only end-tags of AR-PACKAGE and collectable elements are reported by the parser.
+        """
+        tags = ['{*}AR-PACKAGE'] + ['{*}' + tag for tag in self.switcher_collectable]
+        packages: dict[ElementTree.Element, ar_element.Package] = {}
+        package_actions: dict[ElementTree.Element, tuple[str, int]] = {}
+        parser = ElementTree.XMLPullParser(events=('end',), tag=tags)
+        for chunk in self._read_chunks(fh):
+            parser.feed(chunk)
+            self._read_stream_events(parser, packages, package_actions)
+        xml_root = parser.close()
+        self._read_stream_events(parser, packages, package_actions)
+        if self.document is None:
+            self.xml_root = xml_root
+            self._read_root_element()
+
+    def _read_stream_events(self,
+                            parser: ElementTree.XMLPullParser,
+                            packages: dict[ElementTree.Element, ar_element.Package],
+                            package_actions: dict[ElementTree.Element, tuple[str, int]]) -> None:
+        """
+        Processes end-tag events received so far from the incremental parser
+        """
+        for _, xml_elem in parser.read_events():
+            if self.document is None:
+                self.xml_root = xml_elem.getroottree().getroot()
+                self._read_root_element()
+            namespace = self._get_namespace(self.xml_root)
+            if self._local_name(xml_elem) == 'AR-PACKAGE':
+                if self._get_streamed_package_action(xml_elem, package_actions) == _PackageFilter.READ:
+                    self._get_streamed_package(xml_elem, packages, namespace)
+                    self._report_streamed_package_elements(xml_elem)
+                packages.pop(xml_elem, None)
+                package_actions.pop(xml_elem, None)
+                self._discard_streamed_element(xml_elem)
+            else:
+                xml_parent = xml_elem.getparent()
+                if xml_parent is None or self._local_name(xml_parent) != 'ELEMENTS':
+                    continue  # Nested element with same tag name as a collectable element
+                xml_package = xml_parent.getparent()
+                if xml_package is None or self._local_name(xml_package) != 'AR-PACKAGE':
+                    continue
+                if self._get_streamed_package_action(xml_package, package_actions) != _PackageFilter.READ:
+                    self._discard_streamed_element(xml_elem, report_siblings=False)
+                    continue
+                if self.element_tags is not None and self._local_name(xml_elem) not in self.element_tags:
+                    self._discard_streamed_element(xml_elem)
+                    continue
+                package = self._get_streamed_package(xml_package, packages, namespace)
+                if namespace is not None:
+                    self._clean_namespace(namespace, xml_elem)
+                self._read_package_element(package, xml_elem)
+                self._discard_streamed_element(xml_elem)
+
+    def _get_streamed_package_action(self,
+                                     xml_package: ElementTree.Element,
+                                     package_actions: dict[ElementTree.Element, tuple[str, int]]) -> int:
+        """
+        Applies package filter to an AR-PACKAGE that is currently being parsed.
+        Results are kept in package_actions until the end-tag of the package has been processed.
+        """
+        if self.package_filter is None:
+            return _PackageFilter.READ
+        entry = package_actions.get(xml_package, None)
+        if entry is None:
+            xml_parent = xml_package.getparent().getparent()
+            if xml_parent is self.xml_root:
+                parent_ref, parent_action = "", _PackageFilter.PARENT_ONLY
+            else:
+                self._get_streamed_package_action(xml_parent, package_actions)
+                parent_ref, parent_action = package_actions[xml_parent]
+            package_ref = parent_ref + "/" + xml_package.findtext('{*}SHORT-NAME', '')
+            if parent_action == _PackageFilter.SKIP:
+                action = _PackageFilter.SKIP
+            else:
+                action = self.package_filter.match(package_ref)
+            entry = package_actions[xml_package] = (package_ref, action)
+        return entry[1]
+
+    def _get_streamed_package(self,
+                              xml_package: ElementTree.Element,
+                              packages: dict[ElementTree.Element, ar_element.Package],
+                              namespace: str | None) -> ar_element.Package:
+        """
+        Returns package object for an AR-PACKAGE that is currently being parsed.
+        The package (and any missing parent packages) are created on first access.
+        At that point, only the package header and at most one converted child is
+        held in memory.
+        """
+        package = packages.get(xml_package, None)
+        if package is None:
+            if namespace is not None:
+                self._clean_namespace(namespace, xml_package)
+            child_elements = ChildElementMap(xml_package)
+            package = self._read_package_header(child_elements, xml_package.attrib)
+            child_elements.skip('ELEMENTS')
+            child_elements.skip('AR-PACKAGES')
+            self._report_unprocessed_elements(child_elements)
+            packages[xml_package] = package
+            xml_parent = xml_package.getparent().getparent()
+            if xml_parent is self.xml_root:
+                self.document.append(package)
+            else:
+                self._get_streamed_package(xml_parent, packages, namespace).append(package)
+        return package
+
+    def _report_streamed_package_elements(self, xml_package: ElementTree.Element) -> None:
+        """
+        Reports remaining unsupported child elements of AR-PACKAGE.ELEMENTS
+        """
+        xml_elements = xml_package.find('./ELEMENTS')
+        if xml_elements is not None:
+            for xml_child_elem in xml_elements.iterchildren(ElementTree.Element):
+                self._report_streamed_element(xml_child_elem)
+
+    def _report_streamed_element(self, xml_elem: ElementTree.Element) -> None:
+        """
+        Reports element from AR-PACKAGE.ELEMENTS unless it has a reader
+        """
+        xml_elem.tag = self._local_name(xml_elem)
+        if xml_elem.tag not in self.switcher_collectable:
+            self._report_unprocessed_element(xml_elem)
+
+    def _discard_streamed_element(self, xml_elem: ElementTree.Element, report_siblings: bool = True) -> None:
+        """
+        Releases memory held by a processed element and all its preceding siblings.
+        Unsupported siblings are reported before they are removed unless report_siblings is False.
+        """
+        xml_elem.clear()
+        xml_parent = xml_elem.getparent()
+        check_siblings = report_siblings and self._local_name(xml_parent) == 'ELEMENTS'
+        while True:
+            xml_sibling = xml_elem.getprevious()
+            if xml_sibling is None:
+                break
+            if check_siblings and isinstance(xml_sibling.tag, str):
+                self._report_streamed_element(xml_sibling)
+            del xml_parent[0]
+
+    def _local_name(self, xml_elem: ElementTree.Element) -> str:
+        """
+        Returns tag name without namespace
+        """
+        tag = xml_elem.tag
+        return tag.rpartition('}')[2] if tag[0] == '{' else tag
+
+    # AUTOSAR Package (lazy mode)
+
+    def _read_file_lazy(self, file_path: str) -> None:
+        """
+        Scans file for packages and the positions of their elements.
+        Package headers are converted right away while elements are added as placeholders.
+        Falls back to a normal read for files that can't be scanned, such as files using a namespace prefix.
+        The normal read is also used if scanning fails, so that errors are reported the same way.
+        """
+        if os.path.getsize(file_path) == 0:
+            with open(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+                self._read_file_tree(fh)
+            return
+        source = _LazySource(file_path)
+        match = source.next_tag(0)
+        xml_root = None
+        if match.group(2) == b'AUTOSAR' and not match.group(1):
+            start_tag = source.data[match.start():match.end()]
+            if not match.group(4):
+                start_tag = start_tag[:-1] + b'/>'
+            xml_root = ElementTree.fromstring(self._remove_default_namespace(start_tag),
+                                              ElementTree.XMLParser(encoding=source.encoding))
+        if xml_root is None or self._get_namespace(xml_root) is not None:
+            source.data.close()
+            with open(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+                self._read_file_tree(fh)
+            return
+        self.xml_root = xml_root
+        self._read_root_element()
+        pos = match.end()
+        try:
+            while not match.group(4):
+                match = source.next_tag(pos)
+                if match.group(1):
+                    break
+                if match.group(2) == b'AR-PACKAGES' and not match.group(4):
+                    pos = self._read_lazy_packages(source, match.end(), self.document, "")
+                else:
+                    pos = source.find_end(match)
+        except (ar_exception.ParseError, ElementTree.XMLSyntaxError):
+            source.data.close()
+            with open(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+                self._read_file_tree(fh)
+            return
+        if source.pending == 0:
+            source.data.close()
+
+    def _read_lazy_packages(self,
+                            source: _LazySource,
+                            pos: int,
+                            parent: ar_document.Document | ar_element.Package,
+                            parent_ref: str) -> int:
+        """
+        Reads AR:AR-PACKAGES starting at pos (after the start-tag).
+        Returns position after the end-tag.
+        """
+        while True:
+            match = source.next_tag(pos)
+            if match.group(1):
+                return match.end()
+            if match.group(2) == b'AR-PACKAGE' and not match.group(4):
+                package, pos = self._read_lazy_package(source, match, parent_ref)
+                if package is not None:
+                    parent.append(package)
+            else:
+                pos = source.find_end(match)
+
+    def _read_lazy_package(self,
+                           source: _LazySource,
+                           start_match: re.Match,
+                           parent_ref: str) -> tuple[ar_element.Package | None, int]:
+        """
+        Reads AR:AR-PACKAGE whose start-tag is start_match.
+        Returns package (None if excluded by the package filter) and position after the end-tag.
+        """
+        package = None
+        package_ref = None
+        action = _PackageFilter.READ
+        pos = start_match.end()
+        while True:
+            match = source.next_tag(pos)
+            if match.group(1):
+                if package is None:
+                    package, package_ref, action = self._read_lazy_package_header(source, start_match, match.start(),
+                                                                                  parent_ref)
+                pos = match.end()
+                break
+            tag = match.group(2)
+            if tag not in (b'ELEMENTS', b'AR-PACKAGES'):
+                pos = source.find_end(match)
+                continue
+            if package is None:
+                package, package_ref, action = self._read_lazy_package_header(source, start_match, match.start(),
+                                                                              parent_ref)
+            skip = action == _PackageFilter.SKIP or (tag == b'ELEMENTS' and action != _PackageFilter.READ)
+            if skip or match.group(4):
+                pos = source.find_end(match)
+            elif tag == b'ELEMENTS':
+                pos = self._read_lazy_package_elements(source, match.end(), package)
+            else:
+                pos = self._read_lazy_packages(source, match.end(), package, package_ref)
+        if action == _PackageFilter.SKIP or (action == _PackageFilter.PARENT_ONLY and not package.packages):
+            return None, pos
+        return package, pos
+
+    def _read_lazy_package_header(self,
+                                  source: _LazySource,
+                                  start_match: re.Match,
+                                  end: int,
+                                  parent_ref: str) -> tuple[ar_element.Package | None, str, int]:
+        """
+        Converts child elements of AR:AR-PACKAGE that precede ELEMENTS and AR-PACKAGES.
+        Returns package, package reference and the action given by the package filter.
+        """
+        self._line_offset = source.line_at(start_match.start()) - 1
+        try:
+            xml_package = source.parse(start_match.start(), end, b'</AR-PACKAGE>')
+            package_ref = parent_ref + "/" + xml_package.findtext('SHORT-NAME', '')
+            action = _PackageFilter.READ
+            if self.package_filter is not None:
+                action = self.package_filter.match(package_ref)
+                if action == _PackageFilter.SKIP:
+                    return None, package_ref, action
+            child_elements = ChildElementMap(xml_package)
+            package = self._read_package_header(child_elements, xml_package.attrib)
+            self._report_unprocessed_elements(child_elements)
+        finally:
+            self._line_offset = 0
+        return package, package_ref, action
+
+    def _read_lazy_package_elements(self, source: _LazySource, pos: int, package: ar_element.Package) -> int:
+        """
+        Adds placeholders for AR:AR-PACKAGE.ELEMENTS starting at pos (after the start-tag).
+        Returns position after the end-tag.
+        """
+        while True:
+            match = source.next_tag(pos)
+            if match.group(1):
+                return match.end()
+            start = match.start()
+            pos = source.find_end(match)
+            tag = match.group(2).decode("ascii")
+            if tag not in self.switcher_collectable:
+                if self.track_unprocessed_elements and tag not in self.observed_unsupported_elements:
+                    xml_elem = ElementTree.Element(tag)
+                    xml_elem.sourceline = source.line_at(start)
+                    self._report_unprocessed_element(xml_elem)
+                continue
+            if self.element_tags is not None and tag not in self.element_tags:
+                continue
+            line = source.line_at(start)
+            name = source.find_short_name(match, pos)
+            if name is None:
+                # Converted right away, which resolves the name or reports the error in the usual way
+                self._line_offset = line - 1
+                try:
+                    self._read_package_element(package, source.parse(start, pos))
+                finally:
+                    self._line_offset = 0
+                continue
+            try:
+                package.append_lazy(name, functools.partial(self._read_lazy_element, source, start, pos, line,
+                                                            self.stop_on_error))
+                source.pending += 1
+            except ar_exception.DuplicateElement as exc:
+                file = self.file_path if self.use_full_path_on_warning else self.file_base_name
+                message = f"{file}({line}): {str(exc)}"
+                if self.stop_on_error:
+                    raise ar_exception.DuplicateElement(message) from exc
+                print(message)
+
+    def _read_lazy_element(self,
+                           source: _LazySource,
+                           start: int,
+                           end: int,
+                           line: int,
+                           stop_on_error: bool) -> ar_element.ARElement | None:
+        """
+        Parses and converts a package element found by _read_lazy_package_elements.
+        Called on first access to the element.
+        Parse errors are raised if stop_on_error is True, otherwise they are printed and None is returned.
+        The source is released in both cases, as the element is only read once.
+        """
+        saved_state = (self.file_path, self.file_base_name, self._line_offset)
+        self.file_path, self.file_base_name = source.file_path, source.file_base_name
+        self._line_offset = line - 1
+        if self.observed_unsupported_elements is None:
+            self.observed_unsupported_elements = set()
+        try:
+            xml_elem = source.parse(start, end)
+            element = self.switcher_collectable[xml_elem.tag](xml_elem)
+        except (ar_exception.ParseError, ElementTree.XMLSyntaxError) as exc:
+            file = self.file_path if self.use_full_path_on_warning else self.file_base_name
+            message = f"{file}({line}): Parse error encountered while reading element starting on this line"
+            if stop_on_error:
+                raise ar_exception.ParseError(message + ": " + str(exc)) from exc
+            print(message + ":")
+            print("    " + str(exc))
+            element = None
+        finally:
+            self.file_path, self.file_base_name, self._line_offset = saved_state
+            source.release()
+        return element
 
     # --- Documentation elements
 
@@ -1130,13 +1921,13 @@ class Reader:
         """
         Reads group AR:DESCRIBABLE
         """
-        xml_child = child_elements.get("DESC")
+        xml_child = self._get_documentation(child_elements, "DESC")
         if xml_child is not None:
             data["desc"] = self._read_multi_language_overview_paragraph(xml_child)
         xml_child = child_elements.get("CATEGORY")
         if xml_child is not None:
             data["category"] = xml_child.text
-        xml_child = child_elements.get("INTRODUCTION")
+        xml_child = self._get_documentation(child_elements, "INTRODUCTION")
         if xml_child is not None:
             data["introduction"] = self._read_documentation_block(xml_child)
         child_elements.skip("ADMIN-DATA")  # To be implemented
@@ -1219,7 +2010,7 @@ class Reader:
         xml_child = child_elements.get("SYMBOL")
         if xml_child is not None:
             data["symbol"] = xml_child.text
-        xml_child = child_elements.get("DESC")
+        xml_child = self._get_documentation(child_elements, "DESC")
         if xml_child is not None:
             data["desc"] = self._read_multi_language_overview_paragraph(xml_child)
         xml_child = child_elements.get("MASK")
@@ -1434,7 +2225,7 @@ class Reader:
         xml_child = child_elements.get("SHORT-LABEL")
         if xml_child is not None:
             data["label"] = xml_child.text
-        xml_child = child_elements.get("DESC")
+        xml_child = self._get_documentation(child_elements, "DESC")
         if xml_child is not None:
             data["desc"] = self._read_multi_language_overview_paragraph(xml_child)
         xml_child = child_elements.get("LOWER-LIMIT")
@@ -1721,7 +2512,7 @@ class Reader:
             data['step_size'] = float(xml_child.text)
         # Variant-handling not supported
         child_elements.skip('SW-VALUE-BLOCK-SIZE-MULTS')
-        xml_child = child_elements.get('ANNOTATIONS')
+        xml_child = self._get_documentation(child_elements, 'ANNOTATIONS')
         if xml_child is not None:
             data['annotations'] = self._read_annotations(xml_child)
         xml_child = child_elements.get('SW-ADDR-METHOD-REF')
@@ -3088,6 +3879,11 @@ class Reader:
         - VTF
         - VF
         """
+        if self.sw_values_as_arrays and len(xml_child_list) > 0:
+            values = self._read_sw_values_array(xml_child_list)
+            if values is not None:
+                data["values"] = values
+                return
         values = []
         data["values"] = values
         for xml_child in xml_child_list:
@@ -3108,6 +3904,30 @@ class Reader:
             else:
                 print(f"Unprocessed child element in VALUE-GROUP: <{xml_child.tag}>", file=sys.stderr)
 
+    def _read_sw_values_array(self, xml_child_list: list[ElementTree.Element]) -> array | None:
+        """
+        Converts a sequence of V elements into an array of integers or floats.
+        Returns None unless the array holds the same values as the list created by _read_sw_values_group.
+        This excludes values that need a NumericalValue object to keep their format (hexadecimal,
+        binary or scientific notation), integers outside the 64-bit range and mixes of integers and floats.
+        """
+        texts = []
+        for xml_child in xml_child_list:
+            if xml_child.tag != "V" or xml_child.text is None:
+                return None
+            texts.append(xml_child.text)
+        try:
+            return array('q', map(int, texts))
+        except OverflowError:
+            return None
+        except ValueError:
+            pass
+        match = decimal_fraction_re.fullmatch
+        for text in texts:
+            if match(text) is None:
+                return None
+        return array('d', map(float, texts))
+
     def _read_value_group(self, xml_element: ElementTree.Element) -> ar_element.ValueGroup:
         """
         Reads complex-type AR:VALUE-GROUP
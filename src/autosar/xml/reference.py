@@ -11,6 +11,8 @@ class SwBaseTypeRef(BaseRef):
     SwBaseType reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_BASE_TYPE
                  ) -> None:
@@ -27,6 +29,8 @@ class PackageRef(BaseRef):
     References to AR-PACKAGE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.AR_PACKAGE
                  ) -> None:
@@ -43,6 +47,8 @@ class CompuMethodRef(BaseRef):
     CompuMethod reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.COMPU_METHOD
                  ) -> None:
@@ -59,6 +65,8 @@ class FunctionPtrSignatureRef(BaseRef):
     Function pointer signature reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.BSW_MODULE_ENTRY
                  ) -> None:
@@ -75,6 +83,8 @@ class ImplementationDataTypeRef(BaseRef):
     ImplementationDataType reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.IMPLEMENTATION_DATA_TYPE
                  ) -> None:
@@ -91,6 +101,8 @@ class SwAddrMethodRef(BaseRef):
     SwAddrMethod reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_ADDR_METHOD
                  ) -> None:
@@ -107,6 +119,8 @@ class DataConstraintRef(BaseRef):
     DataConstraint reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.DATA_CONSTR
                  ) -> None:
@@ -123,6 +137,8 @@ class PhysicalDimensionRef(BaseRef):
     PhysicalDimension reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.PHYSICAL_DIMENSION
                  ) -> None:
@@ -139,6 +155,8 @@ class UnitRef(BaseRef):
     DataConstraint reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.UNIT
                  ) -> None:
@@ -155,6 +173,8 @@ class IndexDataTypeRef(BaseRef):
     IndexDataType reference
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_PRIMITIVE_DATA_TYPE
                  ) -> None:
@@ -171,6 +191,8 @@ class ApplicationDataTypeRef(BaseRef):
     Application data type reference
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -187,6 +209,8 @@ class ApplicationCompositeElementDataPrototypeRef(BaseRef):
     References to AR:APPLICATION-COMPOSITE-ELEMENT-DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -201,6 +225,8 @@ class AutosarDataTypeRef(BaseRef):
     References to AR:AUTOSAR-DATA-TYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -220,6 +246,8 @@ class ConstantRef(BaseRef):
     Reference to ConstantSpecification
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION
                  ) -> None:
@@ -236,6 +264,8 @@ class VariableDataPrototypeRef(BaseRef):
     Reference to VariableDataPrototype
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.VARIABLE_DATA_PROTOTYPE) -> None:
         super().__init__(value, dest)
@@ -251,6 +281,8 @@ class ParameterDataPrototypeRef(BaseRef):
     Reference to ParameterDataPrototype
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.PARAMETER_DATA_PROTOTYPE) -> None:
         super().__init__(value, dest)
@@ -267,6 +299,8 @@ class ApplicationErrorRef(BaseRef):
     tag variants: 'POSSIBLE-ERROR-REF'
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_ERROR) -> None:
         super().__init__(value, dest)
@@ -287,6 +321,8 @@ class ModeDeclarationRef(BaseRef):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION) -> None:
         super().__init__(value, dest)
@@ -303,6 +339,8 @@ class ModeDeclarationGroupRef(BaseRef):
     Tag variants: 'MODE-DECLARATION-GROUP-REF' | 'TYPE-TREF' | 'MODE-GROUP-REF'
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP) -> None:
         super().__init__(value, dest)
@@ -321,6 +359,8 @@ class ModeDeclarationGroupPrototypeRef(BaseRef):
                   (and more)
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_DECLARATION_GROUP_PROTOTYPE
                  ) -> None:
@@ -337,6 +377,8 @@ class AutosarDataPrototypeRef(BaseRef):
     Reference to elements that derives from AutosarDataPrototype
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -350,6 +392,8 @@ class E2EProfileCompatibilityPropsRef(BaseRef):
     Reference to E2EProfileCompatibilityProps
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.E2E_PROFILE_COMPATIBILITY_PROPS
                  ) -> None:
@@ -366,6 +410,8 @@ class ClientServerOperationRef(BaseRef):
     Reference to ClientServerOperation
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.CLIENT_SERVER_OPERATION
                  ) -> None:
@@ -382,6 +428,8 @@ class PortPrototypeRef(BaseRef):
     Reference to port prototype elements
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -418,6 +466,8 @@ class AbstractImplementationDataTypeElementRef(BaseRef):
     Reference to abstract or specific data-type elements
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -430,6 +480,8 @@ class DataPrototypeRef(BaseRef):
     References to DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -451,6 +503,8 @@ class PortInterfaceRef(BaseRef):
     Only a small piece of the enum is currently implemented
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -469,6 +523,8 @@ class SwComponentTypeRef(BaseRef):
     Only a small piece of the enum is currently implemented
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -482,6 +538,8 @@ class SwComponentPrototypeRef(BaseRef):
     Reference to SW-COMPONENT-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SW_COMPONENT_PROTOTYPE
                  ) -> None:
@@ -498,6 +556,8 @@ class SwcInternalBehaviorRef(BaseRef):
     Reference to AR:SWC-INTERNAL-BEHAVIOR--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SWC_INTERNAL_BEHAVIOR
                  ) -> None:
@@ -514,6 +574,8 @@ class SwcImplementationRef(BaseRef):
     AR:SWC-IMPLEMENTATION--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.SWC_IMPLEMENTATION
                  ) -> None:
@@ -530,6 +592,8 @@ class ExclusiveAreaRef(BaseRef):
     AR:EXCLUSIVE-AREA--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA
                  ) -> None:
@@ -546,6 +610,8 @@ class ExclusiveAreaNestingOrderRef(BaseRef):
     AR:EXCLUSIVE-AREA-NESTING-ORDER--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.EXCLUSIVE_AREA_NESTING_ORDER
                  ) -> None:
@@ -562,6 +628,8 @@ class AbstractRequiredPortPrototypeRef(BaseRef):
     AR:ABSTRACT-REQUIRED-PORT-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -575,6 +643,8 @@ class AbstractProvidedPortPrototypeRef(BaseRef):
     AR:ABSTRACT-PROVIDED-PORT-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -588,6 +658,8 @@ class RunnableEntityRef(BaseRef):
     AR:RUNNABLE-ENTITY--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.RUNNABLE_ENTITY
                  ) -> None:
@@ -604,6 +676,8 @@ class VariableAccessRef(BaseRef):
     VARIABLE-ACCESS--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.VARIABLE_ACCESS
                  ) -> None:
@@ -620,6 +694,8 @@ class ModeSwitchPointRef(BaseRef):
     AR:MODE-SWITCH-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.MODE_SWITCH_POINT
                  ) -> None:
@@ -636,6 +712,8 @@ class AsynchronousServerCallPointRef(BaseRef):
     AR:ASYNCHRONOUS-SERVER-CALL-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_POINT
                  ) -> None:
@@ -652,6 +730,8 @@ class AsynchronousServerCallResultPointRef(BaseRef):
     AR:ASYNCHRONOUS-SERVER-CALL-RESULT-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ASYNCHRONOUS_SERVER_CALL_RESULT_POINT
                  ) -> None:
@@ -668,6 +748,8 @@ class TriggerRef(BaseRef):
     AR:TRIGGER--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.TRIGGER
                  ) -> None:
@@ -684,6 +766,8 @@ class InternalTriggeringPointRef(BaseRef):
     AR:INTERNAL-TRIGGERING-POINT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.INTERNAL_TRIGGERING_POINT
                  ) -> None:
@@ -700,6 +784,8 @@ class RteEventRef(BaseRef):
     AR:RTE-EVENT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     @classmethod
     def accepted_sub_types(cls) -> set[ar_enum.IdentifiableSubTypes]:
         """Acceptable values for dest"""
@@ -726,6 +812,8 @@ class DataTypeMappingSetRef(BaseRef):
     AR:DATA-TYPE-MAPPING-SET--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.DATA_TYPE_MAPPING_SET
                  ) -> None:
@@ -742,6 +830,8 @@ class ArgumentDataPrototypeRef(BaseRef):
     AR:ARGUMENT-DATA-PROTOTYPE--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.ARGUMENT_DATA_PROTOTYPE
                  ) -> None:
@@ -758,6 +848,8 @@ class ApplicationArrayElementRef(BaseRef):
     AR:APPLICATION-ARRAY-ELEMENT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_ARRAY_ELEMENT
                  ) -> None:
@@ -774,6 +866,8 @@ class ApplicationRecordElementRef(BaseRef):
     AR:APPLICATION-RECORD-ELEMENT--SUBTYPES-ENUM
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str,
                  dest: ar_enum.IdentifiableSubTypes = ar_enum.IdentifiableSubTypes.APPLICATION_RECORD_ELEMENT
                  ) -> None:
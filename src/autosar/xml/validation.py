@@ -0,0 +1,415 @@
+"""
+Validation of value specifications against data constraints
+"""
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable
+from autosar.base import Searchable
+import autosar.xml.element as ar_element
+import autosar.xml.enumeration as ar_enum
+from autosar.xml.interval import Interval, make_interval
+
+TypeRefArgType = ar_element.AutosarDataType | ar_element.AutosarDataTypeRef | str
+_ImplementationType = ar_element.ImplementationDataType | ar_element.ImplementationDataTypeElement
+_NUMBER_TYPES = (int, float)
+
+
+@dataclass
+class Violation:
+    """
+    Value outside the limits of its data constraint.
+
+    path locates the value inside the value specification, for example "[2].Speed".
+    It's an empty string for scalar values.
+    """
+
+    element_ref: str | None
+    path: str
+    value: int | float
+    constraint_ref: str
+    lower_limit: float
+    upper_limit: float
+    is_invalid_scale: bool = False  # True if value is inside a scale constraint with validity NOT-VALID
+
+
+class _ConstraintCheck:
+    """
+    Limits of one data constraint in either the physical or the internal domain
+    """
+
+    def __init__(self, ref_str: str, constraint: ar_element.DataConstraint, physical: bool) -> None:
+        self.ref_str = ref_str
+        self.limits: list[Interval] = []
+        self.invalid_scales: list[Interval] = []
+        for rule in constraint.rules:
+            constr = rule.physical if physical else rule.internal
+            if constr is None:
+                continue
+            if constr.lower_limit is not None or constr.upper_limit is not None:
+                self.limits.append(make_interval(constr.lower_limit, constr.upper_limit,
+                                                 constr.lower_limit_type, constr.upper_limit_type))
+            for scale in constr.scale_constrs:
+                if scale.validity == ar_enum.ScaleConstraintValidity.NOT_VALID:
+                    self.invalid_scales.append(make_interval(scale.lower_limit, scale.upper_limit,
+                                                             scale.lower_limit_type, scale.upper_limit_type))
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        True if there is nothing to check
+        """
+        return not (self.limits or self.invalid_scales)
+
+    def check(self, values: list[int | float]) -> list[tuple[int, Interval, bool]]:
+        """
+        Returns (position, interval, is_invalid_scale) for each value violating the constraint.
+        Minimum, maximum and sum are computed once so that the common case of all values
+        being valid doesn't need to look at each value from Python code.
+        """
+        if not values:
+            return []
+        smallest, largest = min(values), max(values)
+        total = sum(values)
+        has_nan = total != total  # Also true for inf + -inf, which only means the exact check is used
+        result = []
+        for interval in self.limits:
+            lower, lower_is_open, upper, upper_is_open = interval
+            if not has_nan and _is_above(smallest, lower, lower_is_open) and _is_below(largest, upper, upper_is_open):
+                continue
+            positions = [i for i, value in enumerate(values) if not lower <= value <= upper]
+            if lower_is_open:
+                positions.extend(i for i, value in enumerate(values) if value == lower)
+            if upper_is_open:
+                positions.extend(i for i, value in enumerate(values) if value == upper)
+            positions.sort()
+            result.extend((i, interval, False) for i in positions)
+        for interval in self.invalid_scales:
+            lower, lower_is_open, upper, upper_is_open = interval
+            if largest < lower or smallest > upper:
+                continue
+            positions = [i for i, value in enumerate(values) if lower <= value <= upper]
+            if lower_is_open:
+                positions = [i for i in positions if values[i] > lower]
+            if upper_is_open:
+                positions = [i for i in positions if values[i] < upper]
+            result.extend((i, interval, True) for i in positions)
+        return result
+
+
+def _is_above(value: int | float, lower: float, is_open: bool) -> bool:
+    return value > lower if is_open else value >= lower
+
+
+def _is_below(value: int | float, upper: float, is_open: bool) -> bool:
+    return value < upper if is_open else value <= upper
+
+
+class _ScalarNode:
+    __slots__ = ("check",)
+
+    def __init__(self, check: _ConstraintCheck | None = None) -> None:
+        self.check = check
+
+
+class _ArrayNode:
+    __slots__ = ("element",)
+
+    def __init__(self, element: Any) -> None:
+        self.element = element
+
+
+class _RecordNode:
+    __slots__ = ("names", "fields")
+
+    def __init__(self, names: list[str], fields: list[Any]) -> None:
+        self.names = names
+        self.fields = fields
+
+
+class _Bucket:
+    """
+    Values collected for one constraint.
+    Values are added in segments, each segment comes from one container (array, record or SW-VALUES-PHYS)
+    of one validated item. Position of a value inside its container is calculated from the segment.
+    """
+
+    __slots__ = ("values", "offsets", "items", "containers", "starts")
+
+    def __init__(self) -> None:
+        self.values: list[int | float] = []
+        self.offsets: list[int] = []
+        self.items: list[int] = []
+        self.containers: list[Any] = []
+        self.starts: list[int] = []
+
+    def add(self, values: Iterable[int | float], item_index: int, container: Any, start: int) -> None:
+        """
+        Adds segment of values
+        """
+        self.offsets.append(len(self.values))
+        self.items.append(item_index)
+        self.containers.append(container)
+        self.starts.append(start)
+        self.values.extend(values)
+
+    def locate(self, position: int) -> tuple[int, Any, int]:
+        """
+        Returns item index, container and position inside container for value at position
+        """
+        i = bisect_right(self.offsets, position) - 1
+        return self.items[i], self.containers[i], self.starts[i] + position - self.offsets[i]
+
+
+class ConstraintValidator:
+    """
+    Checks numerical values of value specifications against the data constraints of their data types.
+
+    Data types and constraints are looked up in the workspace once and kept per reference string.
+    Array and record value specifications are flattened so that all values constrained by the same
+    data constraint are checked together.
+
+    Values of application data types are checked against physical constraints.
+    Values of implementation data types are checked against internal constraints.
+    A value violates a constraint if it's outside the limits of any of its rules
+    or inside a scale constraint with validity NOT-VALID.
+    Text values and values of types without data constraint are not checked.
+
+    Call clear after changing data types or constraints in the workspace.
+    """
+
+    def __init__(self, workspace: Searchable) -> None:
+        self.workspace = workspace
+        self._type_nodes: dict[str, Any] = {}
+        self._checks: dict[tuple[str, bool], _ConstraintCheck | None] = {}
+        self._constants: dict[str, ar_element.ValueSpecification | None] = {}
+
+    def validate(self,
+                 value: ar_element.ValueSpecification | ar_element.ConstantSpecification,
+                 type_ref: TypeRefArgType,
+                 element_ref: str | None = None) -> list[Violation]:
+        """
+        Validates value against data type.
+        For constants, element_ref defaults to the reference of the constant.
+        """
+        return self.validate_many([(value, type_ref, element_ref)])
+
+    def validate_many(self, items: Iterable[tuple]) -> list[Violation]:
+        """
+        Validates many values at once.
+        Each item is a tuple holding the arguments of validate, (value, type_ref) or (value, type_ref, element_ref).
+        Violations are returned in order of items.
+        """
+        buckets: dict[_ConstraintCheck, _Bucket] = {}
+        entries = []
+        for item_index, item in enumerate(items):
+            value, type_ref = item[0], item[1]
+            element_ref = item[2] if len(item) > 2 else None
+            if isinstance(value, ar_element.ConstantSpecification):
+                if element_ref is None:
+                    ref = value.ref()
+                    element_ref = None if ref is None else str(ref)
+                value = value.value
+            node = self._get_type_node(type_ref)
+            entries.append((value, node, element_ref))
+            if value is not None:
+                self._flatten(value, node, buckets, item_index, None, 0)
+        found = []
+        for check, bucket in buckets.items():
+            for position, interval, is_invalid_scale in check.check(bucket.values):
+                item_index, container, index = bucket.locate(position)
+                found.append((item_index, container, index, bucket.values[position], check.ref_str, interval,
+                              is_invalid_scale))
+        found.sort(key=lambda x: x[0])
+        violations = []
+        prefixes: dict[int, tuple[str, list[str] | None]] = {}
+        prefix_item = -1
+        for item_index, container, index, value, ref_str, interval, is_invalid_scale in found:
+            root_value, node, element_ref = entries[item_index]
+            if container is None:
+                path = ""
+            else:
+                if item_index != prefix_item:
+                    prefixes = {}
+                    self._collect_prefixes(root_value, node, "", prefixes)
+                    prefix_item = item_index
+                prefix, names = prefixes[id(container)]
+                path = prefix + (f"[{index}]" if names is None else f".{names[index]}")
+            violations.append(Violation(element_ref, path, value, ref_str, interval[0], interval[2], is_invalid_scale))
+        return violations
+
+    def clear(self) -> None:
+        """
+        Removes all cached data types, constraints and constants
+        """
+        self._type_nodes.clear()
+        self._checks.clear()
+        self._constants.clear()
+
+    def _flatten(self, value: ar_element.ValueSpecification, node: Any, buckets: dict[_ConstraintCheck, _Bucket],
+                 item_index: int, container: Any, index: int) -> None:
+        if isinstance(value, ar_element.ConstantReference):
+            value = self._resolve_constant(value)
+            if value is None:
+                return
+        if isinstance(node, _ScalarNode):
+            check = node.check
+            if check is None:
+                return
+            if isinstance(value, ar_element.NumericalValueSpecification):
+                if value.value.__class__ in _NUMBER_TYPES:
+                    self._get_bucket(buckets, check).add((value.value,), item_index, container, index)
+            elif isinstance(value, ar_element.ApplicationValueSpecification):
+                if value.sw_value_cont is not None and value.sw_value_cont.sw_values_phys is not None:
+                    self._flatten_sw_values(value.sw_value_cont.sw_values_phys, self._get_bucket(buckets, check),
+                                            item_index)
+        elif isinstance(node, _ArrayNode):
+            if not isinstance(value, ar_element.ArrayValueSpecification):
+                return
+            elements = value.elements
+            element_node = node.element
+            if isinstance(element_node, _ScalarNode):
+                if element_node.check is None:
+                    return
+                numbers = [elem.value for elem in elements if elem.__class__ is ar_element.NumericalValueSpecification]
+                numbers = [number for number in numbers if number.__class__ in _NUMBER_TYPES]
+                if len(numbers) == len(elements):
+                    self._get_bucket(buckets, element_node.check).add(numbers, item_index, value, 0)
+                    return
+            for i, elem in enumerate(elements):
+                self._flatten(elem, element_node, buckets, item_index, value, i)
+        elif isinstance(node, _RecordNode):
+            if not isinstance(value, ar_element.RecordValueSpecification):
+                return
+            for i, (field, field_node) in enumerate(zip(value.fields, node.fields)):
+                self._flatten(field, field_node, buckets, item_index, value, i)
+
+    def _flatten_sw_values(self, sw_values: ar_element.SwValues, bucket: _Bucket, item_index: int) -> None:
+        values = sw_values.values
+        if sw_values.is_array() or all(x.__class__ in _NUMBER_TYPES for x in values):
+            bucket.add(values, item_index, sw_values, 0)
+            return
+        for i, value in enumerate(values):
+            if isinstance(value, ar_element.ValueGroup):
+                self._flatten_sw_values(value, bucket, item_index)
+                continue
+            if isinstance(value, ar_element.NumericalValue):
+                value = value.value
+            if value.__class__ in _NUMBER_TYPES:
+                bucket.add((value,), item_index, sw_values, i)
+
+    def _get_bucket(self, buckets: dict[_ConstraintCheck, _Bucket], check: _ConstraintCheck) -> _Bucket:
+        bucket = buckets.get(check, None)
+        if bucket is None:
+            bucket = buckets[check] = _Bucket()
+        return bucket
+
+    def _collect_prefixes(self, value: Any, node: Any, prefix: str,
+                          prefixes: dict[int, tuple[str, list[str] | None]]) -> None:
+        """
+        Maps containers of a value tree to their path
+        """
+        if isinstance(value, ar_element.ConstantReference):
+            value = self._resolve_constant(value)
+        if isinstance(value, ar_element.ArrayValueSpecification) and isinstance(node, _ArrayNode):
+            prefixes[id(value)] = (prefix, None)
+            for i, elem in enumerate(value.elements):
+                self._collect_prefixes(elem, node.element, f"{prefix}[{i}]", prefixes)
+        elif isinstance(value, ar_element.RecordValueSpecification) and isinstance(node, _RecordNode):
+            prefixes[id(value)] = (prefix, node.names)
+            for name, field, field_node in zip(node.names, value.fields, node.fields):
+                self._collect_prefixes(field, field_node, f"{prefix}.{name}", prefixes)
+        elif isinstance(value, ar_element.ApplicationValueSpecification):
+            if value.sw_value_cont is not None and value.sw_value_cont.sw_values_phys is not None:
+                self._collect_sw_values_prefixes(value.sw_value_cont.sw_values_phys, prefix, prefixes)
+
+    def _collect_sw_values_prefixes(self, sw_values: ar_element.SwValues, prefix: str,
+                                    prefixes: dict[int, tuple[str, list[str] | None]]) -> None:
+        prefixes[id(sw_values)] = (prefix, None)
+        if not sw_values.is_array():
+            for i, value in enumerate(sw_values.values):
+                if isinstance(value, ar_element.ValueGroup):
+                    self._collect_sw_values_prefixes(value, f"{prefix}[{i}]", prefixes)
+
+    def _resolve_constant(self, value: ar_element.ConstantReference) -> ar_element.ValueSpecification | None:
+        if value.constant_ref is None:
+            return None
+        ref_str = str(value.constant_ref)
+        if ref_str not in self._constants:
+            constant = self.workspace.find(ref_str)
+            if not isinstance(constant, ar_element.ConstantSpecification):
+                raise KeyError(f"Reference doesn't point to a ConstantSpecification: '{ref_str}'")
+            self._constants[ref_str] = constant.value
+        return self._constants[ref_str]
+
+    def _get_type_node(self, type_ref: TypeRefArgType) -> Any:
+        if isinstance(type_ref, ar_element.AutosarDataType):
+            data_type = type_ref
+            ref = data_type.ref()
+            if ref is None:
+                return self._create_type_node(data_type)  # Not in a package, can't be cached
+            ref_str = str(ref)
+        else:
+            ref_str = str(type_ref)
+            data_type = None
+        node = self._type_nodes.get(ref_str, None)
+        if node is None:
+            if data_type is None:
+                data_type = self.workspace.find(ref_str)
+                if data_type is None:
+                    raise KeyError(f"Data type not found: '{ref_str}'")
+            node = self._type_nodes[ref_str] = self._create_type_node(data_type)
+        return node
+
+    def _create_type_node(self, data_type: Any) -> Any:
+        if isinstance(data_type, ar_element.ApplicationArrayDataType):
+            if data_type.element is None or data_type.element.type_ref is None:
+                return _ScalarNode()
+            return _ArrayNode(self._get_type_node(data_type.element.type_ref))
+        if isinstance(data_type, ar_element.ApplicationRecordDataType):
+            # Elements without type are kept as unchecked nodes so that fields stay aligned with their elements
+            return _RecordNode([x.name for x in data_type.elements],
+                               [_ScalarNode() if x.type_ref is None else self._get_type_node(x.type_ref)
+                                for x in data_type.elements])
+        if isinstance(data_type, ar_element.ApplicationPrimitiveDataType):
+            return _ScalarNode(self._get_check(data_type.sw_data_def_props, True))
+        if isinstance(data_type, (ar_element.ImplementationDataType, ar_element.ImplementationDataTypeElement)):
+            return self._create_implementation_node(data_type)
+        return _ScalarNode()
+
+    def _create_implementation_node(self, data_type: _ImplementationType) -> Any:
+        category = data_type.category
+        if category == "ARRAY":
+            if not data_type.sub_elements:
+                return _ScalarNode()
+            return _ArrayNode(self._create_implementation_node(data_type.sub_elements[0]))
+        if category == "STRUCTURE":
+            return _RecordNode([x.name for x in data_type.sub_elements],
+                               [self._create_implementation_node(x) for x in data_type.sub_elements])
+        check = self._get_check(data_type.sw_data_def_props, False)
+        if category == "TYPE_REFERENCE" and check is None:
+            props = _get_first_variant(data_type.sw_data_def_props)
+            if props is not None and props.impl_data_type_ref is not None:
+                return self._get_type_node(props.impl_data_type_ref)
+        return _ScalarNode(check)
+
+    def _get_check(self, sw_data_def_props: ar_element.SwDataDefProps | None,
+                   physical: bool) -> _ConstraintCheck | None:
+        props = _get_first_variant(sw_data_def_props)
+        if props is None or props.data_constraint_ref is None:
+            return None
+        ref_str = str(props.data_constraint_ref)
+        key = (ref_str, physical)
+        if key not in self._checks:
+            constraint = self.workspace.find(ref_str)
+            if not isinstance(constraint, ar_element.DataConstraint):
+                raise KeyError(f"Reference doesn't point to a DataConstraint: '{ref_str}'")
+            check = _ConstraintCheck(ref_str, constraint, physical)
+            self._checks[key] = None if check.is_empty else check
+        return self._checks[key]
+
+
+def _get_first_variant(sw_data_def_props: ar_element.SwDataDefProps | None
+                       ) -> ar_element.SwDataDefPropsConditional | None:
+    if sw_data_def_props is None or len(sw_data_def_props) == 0:
+        return None
+    return sw_data_def_props[0]
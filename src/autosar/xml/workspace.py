@@ -3,12 +3,18 @@ AUTOSAR XML Workspace
 """
 import posixpath
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 import autosar.base as ar_base
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
 import autosar.xml.template as ar_template
+import autosar.xml.compression as ar_compression
 import autosar.xml.document as ar_document
+import autosar.xml.exception as ar_exception
+from autosar.xml.cache import DocumentCache
+from autosar.xml.reader import Reader
 from autosar.xml.writer import Writer
 try:
     import tomllib
@@ -54,6 +60,57 @@ class PackageToDocumentMapping:
                 self.suffix_filters.append(suffix_filter)
 
 
+class DocumentReport:
+    """
+    Timing information about a document that was read from or written to file
+    """
+
+    def __init__(self, file_path: str, elapsed: float, size: int | None = None, skipped: bool = False) -> None:
+        self.file_path = file_path
+        self.elapsed = elapsed  # Time in seconds
+        self.size = size  # File size in bytes (only set for written documents)
+        self.skipped = skipped  # True when an unchanged file wasn't written
+
+
+def _read_document(file_path: str,
+                   stop_on_error: bool,
+                   cache: DocumentCache | None = None) -> tuple[ar_document.Document, float]:
+    """
+    Reads a single document, returning it together with elapsed time.
+    Runs in worker processes when documents are loaded in parallel.
+    """
+    start_time = time.perf_counter()
+    document = Reader(cache=cache).read_file(file_path, stop_on_error)
+    return document, time.perf_counter() - start_time
+
+
+_worker_writer: Writer | None = None  # Writer used by current worker process
+
+
+def _init_write_worker() -> None:
+    """
+    Creates one writer per worker process
+    """
+    global _worker_writer  # pylint: disable=global-statement
+    _worker_writer = Writer()
+
+
+def _write_document(document: ar_document.Document,
+                    file_path: str,
+                    skip_unchanged: bool,
+                    writer: Writer | None = None) -> DocumentReport:
+    """
+    Writes a single document to file, returning a report with elapsed time and file size.
+    Runs in worker processes when documents are written in parallel.
+    """
+    if writer is None:
+        writer = _worker_writer
+    start_time = time.perf_counter()
+    written = writer.write_file(document, file_path, skip_unchanged)
+    elapsed = time.perf_counter() - start_time
+    return DocumentReport(file_path, elapsed, os.path.getsize(file_path), not written)
+
+
 class Namespace:
     """
     Namespace
@@ -191,15 +248,92 @@ class Workspace(ar_element.PackageCollection):
         """
         self.document_root = directory
 
-    def write_documents(self, schema_version=ar_base.DEFAULT_SCHEMA_VERSION) -> None:
+    def write_documents(self,
+                        schema_version=ar_base.DEFAULT_SCHEMA_VERSION,
+                        workers: int | None = None,
+                        skip_unchanged: bool = False,
+                        compression: str | None = None) -> list[DocumentReport]:
         """
         Writes all documents to file system
+
+        When workers is greater than 1, documents are serialized in that many worker processes,
+        each using its own writer. The written files are identical to the ones written serially.
+        When skip_unchanged is True, files whose content wouldn't change are left untouched.
+        Use compression "gzip" or "xz" to write compressed files. The matching suffix (".gz" or ".xz")
+        is appended to each file name.
+        Returns a report with write time and file size for each file.
+        Use the skipped attribute of each report to find out which files weren't written.
         """
-        writer = Writer()
+        suffix = "" if compression is None else ar_compression.get_suffix(compression)
+        jobs: list[tuple[ar_document.Document, str]] = []
         for document_config in self.documents:
-            self._write_document_from_config(writer, schema_version, document_config)
+            jobs.append(self._create_document_from_document_config(schema_version, document_config))
         for package_document_mapping in self.document_mappings:
-            self._gen_package_to_document_mapping(writer, schema_version, package_document_mapping)
+            jobs.extend(self._gen_package_to_document_mapping(schema_version, package_document_mapping))
+        if suffix:
+            jobs = [(document, file_path + suffix) for document, file_path in jobs]
+        if workers is not None and workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_write_worker) as executor:
+                return list(executor.map(_write_document, *zip(*jobs), [skip_unchanged] * len(jobs)))
+        writer = Writer()
+        return [_write_document(document, file_path, skip_unchanged, writer) for document, file_path in jobs]
+
+    def load_documents(self,
+                       file_paths: list[str],
+                       workers: int | None = None,
+                       stop_on_error: bool = False,
+                       cache: DocumentCache | None = None) -> list[DocumentReport]:
+        """
+        Reads ARXML documents from file and merges their packages into this workspace.
+
+        When workers is greater than 1, files are parsed in that many worker processes.
+        Documents are always merged in the same order as given in file_paths.
+        Use cache to load unchanged files from a DocumentCache instead of parsing them.
+        Returns a report with parse time for each file.
+        """
+        reports = []
+        if workers is not None and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_read_document, file_paths, [stop_on_error] * len(file_paths),
+                                       [cache] * len(file_paths))
+                for file_path, (document, elapsed) in zip(file_paths, results):
+                    self.merge_document(document)
+                    reports.append(DocumentReport(file_path, elapsed))
+        else:
+            for file_path in file_paths:
+                document, elapsed = _read_document(file_path, stop_on_error, cache)
+                self.merge_document(document)
+                reports.append(DocumentReport(file_path, elapsed))
+        return reports
+
+    def merge_document(self, document: ar_document.Document) -> None:
+        """
+        Moves packages from document into this workspace.
+        Packages that already exists in the workspace are merged element by element.
+        Raises DuplicateElement if an element with same name already exists.
+        """
+        for package in list(document.packages):
+            existing_package = self.find(package.name)
+            if existing_package is None:
+                self.append(package)
+            else:
+                self._merge_package(existing_package, package)
+
+    def _merge_package(self, target: ar_element.Package, source: ar_element.Package) -> None:
+        """
+        Recursively moves elements and sub-packages from source package into target package
+        """
+        for element in source.elements:
+            target.append(element)
+        for sub_package in source.packages:
+            existing_package = target.find(sub_package.name)
+            if isinstance(existing_package, ar_element.Package):
+                self._merge_package(existing_package, sub_package)
+            elif existing_package is None:
+                target.append(sub_package)
+            else:
+                raise ar_exception.DuplicateElement(
+                    f"Element with SHORT-NAME '{sub_package.name}' already exists in package '{target.name}'")
 
     def load_config(self, file_path: str) -> None:
         """
@@ -223,10 +357,9 @@ class Workspace(ar_element.PackageCollection):
             if behavior_settings is not None:
                 self.behavior_settings.update(behavior_settings)
 
-    def _write_document_from_config(self,
-                                    writer: Writer,
-                                    schema_version: int,
-                                    document_config: DocumentConfig) -> None:
+    def _create_document_from_document_config(self,
+                                              schema_version: int,
+                                              document_config: DocumentConfig) -> tuple[ar_document.Document, str]:
         document = document_config.document
         file_path = document_config.file_path
         package_refs = document_config.package_refs
@@ -239,12 +372,12 @@ class Workspace(ar_element.PackageCollection):
             document.append(package)
         if self.document_root is not None:
             file_path = os.path.join(self.document_root, file_path)
-        writer.write_file(document, file_path)
+        return document, file_path
 
     def _gen_package_to_document_mapping(self,
-                                         writer: Writer,
                                          schema_version: int,
-                                         mapping: PackageToDocumentMapping) -> None:
+                                         mapping: PackageToDocumentMapping) -> list[tuple[ar_document.Document, str]]:
+        result = []
         package = self.find(mapping.package_ref)
         if package is not None:
             if not isinstance(package, ar_element.Package):
@@ -273,7 +406,8 @@ class Workspace(ar_element.PackageCollection):
                     file_path = os.path.join(self.document_root, document_name)
                 else:
                     file_path = document_name
-                writer.write_file(document, file_path)
+                result.append((document, file_path))
+        return result
 
     def _create_namespace_from_config(self, name: str, config: dict):
         base_ref = None
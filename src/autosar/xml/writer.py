@@ -2,12 +2,15 @@
 ARXML writer module
 """
 # pylint: disable=consider-using-with, duplicate-code
+from array import array
 from io import StringIO
 from typing import TextIO
+import os
 import sys
 import math
 import decimal
 import autosar.base as ar_base
+import autosar.xml.compression as ar_compression
 import autosar.xml.document as ar_document
 import autosar.xml.element as ar_element
 import autosar.xml.enumeration as ar_enum
@@ -18,9 +21,12 @@ import autosar.xml.enumeration as ar_enum
 MultiLanguageOverviewParagraph = ar_element.MultiLanguageOverviewParagraph
 TupleList = list[tuple[str, str]]
 
+# Number of lines collected in memory before they are written to the underlying file
+DEFAULT_BUFFER_SIZE = 0x4000
+
 
 class _XMLWriter:
-    def __init__(self, indentation_step: int) -> None:
+    def __init__(self, indentation_step: int, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
         self.file_path: str = None
         self.fh: TextIO = None  # pylint: disable=invalid-name
         self.indentation_char: str = ' '
@@ -30,47 +36,92 @@ class _XMLWriter:
         self.indentation_str: str = ''
         self.tag_stack = []  # stack of tag names
         self.line_number: int = 0
+        self.buffer_size = max(buffer_size, 1)
+        self._buffer: list[str] = []  # output not yet written to self.fh
+        self._write = self._buffer.append
+        self._flush_line_number: int = 0  # line number that triggers next flush
+        self._newline_str: str = '\n'  # newline followed by current indentation
+        # (indentation_str, newline_str) per indentation level
+        self._indentation_cache: list[tuple[str, str]] = [('', '\n')]
 
     def _str_open(self):
         self.fh = StringIO()
-        self.line_number = 1
-        self.indentation_level = 0
-        self.indentation_str = ''
-        self.tag_stack.clear()
+        self._reset()
 
     def _open(self, file_path: str):
-        self.fh = open(file_path, 'w', encoding='utf-8')
+        self.fh = ar_compression.open_file(file_path, 'wt', encoding='utf-8')
         self.file_path = file_path
+        self._reset()
+
+    def _reset(self):
         self.line_number = 1
         self.indentation_level = 0
         self.indentation_str = ''
+        self._newline_str = '\n'
         self.tag_stack.clear()
+        self._buffer.clear()
+        self._flush_line_number = self.line_number + self.buffer_size
 
     def _close(self):
+        self._flush()
         self.fh.close()
 
+    def _getvalue(self) -> str:
+        self._flush()
+        return self.fh.getvalue()
+
+    def _flush(self):
+        """
+        Writes buffered output to file
+        """
+        if self._buffer:
+            self.fh.write(''.join(self._buffer))
+            self._buffer.clear()
+        self._flush_line_number = self.line_number + self.buffer_size
+
+    def _get_indentation(self, level: int) -> tuple[str, str]:
+        cache = self._indentation_cache
+        while len(cache) <= level:
+            indentation_str = self.indentation_char * (len(cache) * self.indentation_step)
+            cache.append((indentation_str, '\n' + indentation_str))
+        return cache[level]
+
     def _indent(self):
         self.indentation_level += 1
-        self.indentation_str = self.indentation_char * \
-            (self.indentation_level * self.indentation_step)
+        if self.indentation_level < len(self._indentation_cache):
+            self.indentation_str, self._newline_str = self._indentation_cache[self.indentation_level]
+        else:
+            self.indentation_str, self._newline_str = self._get_indentation(self.indentation_level)
 
     def _dedent(self):
         self.indentation_level -= 1
-        if self.indentation_level == 0:
-            self.indentation_str = ''
-        else:
-            self.indentation_str = self.indentation_char * \
-                (self.indentation_level * self.indentation_step)
+        self.indentation_str, self._newline_str = self._indentation_cache[self.indentation_level]
 
     def _add_line(self, text):
         if self.line_number > 1:
-            self.fh.write('\n')
+            self._write(self._newline_str + text)
+        else:
+            self._write(self.indentation_str + text)
         self.line_number += 1
-        self.fh.write(self.indentation_str)
-        self.fh.write(text)
+        if self.line_number >= self._flush_line_number:
+            self._flush()
+
+    def _add_lines(self, lines: list[str]):
+        """
+        Same as calling _add_line for each item in lines
+        """
+        if not lines:
+            return
+        if self.line_number > 1:
+            self._write(self._newline_str + self._newline_str.join(lines))
+        else:
+            self._write(self.indentation_str + self._newline_str.join(lines))
+        self.line_number += len(lines)
+        if self.line_number >= self._flush_line_number:
+            self._flush()
 
     def _add_inline_text(self, text):
-        self.fh.write(text)
+        self._write(text)
 
     def _add_child(self, tag: str, attr: TupleList = None):
         if attr:
@@ -86,19 +137,13 @@ class _XMLWriter:
         self._add_line(f'</{tag}>')
 
     def _begin_line(self, tag: str, attr: None | TupleList = None):
-        if self.line_number > 1:
-            self.fh.write('\n')
-        self.line_number += 1
-        self.fh.write(self.indentation_str)
         if attr is None or len(attr) == 0:
-            text = f'<{tag}>'
+            self._add_line(f'<{tag}>')
         else:
-            text = f'<{tag} {self._attr_to_str(attr)}>'
-        self._add_inline_text(text)
+            self._add_line(f'<{tag} {self._attr_to_str(attr)}>')
 
     def _end_line(self, tag: str):
-        text = f'</{tag}>'
-        self.fh.write(text)
+        self._write(f'</{tag}>')
 
     def _add_content(self, tag: str, content: str = '', attr: TupleList = None, inline: bool = False):
         assert isinstance(content, str)
@@ -121,14 +166,29 @@ class _XMLWriter:
         """
         Converts pairs (2-tuples) into attribute XML string
         """
-        parts = [f'{elem[0]}="{elem[1]}"' for elem in attr]
-        return ' '.join(parts)
+        return ' '.join([f'{name}="{value}"' for name, value in attr])
 
     def _format_float(self, value: float) -> str:
         """
         Formats a float into a printable number string.
         The fractional part will automatically be stripped if possible
         """
+        if isinstance(value, float):
+            # Fast path, gives the same result as _format_float_decimal
+            if value.is_integer():
+                if -1e16 < value < 1e16 and (value != 0.0 or math.copysign(1.0, value) > 0.0):
+                    return str(int(value))
+            elif math.isfinite(value):
+                text = repr(value)
+                if 'e' not in text:
+                    return text
+        return self._format_float_decimal(value)
+
+    def _format_float_decimal(self, value: float) -> str:
+        """
+        Formats a float into a printable number string using the decimal module.
+        Handles all cases the fast path in _format_float doesn't.
+        """
         if math.isinf(value):
             return '-INF' if value < 0 else 'INF'
         if math.isnan(value):
@@ -183,8 +243,9 @@ class Writer(_XMLWriter):
     """
 
     def __init__(self,
-                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION) -> None:
-        super().__init__(indentation_step=2)
+                 schema_version: int = ar_base.DEFAULT_SCHEMA_VERSION,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        super().__init__(indentation_step=2, buffer_size=buffer_size)
         self.schema_version = schema_version
 
         # Elements found in AR:PACKAGE
@@ -404,15 +465,45 @@ class Writer(_XMLWriter):
         """
         self._str_open()
         self._write_document(document, skip_root_attr)
-        return self.fh.getvalue()
+        return self._getvalue()
 
-    def write_file(self, document: ar_document.Document, file_path: str):
+    def write_file(self, document: ar_document.Document, file_path: str, skip_unchanged: bool = False) -> bool:
         """
         Serialized the document to file
-        """
+
+        Files with suffix ".gz" (gzip) or ".xz" are written compressed.
+        When skip_unchanged is True, the document is first serialized in memory and the file
+        is only written if its current content differs. This keeps the file modification time
+        of unchanged files intact.
+        Returns False if writing was skipped, otherwise True.
+        """
+        if skip_unchanged:
+            text = self.write_str(document, skip_root_attr=False)
+            if os.linesep != '\n':
+                text = text.replace('\n', os.linesep)  # Same newline translation as text mode
+            data = text.encode('utf-8')
+            if self._file_content_equals(file_path, data):
+                return False
+            with ar_compression.open_file(file_path, 'wb') as fh:  # pylint: disable=invalid-name
+                fh.write(data)
+            return True
         self._open(file_path)
         self._write_document(document)
         self._close()
+        return True
+
+    def _file_content_equals(self, file_path: str, data: bytes) -> bool:
+        """
+        Returns True if file exists and its content equals data.
+        Compressed files are compared by their uncompressed content.
+        """
+        try:
+            if not ar_compression.is_compressed(file_path) and os.path.getsize(file_path) != len(data):
+                return False
+            with ar_compression.open_file(file_path, 'rb') as fh:  # pylint: disable=invalid-name
+                return fh.read() == data
+        except ar_compression.READ_ERRORS:
+            return False
 
     def write_str_elem(self, elem: ar_element.ARObject, tag: str | None = None):
         """
@@ -429,7 +520,7 @@ class Writer(_XMLWriter):
         else:
             raise NotImplementedError(
                 f"Found no writer for class {class_name}")
-        return self.fh.getvalue()
+        return self._getvalue()
 
     def write_file_elem(self, elem: ar_element.ARElement, file_path: str):
         """
@@ -2691,6 +2782,9 @@ class Writer(_XMLWriter):
         Writes group AR:SW-VALUES (also used part of AR:VALUE-GROUP)
         Type: abstract
         """
+        if elem.is_array():
+            self._write_sw_values_array(elem.values)
+            return
         for value in elem.values:
             if isinstance(value, str):
                 self._add_content("VT", value)
@@ -2701,6 +2795,16 @@ class Writer(_XMLWriter):
             else:
                 raise NotImplementedError(str(type(value)))
 
+    def _write_sw_values_array(self, values: array) -> None:
+        """
+        Writes array-based values as V elements
+        """
+        if values.typecode in ('f', 'd'):
+            format_float = self._format_float
+            self._add_lines([f'<V>{format_float(value)}</V>' for value in values])
+        else:
+            self._add_lines([f'<V>{value}</V>' for value in values])
+
     def _write_value_group(self, elem: ar_element.ValueGroup, tag: str) -> None:
         """
         Writes complex-type AR:VALUE-GROUP
@@ -0,0 +1,128 @@
+"""Unit tests for DocumentCache"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.document as ar_document # noqa E402
+import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml  # noqa E402
+
+
+class DocumentCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_document(self, file_name: str, element_names: list[str]) -> str:
+        document = ar_document.Document()
+        package = document.create_package("DataTypes")
+        for name in element_names:
+            package.append(ar_element.SwBaseType(name, size=8))
+        file_path = os.path.join(self.tmp_dir.name, file_name)
+        autosar.xml.Writer().write_file(document, file_path)
+        return file_path
+
+    def test_cache_hit(self):
+        file_path = self.write_document("BaseTypes.arxml", ["uint8", "uint16"])
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        reader = autosar.xml.Reader(cache=cache)
+        document1 = reader.read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        document2 = reader.read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNot(document2, document1)
+        writer = autosar.xml.Writer()
+        self.assertEqual(writer.write_str(document2), writer.write_str(document1))
+        elem = document2.find("/DataTypes/uint16")
+        self.assertIsInstance(elem, ar_element.SwBaseType)
+        self.assertEqual(str(elem.ref()), "/DataTypes/uint16")
+
+    def test_modified_file_is_read_again(self):
+        file_path = self.write_document("BaseTypes.arxml", ["uint8"])
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        reader = autosar.xml.Reader(cache=cache)
+        reader.read_file(file_path)
+        stat = os.stat(file_path)
+        self.write_document("BaseTypes.arxml", ["uint9"])
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        document = reader.read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertIsNotNone(document.find("/DataTypes/uint9"))
+
+    def test_touched_file_is_loaded_from_cache(self):
+        file_path = self.write_document("BaseTypes.arxml", ["uint8"])
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        reader = autosar.xml.Reader(cache=cache)
+        reader.read_file(file_path)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        document = reader.read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(document.find("/DataTypes/uint8"))
+
+    def test_reader_options_use_separate_entries(self):
+        file_path = self.write_document("BaseTypes.arxml", ["uint8"])
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        autosar.xml.Reader(cache=cache).read_file(file_path)
+        autosar.xml.Reader(cache=cache, sw_values_as_arrays=True).read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        autosar.xml.Reader(cache=cache, sw_values_as_arrays=True).read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        autosar.xml.Reader(cache=cache, include_packages=["/DataTypes"]).read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        file_paths = [self.write_document(f"BaseTypes{i}.arxml", ["uint8"]) for i in range(3)]
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        reader = autosar.xml.Reader(cache=cache)
+        for file_path in file_paths:
+            reader.read_file(file_path)
+        entry_paths = [cache._entry_path(x) for x in file_paths]
+        for i, entry_path in enumerate(entry_paths):
+            os.utime(entry_path, ns=(i * 1000000000, i * 1000000000))
+        cache.max_size = os.path.getsize(entry_paths[1]) + os.path.getsize(entry_paths[2])
+        cache.evict()
+        self.assertEqual([os.path.exists(x) for x in entry_paths], [False, True, True])
+
+    def test_evict_skips_removed_entry(self):
+        file_path = self.write_document("BaseTypes.arxml", ["uint8"])
+        cache = autosar.xml.DocumentCache(self.cache_dir)
+        autosar.xml.Reader(cache=cache).read_file(file_path)
+        removed_path = os.path.join(self.cache_dir, "removed" + autosar.xml.cache.CACHE_FILE_SUFFIX)
+        try:
+            os.symlink(os.path.join(self.cache_dir, "missing"), removed_path)
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links not supported")
+        cache.max_size = 0
+        cache.evict()
+        self.assertFalse(os.path.exists(cache._entry_path(file_path)))
+
+    def test_entry_removed_during_load_is_returned(self):
+
+        class RemovingCache(autosar.xml.DocumentCache):
+
+            def _load_document(self, fh):
+                document = super()._load_document(fh)
+                fh.close()
+                os.remove(fh.name)
+                return document
+
+        file_path = self.write_document("BaseTypes.arxml", ["uint8"])
+        cache = RemovingCache(self.cache_dir)
+        reader = autosar.xml.Reader(cache=cache)
+        reader.read_file(file_path)
+        document = reader.read_file(file_path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(document.find("/DataTypes/uint8"))
+        self.assertFalse(os.path.exists(cache._entry_path(file_path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
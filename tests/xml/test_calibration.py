@@ -2,8 +2,10 @@
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 import os
+import random
 import sys
 import unittest
+from array import array
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 import autosar.xml.enumeration as ar_enum # noqa E402
 import autosar.xml.element as ar_element # noqa E402
@@ -165,6 +167,101 @@ class TestSwValues(unittest.TestCase): # noqa D101
         self.assertEqual(child.values, [1, 2, "Value"])
 
 
+class TestSwValuesArray(unittest.TestCase):
+
+    def test_read_write_int_array(self):
+        element = ar_element.SwValues(values=array('q', [1, -2, 3]))
+        writer = autosar.xml.Writer()
+        xml = '''<SW-VALUES-PHYS>
+  <V>1</V>
+  <V>-2</V>
+  <V>3</V>
+</SW-VALUES-PHYS>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+        reader = autosar.xml.Reader(sw_values_as_arrays=True)
+        elem: ar_element.SwValues = reader.read_str_elem(xml)
+        self.assertTrue(elem.is_array())
+        self.assertEqual(elem.values, array('q', [1, -2, 3]))
+
+    def test_read_write_float_array(self):
+        element = ar_element.SwValues(values=array('d', [1.5, 2.0, -0.25]))
+        writer = autosar.xml.Writer()
+        xml = '''<SW-VALUES-PHYS>
+  <V>1.5</V>
+  <V>2</V>
+  <V>-0.25</V>
+</SW-VALUES-PHYS>'''
+        self.assertEqual(writer.write_str_elem(element), xml)
+        reader = autosar.xml.Reader(sw_values_as_arrays=True)
+        elem: ar_element.SwValues = reader.read_str_elem(xml.replace("<V>2</V>", "<V>2.0</V>"))
+        self.assertEqual(elem.values, array('d', [1.5, 2.0, -0.25]))
+        # A list is kept when integers and floats are mixed, as in the original XML
+        elem = reader.read_str_elem(xml)
+        self.assertFalse(elem.is_array())
+        self.assertEqual(elem.values, [1.5, 2, -0.25])
+
+    def test_values_with_format_are_not_stored_in_array(self):
+        reader = autosar.xml.Reader(sw_values_as_arrays=True)
+        for content in ['<V>1</V><V>0x10</V>', '<V>1.5</V><V>1e-05</V>', '<V>1</V><VT>Text</VT>']:
+            elem: ar_element.SwValues = reader.read_str_elem(f'<SW-VALUES-PHYS>{content}</SW-VALUES-PHYS>')
+            self.assertFalse(elem.is_array())
+            self.assertEqual(len(elem.values), 2)
+
+    def test_array_gives_same_xml_as_list(self):
+        rng = random.Random(0)
+        writer = autosar.xml.Writer()
+        for values in ([rng.randint(-2**40, 2**40) for _ in range(200)],
+                       [rng.uniform(-1000.0, 1000.0) for _ in range(200)],
+                       [float(rng.randint(-100, 100)) / 8 for _ in range(200)]):
+            typecode = 'q' if isinstance(values[0], int) else 'd'
+            xml = writer.write_str_elem(ar_element.SwValues(values=values))
+            self.assertEqual(writer.write_str_elem(ar_element.SwValues(values=array(typecode, values))), xml)
+            reader = autosar.xml.Reader(sw_values_as_arrays=True)
+            elem: ar_element.SwValues = reader.read_str_elem(xml)
+            self.assertEqual(list(elem.values), autosar.xml.Reader().read_str_elem(xml).values)
+
+    def test_edge_values_give_same_result_as_list(self):
+        writer = autosar.xml.Writer()
+        array_reader = autosar.xml.Reader(sw_values_as_arrays=True)
+        list_reader = autosar.xml.Reader()
+        for texts in (["18446744073709551615", "1"], ["-9223372036854775809", "1"], ["-0", "1.5"], ["-0", "1"],
+                      ["-0.0", "1.5"], ["007", "1.5"], ["1", "2.5"], ["inf", "1.5"], [".5", "1."]):
+            xml = "<SW-VALUES-PHYS>" + "".join(f"<V>{x}</V>" for x in texts) + "</SW-VALUES-PHYS>"
+            array_elem: ar_element.SwValues = array_reader.read_str_elem(xml)
+            list_elem: ar_element.SwValues = list_reader.read_str_elem(xml)
+            self.assertEqual([(type(x), x) for x in array_elem.values],
+                             [(type(x), x) for x in list_elem.values], texts)
+            self.assertEqual(writer.write_str_elem(array_elem), writer.write_str_elem(list_elem), texts)
+        elem = array_reader.read_str_elem("<SW-VALUES-PHYS><V>18446744073709551615</V></SW-VALUES-PHYS>")
+        self.assertIn("<V>18446744073709551615</V>", writer.write_str_elem(elem))
+
+    def test_empty_array_is_empty(self):
+        element = ar_element.SwValues(values=array('d'))
+        self.assertTrue(element.is_empty)
+        self.assertEqual(autosar.xml.Writer().write_str_elem(element), "<SW-VALUES-PHYS/>")
+        element.append(1.5)
+        self.assertFalse(element.is_empty)
+
+    def test_append(self):
+        element = ar_element.SwValues(values=array('d'))
+        element.append(1)
+        element.append(2.5)
+        self.assertEqual(element.values, array('d', [1.0, 2.5]))
+        with self.assertRaises(TypeError):
+            element.append("Text")
+
+    def test_shape(self):
+        element = ar_element.SwValueCont(sw_array_size=ar_element.ValueList([2, 3]),
+                                         sw_values_phys=ar_element.SwValues(array('q', range(6))))
+        self.assertEqual(element.shape, (2, 3))
+        element = ar_element.SwAxisCont(sw_values_phys=ar_element.SwValues(array('q', range(4))))
+        self.assertEqual(element.shape, (4,))
+        element = ar_element.SwValueCont(sw_array_size=ar_element.ValueList([2, 2]),
+                                         sw_values_phys=ar_element.SwValues(array('q', range(6))))
+        with self.assertRaises(ValueError):
+            element.shape  # pylint: disable=pointless-statement
+
+
 class TestSwAxisCont(unittest.TestCase):
 
     def test_read_write_empty(self):
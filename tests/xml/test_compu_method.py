@@ -256,9 +256,59 @@ class TestComputation(unittest.TestCase): # noqa D101
         self.assertEqual(elem.compu_scales[0].content.denominator, (1,))
         self.assertEqual(elem.default_value.value, 65535)
 
+    def test_find_scale(self): # noqa D102
+        open_limit = ar_enum.IntervalType.OPEN
+        element = ar_element.Computation([ar_element.CompuScale(ar_element.CompuConst("Low"), 0, 10,
+                                                                upper_limit_type=open_limit),
+                                          ar_element.CompuScale(ar_element.CompuConst("High"), 10, 20,
+                                                                lower_limit_type=ar_enum.IntervalType.CLOSED)])
+        self.assertEqual(element.find_scale(9.9).content.value, "Low")
+        self.assertEqual(element.find_scale(10).content.value, "High")
+        self.assertIsNone(element.find_scale(20.5))
+        self.assertIsNone(element.find_scale(-1))
+        self.assertIs(element.find_scale_by_const("High"), element.compu_scales[1])
+        self.assertIsNone(element.find_scale_by_const("Unknown"))
+
+    def test_find_scale_after_append(self): # noqa D102
+        element = ar_element.Computation.make_value_table(["Off", "On"])
+        self.assertIsNone(element.find_scale(2))
+        element.append_compu_scale(ar_element.CompuScale(ar_element.CompuConst("Error"), 2, 255))
+        self.assertEqual(element.find_scale(200).content.value, "Error")
+        self.assertEqual(element.find_scale_by_const("Error").upper_limit, 255)
+        element.compu_scales.append(ar_element.CompuScale(ar_element.CompuConst("Init"), -1, -1))
+        self.assertEqual(element.find_scale(-1).content.value, "Init")
+        with self.assertRaises(TypeError):
+            element.append_compu_scale("Init")
+
+    def test_find_scale_keeps_is_empty(self): # noqa D102
+        element = ar_element.Computation()
+        self.assertTrue(element.is_empty)
+        self.assertIsNone(element.find_scale(3))
+        self.assertTrue(element.is_empty)
+        element = ar_element.Computation.make_value_table(["Off", "On"])
+        self.assertFalse(element.is_empty)
+
+    def test_find_scale_large_value_table(self): # noqa D102
+        element = ar_element.Computation.make_value_table([(i * 4, i * 4 + 2, f"Text{i}") for i in range(5000)])
+        for value in range(0, 20000, 7):
+            scale = element.find_scale(value)
+            if value % 4 == 3:
+                self.assertIsNone(scale)
+            else:
+                self.assertEqual(scale.content.value, f"Text{value // 4}")
+        self.assertEqual(element.find_scale_by_const("Text1234").lower_limit, 1234 * 4)
+
 
 class TestCompuMethod(unittest.TestCase): # noqa D101
 
+    def test_find_scale(self): # noqa D102
+        computation = ar_element.Computation.make_value_table(["Off", "On", (2, 254, "Reserved")])
+        element = ar_element.CompuMethod("OnOff_T", category="TEXTTABLE", int_to_phys=computation)
+        self.assertEqual(element.find_scale(100).content.value, "Reserved")
+        scale = element.find_scale_by_text("Reserved")
+        self.assertEqual((scale.lower_limit, scale.upper_limit), (2, 254))
+        self.assertIsNone(ar_element.CompuMethod("Identical").find_scale(1))
+
     def test_write_read_compumethod_boolean(self): # noqa D102
         computation = ar_element.Computation.make_value_table(["FALSE", "TRUE"], default_value="FALSE")
         element = ar_element.CompuMethod("boolean",
@@ -0,0 +1,150 @@
+"""Unit tests for CompuMethod conversion"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import math
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml  # noqa E402
+
+CLOSED = ar_enum.IntervalType.CLOSED
+OPEN = ar_enum.IntervalType.OPEN
+
+
+def make_linear_scale(factor, offset, lower_limit, upper_limit, lower_limit_type=CLOSED, upper_limit_type=CLOSED):
+    return ar_element.CompuScale(ar_element.CompuRational((offset, factor), (1,)), lower_limit, upper_limit,
+                                 lower_limit_type=lower_limit_type, upper_limit_type=upper_limit_type)
+
+
+def naive_convert(computation: ar_element.Computation, value):
+    """
+    Reference implementation, checks scales in order
+    """
+    for scale in computation.compu_scales:
+        lower = -math.inf if scale.lower_limit is None else scale.lower_limit
+        upper = math.inf if scale.upper_limit is None else scale.upper_limit
+        if value < lower or (scale.lower_limit_type == OPEN and value == lower):
+            continue
+        if value > upper or (scale.upper_limit_type == OPEN and value == upper):
+            continue
+        if isinstance(scale.content, ar_element.CompuConst):
+            return scale.content.value
+        numerator = sum(c * value ** i for i, c in enumerate(scale.content.numerator))
+        denominator = sum(c * value ** i for i, c in enumerate(scale.content.denominator))
+        return numerator / denominator
+    if computation.default_value is not None:
+        return computation.default_value.value
+    return None
+
+
+class TestCompuMethodConverter(unittest.TestCase):
+
+    def test_linear(self):
+        compu_method = ar_element.CompuMethod("Speed_T", category="LINEAR",
+                                              int_to_phys=ar_element.Computation.make_rational(0.5, -10))
+        converter = autosar.xml.CompuMethodConverter(compu_method)
+        self.assertEqual(converter.to_physical(100), 40.0)
+        self.assertEqual(converter.to_physical_many([0, 20, 100]), [-10.0, 0.0, 40.0])
+        self.assertEqual(converter.to_internal(40.0), 100.0)
+        self.assertEqual(converter.to_internal_many([-10.0, 0.0]), [0.0, 20.0])
+
+    def test_rational_function(self):
+        computation = ar_element.Computation([ar_element.CompuScale(ar_element.CompuRational((1, 0, 2), (2, 1)))])
+        converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("Rational_T", int_to_phys=computation))
+        self.assertEqual(converter.to_physical(2), 9 / 4)
+        with self.assertRaises(NotImplementedError):
+            converter.to_internal(1.0)
+
+    def test_scale_linear_with_open_limits(self):
+        computation = ar_element.Computation([make_linear_scale(1, 0, 0, 10, CLOSED, OPEN),
+                                              make_linear_scale(2, -10, 10, 20, CLOSED, CLOSED),
+                                              make_linear_scale(-1, 70, 20, 30, OPEN, CLOSED)],
+                                             default_value=-1)
+        converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("Scaled_T", int_to_phys=computation))
+        self.assertEqual(converter.to_physical_many([0, 9.5, 10, 20, 20.5, 30, 31, -1]),
+                         [0, 9.5, 10, 30, 49.5, 40, -1, -1])
+        self.assertEqual(converter.to_internal_many([5, 12, 30, 45, 40]), [5, 11, 20, 25, 30])
+        with self.assertRaises(ValueError):
+            converter.to_internal(100)
+
+    def test_texttable(self):
+        computation = ar_element.Computation.make_value_table(["Off", "On", (2, 254, "Reserved"), (255, "Error")])
+        converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("OnOff_T", category="TEXTTABLE",
+                                                                            int_to_phys=computation))
+        self.assertEqual(converter.to_physical_many([0, 1, 100, 255]), ["Off", "On", "Reserved", "Error"])
+        self.assertEqual(converter.to_internal_many(["Off", "On", "Reserved", "Error"]), [0, 1, 2, 255])
+        with self.assertRaises(ValueError):
+            converter.to_physical(256)
+        with self.assertRaises(ValueError):
+            converter.to_internal("Unknown")
+
+    def test_scale_linear_and_texttable(self):
+        computation = ar_element.Computation([make_linear_scale(0.1, 0, 0, 1000),
+                                              ar_element.CompuScale(ar_element.CompuConst("Error"), 0xFFFF, 0xFFFF,
+                                                                    inverse_value=0xFFFF)])
+        converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("Temperature_T",
+                                                                            int_to_phys=computation))
+        self.assertEqual(converter.to_physical_many([500, 0xFFFF]), [50.0, "Error"])
+        self.assertEqual(converter.to_internal_many([50.0, "Error"]), [500.0, 0xFFFF])
+
+    def test_explicit_phys_to_int(self):
+        compu_method = ar_element.CompuMethod("Speed_T",
+                                              int_to_phys=ar_element.Computation.make_rational(0.5),
+                                              phys_to_int=ar_element.Computation.make_rational(2, 1))
+        converter = autosar.xml.CompuMethodConverter(compu_method)
+        self.assertEqual(converter.to_internal(10), 21.0)
+
+    def test_identical(self):
+        converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("Identical", category="IDENTICAL"))
+        self.assertEqual(converter.to_physical_many([1, 2]), [1, 2])
+        self.assertEqual(converter.to_internal(3), 3)
+
+    def test_same_result_as_naive_search(self):
+        rng = random.Random(1)
+        for overlapping in (False, True):
+            scales = []
+            lower = 0
+            for i in range(200):
+                upper = lower + rng.randint(0, 5)
+                scale_lower = lower - rng.randint(0, 3) if overlapping else lower
+                if i % 2:
+                    scales.append(make_linear_scale(rng.choice([1, 2, -0.5]), rng.randint(-5, 5), scale_lower, upper,
+                                                    rng.choice([CLOSED, OPEN]), rng.choice([CLOSED, OPEN])))
+                else:
+                    scales.append(ar_element.CompuScale(ar_element.CompuConst(f"Text{i}"), scale_lower, upper,
+                                                        lower_limit_type=rng.choice([CLOSED, OPEN]),
+                                                        upper_limit_type=rng.choice([CLOSED, OPEN])))
+                lower = upper + rng.randint(0, 2)
+            rng.shuffle(scales)
+            computation = ar_element.Computation(scales, default_value="Default")
+            converter = autosar.xml.CompuMethodConverter(ar_element.CompuMethod("Random_T",
+                                                                                int_to_phys=computation))
+            values = [rng.randint(-10, lower + 10) + rng.choice([0, 0, 0.5]) for _ in range(2000)]
+            self.assertEqual(converter.to_physical_many(values), [naive_convert(computation, x) for x in values])
+
+
+class TestConverterCache(unittest.TestCase):
+
+    def test_get_by_reference(self):
+        workspace = autosar.xml.Workspace()
+        package = workspace.make_packages("CompuMethods")
+        compu_method = ar_element.CompuMethod("Speed_T", int_to_phys=ar_element.Computation.make_rational(0.5))
+        package.append(compu_method)
+        cache = autosar.xml.ConverterCache(workspace)
+        converter = cache.get("/CompuMethods/Speed_T")
+        self.assertIs(cache.get(compu_method.ref()), converter)
+        self.assertIs(cache.get(compu_method), converter)
+        self.assertEqual(cache.get_function("/CompuMethods/Speed_T")([2, 4]), [1.0, 2.0])
+        self.assertEqual(cache.get_function("/CompuMethods/Speed_T", to_physical=False)([1.0]), [2.0])
+        with self.assertRaises(KeyError):
+            cache.get("/CompuMethods/Unknown_T")
+        cache.clear()
+        self.assertIsNot(cache.get(compu_method), converter)
+
+
+if __name__ == '__main__':
+    unittest.main()
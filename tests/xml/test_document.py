@@ -3,7 +3,16 @@
 # pylint: disable=missing-class-docstring, missing-function-docstring
 import os
 import sys
+import contextlib
+import decimal
+import io
+import mmap
+import random
+import struct
+import tempfile
 import unittest
+import zipfile
+import lxml.etree
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 import autosar.xml.document as ar_document # noqa E402
 import autosar.xml.element as ar_element  # noqa E402
@@ -38,5 +47,559 @@ class DocumentTests(unittest.TestCase):
         self.assertEqual(impl_types_package.name, "ImplementationDataTypes")
 
 
+class NamespaceTests(unittest.TestCase):
+
+    def test_default_namespace_is_removed_before_parsing(self):
+        xml = '''<?xml version="1.0" encoding="utf-8"?>
+<AUTOSAR xsi:schemaLocation="http://autosar.org/schema/r4.0 AUTOSAR_00050.xsd" xmlns="http://autosar.org/schema/r4.0" \
+xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>DataTypes</SHORT-NAME>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+        reader = autosar.xml.Reader()
+        document = reader.read_str(xml)
+        self.assertEqual(reader.xml_root.tag, "AUTOSAR")
+        self.assertEqual(document.schema_version, 50)
+        self.assertIsInstance(document.find("/DataTypes"), ar_element.Package)
+
+    def test_prefixed_namespace(self):
+        xml = '''<?xml version="1.0" encoding="utf-8"?>
+<ar:AUTOSAR xmlns:ar="http://autosar.org/schema/r4.0">
+  <ar:AR-PACKAGES>
+    <ar:AR-PACKAGE>
+      <ar:SHORT-NAME>DataTypes</ar:SHORT-NAME>
+    </ar:AR-PACKAGE>
+  </ar:AR-PACKAGES>
+</ar:AUTOSAR>'''
+        reader = autosar.xml.Reader()
+        document = reader.read_str(xml)
+        self.assertEqual(reader.xml_root.tag, "AUTOSAR")
+        self.assertIsInstance(document.find("/DataTypes"), ar_element.Package)
+
+
+class UnprocessedElementTests(unittest.TestCase):
+
+    xml = '''<?xml version="1.0" encoding="utf-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>DataTypes</SHORT-NAME>
+      <UNKNOWN-1/>
+      <ELEMENTS>
+        <SW-BASE-TYPE>
+          <SHORT-NAME>uint8</SHORT-NAME>
+          <UNKNOWN-2/>
+        </SW-BASE-TYPE>
+        <UNKNOWN-3/>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+    def test_unprocessed_elements_are_tracked(self):
+        reader = autosar.xml.Reader(warn_on_unprocessed_element=False)
+        document = reader.read_str(self.xml)
+        self.assertIsInstance(document.find("/DataTypes/uint8"), ar_element.SwBaseType)
+        self.assertEqual(reader.observed_unsupported_elements, {"UNKNOWN-1", "UNKNOWN-2", "UNKNOWN-3"})
+
+    def test_tracking_disabled(self):
+        reader = autosar.xml.Reader(track_unprocessed_elements=False)
+        document = reader.read_str(self.xml)
+        self.assertIsInstance(document.find("/DataTypes/uint8"), ar_element.SwBaseType)
+        self.assertEqual(len(reader.observed_unsupported_elements), 0)
+
+
+class SkipDocumentationTests(unittest.TestCase):
+
+    xml = '''<?xml version="1.0" encoding="utf-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>DataTypes</SHORT-NAME>
+      <LONG-NAME><L-4 L="EN">Data types</L-4></LONG-NAME>
+      <ELEMENTS>
+        <SW-BASE-TYPE>
+          <SHORT-NAME>uint8</SHORT-NAME>
+          <LONG-NAME><L-4 L="EN">Unsigned 8-bit integer</L-4></LONG-NAME>
+          <DESC><L-2 L="EN">Description</L-2></DESC>
+          <CATEGORY>FIXED_LENGTH</CATEGORY>
+          <ADMIN-DATA><SDGS><SDG GID="Vendor"><SD GID="Key">Value</SD></SDG></SDGS></ADMIN-DATA>
+          <INTRODUCTION><P><L-1 L="EN">Introduction</L-1></P></INTRODUCTION>
+          <ANNOTATIONS><ANNOTATION><ANNOTATION-ORIGIN>Origin</ANNOTATION-ORIGIN></ANNOTATION></ANNOTATIONS>
+          <BASE-TYPE-SIZE>8</BASE-TYPE-SIZE>
+        </SW-BASE-TYPE>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+    def test_documentation_is_skipped(self):
+        reader = autosar.xml.Reader(skip_documentation=True)
+        document = reader.read_str(self.xml)
+        self.assertIsNone(document.find("/DataTypes").long_name)
+        elem: ar_element.SwBaseType = document.find("/DataTypes/uint8")
+        self.assertEqual(elem.category, "FIXED_LENGTH")
+        self.assertEqual(elem.size, 8)
+        for name in ("long_name", "desc", "admin_data", "introduction", "annotations"):
+            self.assertIsNone(getattr(elem, name))
+        self.assertEqual(len(reader.observed_unsupported_elements), 0)
+
+
+class StreamingReaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.tmp_dir.name, "document.arxml")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def create_document(self) -> ar_document.Document:
+        workspace = autosar.xml.Workspace()
+        base_types, impl_types = workspace.make_packages("DataTypes/BaseTypes",
+                                                         "DataTypes/ImplementationDataTypes")
+        workspace.make_packages("DataTypes/Empty")
+        base_type = ar_element.SwBaseType("uint8", size=8)
+        base_types.append(base_type)
+        for i in range(3):
+            sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+            impl_types.append(ar_element.ImplementationDataType(f"Type{i}",
+                                                                category="VALUE",
+                                                                sw_data_def_props=sw_data_def_props))
+        return ar_document.Document([workspace.find("/DataTypes")])
+
+    def test_streaming_read_gives_same_result(self):
+        writer = autosar.xml.Writer()
+        writer.write_file(self.create_document(), self.file_path)
+        reader = autosar.xml.Reader()
+        document1 = reader.read_file(self.file_path)
+        document2 = reader.read_file(self.file_path, streaming=True)
+        self.assertEqual(writer.write_str(document2), writer.write_str(document1))
+        self.assertEqual(document2.schema_version, document1.schema_version)
+        package: ar_element.Package = document2.find("/DataTypes")
+        self.assertEqual([x.name for x in package.packages], ["BaseTypes", "ImplementationDataTypes", "Empty"])
+        elem = document2.find("/DataTypes/ImplementationDataTypes/Type2")
+        self.assertIsInstance(elem, ar_element.ImplementationDataType)
+        self.assertEqual(str(elem.ref()), "/DataTypes/ImplementationDataTypes/Type2")
+
+    def test_streaming_read_of_empty_document(self):
+        writer = autosar.xml.Writer()
+        writer.write_file(ar_document.Document(), self.file_path)
+        reader = autosar.xml.Reader()
+        document = reader.read_file(self.file_path, streaming=True)
+        self.assertIsInstance(document, ar_document.Document)
+        self.assertEqual(len(document.packages), 0)
+
+
+class ReaderFilterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.tmp_dir.name, "document.arxml")
+        workspace = autosar.xml.Workspace()
+        base_types, impl_types, constants = workspace.make_packages("DataTypes/BaseTypes",
+                                                                    "DataTypes/ImplementationDataTypes",
+                                                                    "Constants")
+        base_type = ar_element.SwBaseType("uint8", size=8)
+        base_types.append(base_type)
+        sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+        impl_types.append(ar_element.ImplementationDataType("uint8", category="VALUE",
+                                                            sw_data_def_props=sw_data_def_props))
+        constants.append(ar_element.ConstantSpecification.make_constant("Zero", 0))
+        document = ar_document.Document([workspace.find("/DataTypes"), workspace.find("/Constants")])
+        autosar.xml.Writer().write_file(document, self.file_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_refs(self, **kwargs) -> list[list[str]]:
+        """
+        Reads file in normal and streaming mode, returning references of all packages and elements
+        """
+        result = []
+        for streaming in (False, True):
+            document = autosar.xml.Reader(**kwargs).read_file(self.file_path, streaming=streaming)
+            refs = []
+            packages = list(document.packages)
+            while packages:
+                package = packages.pop(0)
+                refs.append(str(package.ref()))
+                refs.extend(str(x.ref()) for x in package.elements)
+                packages.extend(package.packages)
+            result.append(sorted(refs))
+        return result
+
+    def test_include_packages(self):
+        expected = ["/DataTypes", "/DataTypes/BaseTypes", "/DataTypes/BaseTypes/uint8"]
+        self.assertEqual(self.read_refs(include_packages=["/DataTypes/BaseTypes"]), [expected, expected])
+        expected = ["/Constants", "/Constants/Zero"]
+        self.assertEqual(self.read_refs(include_packages=["/Constants", "/Unknown"]), [expected, expected])
+
+    def test_exclude_packages(self):
+        expected = ["/Constants", "/Constants/Zero", "/DataTypes", "/DataTypes/BaseTypes",
+                    "/DataTypes/BaseTypes/uint8"]
+        self.assertEqual(self.read_refs(exclude_packages=["/DataTypes/ImplementationDataTypes"]),
+                         [expected, expected])
+
+    def test_element_types(self):
+        expected = ["/Constants", "/DataTypes", "/DataTypes/BaseTypes", "/DataTypes/ImplementationDataTypes",
+                    "/DataTypes/ImplementationDataTypes/uint8"]
+        self.assertEqual(self.read_refs(element_types=[ar_element.AutosarDataType]), [expected, expected])
+        self.assertEqual(self.read_refs(element_types=["IMPLEMENTATION-DATA-TYPE"]), [expected, expected])
+        with self.assertRaises(ValueError):
+            autosar.xml.Reader(element_types=["AR-PACKAGE"])
+        with self.assertRaises(ValueError):
+            autosar.xml.Reader(element_types=[ar_element.Package])
+
+    def test_filtered_elements_are_not_unprocessed(self):
+        reader = autosar.xml.Reader(include_packages=["/Constants"], element_types=["CONSTANT-SPECIFICATION"])
+        reader.read_file(self.file_path)
+        self.assertEqual(len(reader.observed_unsupported_elements), 0)
+
+
+class LazyReaderTests(unittest.TestCase):
+
+    xml = '''<?xml version="1.0" encoding="utf-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0">
+  <AR-PACKAGES>
+    <!-- <AR-PACKAGE><SHORT-NAME>Comment</SHORT-NAME></AR-PACKAGE> -->
+    <AR-PACKAGE UUID="1234">
+      <SHORT-NAME>DataTypes</SHORT-NAME>
+      <ELEMENTS>
+        <SW-BASE-TYPE>
+          <SHORT-NAME>uint8</SHORT-NAME>
+          <BASE-TYPE-SIZE>8</BASE-TYPE-SIZE>
+        </SW-BASE-TYPE>
+        <UNKNOWN-ELEMENT><SHORT-NAME>Unknown</SHORT-NAME><UNKNOWN-ELEMENT/></UNKNOWN-ELEMENT>
+        <CONSTANT-SPECIFICATION>
+          <SHORT-NAME>Invalid</SHORT-NAME>
+          <VALUE-SPEC><NUMERICAL-VALUE-SPECIFICATION><VALUE>Eight</VALUE></NUMERICAL-VALUE-SPECIFICATION></VALUE-SPEC>
+        </CONSTANT-SPECIFICATION>
+        <SW-BASE-TYPE><SHORT-NAME>uint16</SHORT-NAME><BASE-TYPE-SIZE>16</BASE-TYPE-SIZE></SW-BASE-TYPE>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.tmp_dir.name, "document.arxml")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_xml(self) -> None:
+        with open(self.file_path, "w", encoding="utf-8") as fh:
+            fh.write(self.xml)
+
+    def test_lazy_read_gives_same_result(self):
+        workspace = autosar.xml.Workspace()
+        base_types, impl_types = workspace.make_packages("DataTypes/BaseTypes", "DataTypes/ImplementationDataTypes")
+        base_type = ar_element.SwBaseType("uint8", size=8)
+        base_types.append(base_type)
+        for i in range(3):
+            sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+            impl_types.append(ar_element.ImplementationDataType(f"Type{i}", category="VALUE",
+                                                                sw_data_def_props=sw_data_def_props))
+        writer = autosar.xml.Writer()
+        writer.write_file(ar_document.Document([workspace.find("/DataTypes")]), self.file_path)
+        reader = autosar.xml.Reader()
+        document1 = reader.read_file(self.file_path)
+        document2 = reader.read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document2.find("/DataTypes/ImplementationDataTypes")
+        self.assertEqual(package.lazy_count, 3)
+        self.assertEqual(writer.write_str(document2), writer.write_str(document1))
+        self.assertEqual(package.lazy_count, 0)
+        self.assertEqual(document2.schema_version, document1.schema_version)
+
+    def test_elements_are_converted_on_access(self):
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document.find("/DataTypes")
+        self.assertEqual(package.uuid, "1234")
+        self.assertEqual(package.lazy_count, 3)
+        elem = document.find("/DataTypes/uint16")
+        self.assertIsInstance(elem, ar_element.SwBaseType)
+        self.assertEqual(elem.size, 16)
+        self.assertEqual(str(elem.ref()), "/DataTypes/uint16")
+        self.assertIs(document.find("/DataTypes/uint16"), elem)
+        self.assertEqual(package.lazy_count, 2)
+        self.assertEqual([x.size for x in package.filter("uint8")], [8])
+        self.assertEqual(package.lazy_count, 1)
+        self.assertEqual(len(document.packages), 1)
+
+    def test_errors_are_raised_on_access(self):
+        self.write_xml()
+        reader = autosar.xml.Reader(warn_on_unprocessed_element=False)
+        document = reader.read_file(self.file_path, stop_on_error=True, lazy=True)
+        self.assertEqual(reader.observed_unsupported_elements, {"UNKNOWN-ELEMENT"})
+        with self.assertRaises(autosar.xml.exception.ParseError) as context:
+            document.find("/DataTypes/Invalid")
+        self.assertTrue(str(context.exception).startswith("document.arxml(13): "))
+        package: ar_element.Package = document.find("/DataTypes")
+        self.assertEqual([x.name for x in package.elements], ["uint8", "uint16"])
+
+    def test_invalid_element_is_removed_on_access(self):
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document.find("/DataTypes")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual([x.name for x in package.elements], ["uint8", "uint16"])
+        self.assertTrue(output.getvalue().startswith("document.arxml(13): "))
+        self.assertEqual(package.lazy_count, 0)
+        self.assertIsNone(document.find("/DataTypes/Invalid"))
+        self.assertIsInstance(document.find("/DataTypes/uint16"), ar_element.SwBaseType)
+        self.assertIn("<SHORT-NAME>uint16</SHORT-NAME>", autosar.xml.Writer().write_str(document))
+
+    def test_invalid_element_is_removed_by_find(self):
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document.find("/DataTypes")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(document.find("/DataTypes/Invalid"))
+        self.assertEqual(package.lazy_count, 2)
+        self.assertEqual([x.name for x in package.filter_regex("uint")], ["uint8", "uint16"])
+        self.assertEqual([x.name for x in package.elements], ["uint8", "uint16"])
+
+    def test_file_is_closed_after_last_element(self):
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document.find("/DataTypes")
+        source = package._elements[0].loader.args[0]  # pylint: disable=protected-access
+        document.find("/DataTypes/uint8")
+        self.assertFalse(source.data.closed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _ = package.elements
+        self.assertTrue(source.data.closed)
+
+    def test_markup_inside_elements(self):
+        base_type = '<SW-BASE-TYPE><SHORT-NAME>{}</SHORT-NAME>{}</SW-BASE-TYPE >'
+        contents = ['<!-- </SW-BASE-TYPE> -->',
+                    '<DESC><L-2 L="EN"><![CDATA[<SW-BASE-TYPE>]]></L-2></DESC>',
+                    '<?pi <SW-BASE-TYPE>?>',
+                    '<DESC><L-2 L="EN">a &lt; b</L-2></DESC>']
+        document_xml = ('<?xml version="1.0" encoding="utf-8"?>\n<AUTOSAR xmlns="http://autosar.org/schema/r4.0">'
+                        '<AR-PACKAGES><AR-PACKAGE><SHORT-NAME>DataTypes</SHORT-NAME><ELEMENTS>{}{}'
+                        '</ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>')
+        for content in contents:
+            self.xml = document_xml.format(base_type.format("uint8", content), base_type.format("uint16", ""))
+            self.write_xml()
+            reader = autosar.xml.Reader()
+            document = reader.read_file(self.file_path, stop_on_error=True, lazy=True)
+            self.assertEqual(document.find("/DataTypes").lazy_count, 2, content)
+            self.assertEqual([x.name for x in document.find("/DataTypes").elements], ["uint8", "uint16"])
+
+    def test_short_name_with_character_reference(self):
+        self.xml = self.xml.replace("<SHORT-NAME>uint8</SHORT-NAME>", "<SHORT-NAME>uint&#56;</SHORT-NAME>")
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        elem = document.find("/DataTypes/uint8")
+        self.assertIsInstance(elem, ar_element.SwBaseType)
+        self.assertEqual(str(elem.ref()), "/DataTypes/uint8")
+
+    def test_short_name_after_comment(self):
+        self.xml = self.xml.replace("<SHORT-NAME>uint8</SHORT-NAME>", "<!-- <SHORT-NAME>x</SHORT-NAME> -->"
+                                    "<SHORT-NAME>uint8</SHORT-NAME>")
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        self.assertIsInstance(document.find("/DataTypes/uint8"), ar_element.SwBaseType)
+        self.assertIsNone(document.find("/DataTypes/x"))
+
+    def test_malformed_element_is_removed_and_file_closed(self):
+        self.xml = self.xml.replace("<BASE-TYPE-SIZE>8</BASE-TYPE-SIZE>", "<BASE-TYPE-SIZE>8</BASE-TYPE-SIZE></X>")
+        self.write_xml()
+        document = autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+        package: ar_element.Package = document.find("/DataTypes")
+        source = package._elements[0].loader.args[0]  # pylint: disable=protected-access
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual([x.name for x in package.elements], ["uint16"])
+        self.assertTrue(output.getvalue().startswith("document.arxml(8): "))
+        self.assertTrue(source.data.closed)
+
+    def test_unscannable_file_is_read_normally(self):
+        self.xml = self.xml.replace("</ELEMENTS>", "")
+        self.write_xml()
+        with self.assertRaises(lxml.etree.XMLSyntaxError):
+            autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path)
+        with self.assertRaises(lxml.etree.XMLSyntaxError):
+            autosar.xml.Reader(warn_on_unprocessed_element=False).read_file(self.file_path, lazy=True)
+
+    def test_workspace_lookup(self):
+        self.write_xml()
+        workspace = autosar.xml.Workspace()
+        reader = autosar.xml.Reader(warn_on_unprocessed_element=False)
+        workspace.merge_document(reader.read_file(self.file_path, lazy=True))
+        elem = workspace.find("/DataTypes/uint8")
+        self.assertIsInstance(elem, ar_element.SwBaseType)
+        self.assertIs(workspace.find(elem.ref()), elem)
+
+    def test_package_filter(self):
+        self.write_xml()
+        reader = autosar.xml.Reader(include_packages=["/Other"])
+        self.assertEqual(len(reader.read_file(self.file_path, lazy=True).packages), 0)
+
+    def test_streaming_and_lazy_are_exclusive(self):
+        self.write_xml()
+        with self.assertRaises(ValueError):
+            autosar.xml.Reader().read_file(self.file_path, streaming=True, lazy=True)
+
+
+class ReaderInputTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.tmp_dir.name, "document.arxml")
+        document = ar_document.Document()
+        package = document.create_package("DataTypes")
+        for i in range(10):
+            package.append(ar_element.SwBaseType(f"uint{i}", size=8))
+        self.writer = autosar.xml.Writer()
+        self.writer.write_file(document, self.file_path)
+        self.expected = self.writer.write_str(document)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_read_str_from_buffers(self):
+        with open(self.file_path, "rb") as fh:
+            data = fh.read()
+        reader = autosar.xml.Reader()
+        for xml in (data, bytearray(data), memoryview(data), data.decode("utf-8"), io.BytesIO(data)):
+            self.assertEqual(self.writer.write_str(reader.read_str(xml)), self.expected, str(type(xml)))
+
+    def test_read_str_from_mmap(self):
+        with open(self.file_path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                document = autosar.xml.Reader().read_str(data)
+        self.assertEqual(self.writer.write_str(document), self.expected)
+
+    def test_read_file_from_file_object(self):
+        reader = autosar.xml.Reader()
+        for streaming in (False, True):
+            with open(self.file_path, "rb") as fh:
+                document = reader.read_file(fh, streaming=streaming)
+            self.assertEqual(reader.file_base_name, "document.arxml")
+            self.assertEqual(self.writer.write_str(document), self.expected)
+        with open(self.file_path, "rb") as fh:
+            with self.assertRaises(ValueError):
+                reader.read_file(fh, lazy=True)
+
+
+class CompressedFileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        document = ar_document.Document()
+        package = document.create_package("DataTypes")
+        for i in range(10):
+            package.append(ar_element.SwBaseType(f"uint{i}", size=8))
+        self.document = document
+        self.writer = autosar.xml.Writer()
+        self.expected = self.writer.write_str(document)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write_and_read_compressed_files(self):
+        reader = autosar.xml.Reader()
+        for file_name in ("document.arxml.gz", "document.arxml.xz"):
+            file_path = os.path.join(self.tmp_dir.name, file_name)
+            self.writer.write_file(self.document, file_path)
+            with open(file_path, "rb") as fh:
+                self.assertFalse(fh.read().startswith(b"<?xml"))
+            for streaming in (False, True):
+                document = reader.read_file(file_path, streaming=streaming)
+                self.assertEqual(self.writer.write_str(document), self.expected)
+            with self.assertRaises(ValueError):
+                reader.read_file(file_path, lazy=True)
+
+    def test_gzip_output_is_reproducible(self):
+        file_path = os.path.join(self.tmp_dir.name, "document.arxml.gz")
+        self.writer.write_file(self.document, file_path)
+        with open(file_path, "rb") as fh:
+            data = fh.read()
+        self.assertFalse(self.writer.write_file(self.document, file_path, skip_unchanged=True))
+        self.assertTrue(self.writer.write_file(self.document, file_path))
+        with open(file_path, "rb") as fh:
+            self.assertEqual(fh.read(), data)
+
+    def test_read_zip(self):
+        file_path = os.path.join(self.tmp_dir.name, "bundle.zip")
+        with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("b/First.arxml", self.writer.write_str(self.document, skip_root_attr=False))
+            zip_file.writestr("README.txt", "Not ARXML")
+            zip_file.writestr("a/Second.ARXML", self.writer.write_str(self.document, skip_root_attr=False))
+        reader = autosar.xml.Reader()
+        result = list(reader.read_zip(file_path))
+        self.assertEqual([x[0] for x in result], ["b/First.arxml", "a/Second.ARXML"])
+        for _, document in result:
+            self.assertEqual(self.writer.write_str(document), self.expected)
+
+
+class WriterBufferTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def create_document(self) -> ar_document.Document:
+        document = ar_document.Document()
+        package = document.create_package("DataTypes")
+        for i in range(10):
+            package.append(ar_element.SwBaseType(f"uint{i}", size=8))
+        return document
+
+    def test_buffer_size_does_not_change_output(self):
+        document = self.create_document()
+        expected = autosar.xml.Writer().write_str(document)
+        for buffer_size in [0, 1, 7]:
+            writer = autosar.xml.Writer(buffer_size=buffer_size)
+            self.assertEqual(writer.write_str(document), expected)
+            file_path = os.path.join(self.tmp_dir.name, f"document{buffer_size}.arxml")
+            writer.write_file(document, file_path)
+            with open(file_path, encoding="utf-8") as fh:
+                self.assertEqual(fh.read(), autosar.xml.Writer().write_str(document, skip_root_attr=False))
+
+
+class FloatFormatTests(unittest.TestCase):
+    """
+    Property-based test comparing the fast float formatter against the decimal-based one
+    """
+
+    def random_floats(self, count: int):
+        rng = random.Random(0x5EED)
+        special = [0.0, -0.0, 1.0, -1.0, 0.1, 0.5, 1e15, 1e16, -1e16, 9007199254740993.0, 1e-4, 1e-5, 1e22,
+                   123456789.125, 1.7976931348623157e308, 5e-324, float('inf'), float('-inf'), float('nan')]
+        yield from special
+        for _ in range(count):
+            yield struct.unpack('<d', rng.getrandbits(64).to_bytes(8, 'little'))[0]
+            yield rng.uniform(-1.0, 1.0) * 10.0 ** rng.randint(-20, 20)
+            yield float(rng.randint(-2**60, 2**60)) / 2 ** rng.randint(0, 10)
+            yield round(rng.uniform(-1000.0, 1000.0), rng.randint(0, 6))
+
+    def test_fast_formatter_is_equivalent(self):
+        writer = autosar.xml.Writer()
+        for value in self.random_floats(5000):
+            try:
+                expected = writer._format_float_decimal(value)
+            except decimal.InvalidOperation:
+                with self.assertRaises(decimal.InvalidOperation):
+                    writer._format_float(value)
+                continue
+            self.assertEqual(writer._format_float(value), expected, repr(value))
+
+    def test_int_values(self):
+        writer = autosar.xml.Writer()
+        self.assertEqual(writer._format_float(5), "5")
+        self.assertEqual(writer._format_float(-12), "-12")
+
+
 if __name__ == '__main__':
     unittest.main()
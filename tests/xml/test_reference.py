@@ -2,11 +2,13 @@
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 import os
+import pickle
 import sys
 import unittest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 import autosar.xml.element as ar_element # noqa E402
 import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml.workspace as ar_workspace  # noqa E402
 
 
 class TestPortReferences(unittest.TestCase):
@@ -22,5 +24,85 @@ class TestPortReferences(unittest.TestCase):
             ar_element.AbstractRequiredPortPrototypeRef(pport_ref.value, pport_ref.dest)
 
 
+class TestReferenceStringCache(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("DataTypes/BaseTypes")
+        package.append(ar_element.SwBaseType("uint8"))
+        workspace.make_packages("Other")
+        return workspace
+
+    def test_ref_is_unchanged_on_repeated_calls(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+
+    def test_rename_element(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        elem.name = "MyUint8"
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/MyUint8")
+
+    def test_rename_parent_package(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        workspace.find("/DataTypes").name = "Types"
+        self.assertEqual(str(elem.ref()), "/Types/BaseTypes/uint8")
+
+    def test_rename_keeps_other_caches(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        ref_cache = elem._ref_cache  # pylint: disable=protected-access
+        other = workspace.find("/Other")
+        self.assertEqual(str(other.ref()), "/Other")
+        other.name = "Other2"
+        self.assertEqual(str(other.ref()), "/Other2")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        self.assertIs(elem._ref_cache, ref_cache)  # pylint: disable=protected-access
+
+    def test_move_element(self):
+        workspace = self.create_workspace()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint8")
+        workspace.find("/Other").append(elem)
+        self.assertEqual(str(elem.ref()), "/Other/uint8")
+        elem.parent = None
+        self.assertIsNone(elem.ref())
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_reference_has_no_instance_dict(self):
+        ref = ar_element.SwBaseTypeRef("/DataTypes/BaseTypes/uint8")
+        self.assertFalse(hasattr(ref, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ref.unknown = 1
+
+    def test_is_empty(self):
+        iref = ar_element.PortInCompositionTypeInstanceRef()
+        self.assertTrue(iref.is_empty)
+        iref.component_ref = ar_element.SwComponentPrototypeRef("/ComponentTypes/MyComposition/MyComponent")
+        self.assertFalse(iref.is_empty)
+        self.assertTrue(iref.is_empty_with_ignore({"component_ref"}))
+        self.assertTrue(ar_element.AutosarVariableRef().is_empty)
+
+    def test_pickle(self):
+        port_ref = ar_element.PortPrototypeRef("/ComponentTypes/MyComponent/MyPort",
+                                               ar_enum.IdentifiableSubTypes.R_PORT_PROTOTYPE)
+        data_ref = ar_element.VariableDataPrototypeRef("/PortInterfaces/MyInterface/MyElement")
+        variable_access = ar_element.VariableAccess.make_from_port("MyAccess", port_ref, data_ref)
+        variable_access.category = "MyCategory"
+        copy = pickle.loads(pickle.dumps(variable_access, protocol=5))
+        self.assertEqual(copy.name, "MyAccess")
+        self.assertEqual(copy.category, "MyCategory")
+        iref = copy.accessed_variable.ar_variable_iref
+        self.assertEqual(str(iref.port_prototype_ref), "/ComponentTypes/MyComponent/MyPort")
+
+
 if __name__ == '__main__':
     unittest.main()
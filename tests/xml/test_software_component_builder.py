@@ -349,6 +349,36 @@ class TestSwcPortFinderAPI(unittest.TestCase):
         self.assertEqual(port.name, "SafeState")
         self.assertIsNone(swc.find_p_port("EngineSpeed"))
 
+    def test_find_port_after_ports_changed(self):
+        workspace = autosar.xml.Workspace()
+        swc = self.create_swc(workspace)
+        port = swc.find_r_port("EngineSpeed")
+        swc.ports.remove(port)
+        self.assertIsNone(swc.find_r_port("EngineSpeed"))
+        swc.append_port(port)
+        port.name = "EngineSpeed2"
+        self.assertIsNone(swc.find_r_port("EngineSpeed"))
+        self.assertIs(swc.find_r_port("EngineSpeed2"), port)
+        self.assertIs(swc.find("EngineSpeed2"), port)
+
+    def test_find_port_after_rename(self):
+        workspace = autosar.xml.Workspace()
+        swc = self.create_swc(workspace)
+        port = swc.find_p_port("VehicleSpeed")
+        port.name = "VehicleSpeed2"
+        self.assertIs(swc.find("VehicleSpeed2"), port)
+        self.assertIs(swc.find_p_port("VehicleSpeed2"), port)
+        self.assertIsNone(swc.find("VehicleSpeed"))
+
+    def test_find_port_after_ports_replaced(self):
+        workspace = autosar.xml.Workspace()
+        swc = self.create_swc(workspace)
+        self.assertIsNotNone(swc.find("VehicleSpeed"))
+        swc.ports = [ar_element.ProvidePortPrototype("Y")]
+        self.assertIs(swc.find("Y"), swc.ports[0])
+        self.assertIs(swc.find_p_port("Y"), swc.ports[0])
+        self.assertIsNone(swc.find("VehicleSpeed"))
+
 
 class TestRootCollectionAPI(unittest.TestCase):
 
@@ -1113,5 +1143,80 @@ class TestExclusiveAreaAPI(unittest.TestCase):
         self.assertEqual(str(elem.exclusive_area), ref_str)
 
 
+class TestCompositionConnectorAPI(unittest.TestCase):
+
+    def create_composition(self, workspace: autosar.xml.Workspace) -> ar_element.CompositionSwComponentType:
+        packages = create_packages(workspace)
+        create_platform_types(packages)
+        vehicle_speed_interface = create_vehicle_speed_interface(packages)
+        engine_speed_interface = create_engine_speed_interface(packages)
+        sender = ar_element.ApplicationSoftwareComponentType("Sender")
+        packages["ComponentTypes"].append(sender)
+        sender.create_provide_port("VehicleSpeed", vehicle_speed_interface, com_spec={'init_value': 65535})
+        sender.create_provide_port("EngineSpeed", engine_speed_interface, com_spec={'init_value': 65535})
+        receiver = ar_element.ApplicationSoftwareComponentType("Receiver")
+        packages["ComponentTypes"].append(receiver)
+        receiver.create_require_port("VehicleSpeed", vehicle_speed_interface, com_spec={'init_value': 65535})
+        receiver.create_require_port("EngineSpeed", engine_speed_interface, com_spec={'init_value': 65535})
+        # Port interface matches but there is no provide-port with this name
+        receiver.create_require_port("Speed", vehicle_speed_interface, com_spec={'init_value': 65535})
+        swc = ar_element.CompositionSwComponentType("Composition")
+        packages["ComponentTypes"].append(swc)
+        swc.create_require_port("EngineSpeed", engine_speed_interface, com_spec={'init_value': 65535})
+        swc.create_provide_port("VehicleSpeed", vehicle_speed_interface, com_spec={'init_value': 65535})
+        swc.create_component_prototype(sender)
+        swc.create_component_prototype(receiver, "Receiver1")
+        swc.create_component_prototype(receiver, "Receiver2")
+        return swc
+
+    def test_create_connectors(self):
+        workspace = autosar.xml.Workspace()
+        swc = self.create_composition(workspace)
+        connectors = swc.create_connectors([("Sender/VehicleSpeed", "Receiver1/VehicleSpeed"),
+                                            ("Receiver2/VehicleSpeed", "Sender/VehicleSpeed"),
+                                            ("EngineSpeed", "Receiver1/EngineSpeed")],
+                                           workspace)
+        self.assertEqual([x.name for x in connectors], ["Sender_VehicleSpeed_Receiver1_VehicleSpeed",
+                                                        "Sender_VehicleSpeed_Receiver2_VehicleSpeed",
+                                                        "EngineSpeed_Receiver1_EngineSpeed"])
+        self.assertIsInstance(connectors[0], ar_element.AssemblySwConnector)
+        self.assertIsInstance(connectors[2], ar_element.DelegationSwConnector)
+        self.assertEqual(swc.connectors, connectors)
+        with self.assertRaises(ValueError):
+            swc.create_connectors([("Sender/VehicleSpeed", "Receiver1/VehicleSpeed")], workspace)
+
+    def test_create_connectors_gives_same_result_as_create_connector(self):
+        port_ref_pairs = [("Sender/VehicleSpeed", "Receiver1/VehicleSpeed"),
+                          ("Sender/EngineSpeed", "Receiver2/EngineSpeed"),
+                          ("Receiver2/VehicleSpeed", "VehicleSpeed")]
+        workspace1 = autosar.xml.Workspace()
+        swc1 = self.create_composition(workspace1)
+        for port_ref1, port_ref2 in port_ref_pairs:
+            swc1.create_connector(port_ref1, port_ref2, workspace1)
+        workspace2 = autosar.xml.Workspace()
+        swc2 = self.create_composition(workspace2)
+        swc2.create_connectors(port_ref_pairs, workspace2)
+        writer = autosar.xml.Writer()
+        self.assertEqual(writer.write_str_elem(swc2), writer.write_str_elem(swc1))
+
+    def test_auto_connect(self):
+        workspace = autosar.xml.Workspace()
+        swc = self.create_composition(workspace)
+        connectors = swc.auto_connect(workspace)
+        self.assertEqual([x.name for x in connectors], ["Sender_VehicleSpeed_Receiver1_VehicleSpeed",
+                                                        "Sender_EngineSpeed_Receiver1_EngineSpeed",
+                                                        "Sender_VehicleSpeed_Receiver2_VehicleSpeed",
+                                                        "Sender_EngineSpeed_Receiver2_EngineSpeed",
+                                                        "EngineSpeed_Receiver1_EngineSpeed",
+                                                        "EngineSpeed_Receiver2_EngineSpeed",
+                                                        "Sender_VehicleSpeed_VehicleSpeed"])
+        self.assertIsInstance(connectors[0], ar_element.AssemblySwConnector)
+        self.assertIsInstance(connectors[4], ar_element.DelegationSwConnector)
+        self.assertIsInstance(connectors[6], ar_element.DelegationSwConnector)
+        # Existing connectors are skipped
+        self.assertEqual(swc.auto_connect(workspace), [])
+        self.assertEqual(len(swc.connectors), 7)
+
+
 if __name__ == '__main__':
     unittest.main()
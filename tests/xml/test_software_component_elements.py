@@ -1974,6 +1974,30 @@ class TestCompositionSwComponentType(unittest.TestCase):
         connector = elem.connectors[0]
         self.assertIsInstance(elem.connectors[0], ar_element.PassThroughSwConnector)
 
+    def test_find(self):
+        port_ref = ar_element.PortPrototypeRef("ComponentTypes/ShortName/PortName",
+                                               ar_enum.IdentifiableSubTypes.P_PORT_PROTOTYPE)
+        element = ar_element.CompositionSwComponentType(
+            "ShortName",
+            ports=ar_element.ProvidePortPrototype("PortName"),
+            components=[ar_element.SwComponentPrototype(f"Component{i}") for i in range(100)],
+            connectors=ar_element.PassThroughSwConnector("ConnectorName", port_ref, port_ref))
+        self.assertIs(element.find("Component42"), element.components[42])
+        self.assertIs(element.find("ConnectorName"), element.connectors[0])
+        self.assertIs(element.find("PortName"), element.ports[0])
+        self.assertIsNone(element.find("Component100"))
+        # Lists changed directly are detected as well as renamed elements
+        element.components.append(ar_element.SwComponentPrototype("Component100"))
+        self.assertIs(element.find("Component100"), element.components[100])
+        element.components[0].name = "Renamed"
+        self.assertIsNone(element.find("Component0"))
+        self.assertIs(element.find("Renamed"), element.components[0])
+        element.components = [ar_element.SwComponentPrototype("Replaced")]
+        self.assertIs(element.find("Replaced"), element.components[0])
+        self.assertIsNone(element.find("Renamed"))
+        element.connectors[0].name = "Connector2"
+        self.assertIs(element.find("Connector2"), element.connectors[0])
+
 
 class TestSwcImplementation(unittest.TestCase):
     """
@@ -2,6 +2,7 @@
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
 import os
+import random
 import sys
 import unittest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
@@ -4164,5 +4165,106 @@ class TestSwcInternalBehavior(unittest.TestCase):
     # NOT SUPPORTED:  VARIATION-POINT
 
 
+class TestUniqueNames(unittest.TestCase):
+
+    def test_registry_gives_same_result_as_list_search(self):
+        rng = random.Random(1234)
+        base_names = ["Event", "Event_1", "Other", "Event_Other", "E"]
+        for _ in range(50):
+            expected_elements = []
+            elements = []
+            registry = ar_element._NameRegistry(elements)
+            for _ in range(30):
+                base_name = rng.choice(base_names)
+                expected_name = ar_element.make_unique_name_in_list(expected_elements, base_name)
+                expected_elements.append(ar_element.InitEvent(expected_name))
+                name = registry.make_unique(base_name)
+                element = ar_element.InitEvent(name)
+                elements.append(element)
+                registry.add(element)
+                self.assertEqual([x.name for x in elements], [x.name for x in expected_elements])
+
+    def test_duplicate_event_raises_error(self):
+        behavior = ar_element.SwcInternalBehavior("MyName", events=ar_element.InitEvent("MyEvent"))
+        with self.assertRaises(autosar.xml.exception.DuplicateElement):
+            behavior.append_event(ar_element.TimingEvent("MyEvent"))
+
+    def test_duplicate_runnable_raises_error(self):
+        behavior = ar_element.SwcInternalBehavior("MyName")
+        behavior.create_runnable("MyRunnable")
+        with self.assertRaises(autosar.xml.exception.DuplicateElement):
+            behavior.create_runnable("MyRunnable")
+
+    def test_duplicate_after_rename_raises_error(self):
+        behavior = ar_element.SwcInternalBehavior("MyName")
+        behavior.append_event(ar_element.TimingEvent("A"))
+        behavior.events[0].name = "X"
+        with self.assertRaises(autosar.xml.exception.DuplicateElement):
+            behavior.append_event(ar_element.TimingEvent("X"))
+        behavior.append_event(ar_element.TimingEvent("A"))
+        self.assertEqual([x.name for x in behavior.events], ["X", "A"])
+        behavior.create_runnable("R1")
+        behavior.runnables[0].name = "R2"
+        with self.assertRaises(autosar.xml.exception.DuplicateElement):
+            behavior.create_runnable("R2")
+
+    def test_rename_in_other_behavior_keeps_index(self):
+        behavior1 = ar_element.SwcInternalBehavior("Behavior1")
+        behavior2 = ar_element.SwcInternalBehavior("Behavior2")
+        runnable1 = behavior1.create_runnable("R1")
+        runnable2 = behavior2.create_runnable("R1")
+        self.assertIs(behavior1.find_runnable("R1"), runnable1)
+        registry = behavior1._get_runnable_names()
+        runnable2.name = "R2"
+        self.assertFalse(registry._is_stale)
+        self.assertIs(behavior1.find_runnable("R1"), runnable1)
+        self.assertIs(behavior2.find_runnable("R2"), runnable2)
+
+    def test_find_runnable_after_rename(self):
+        behavior = ar_element.SwcInternalBehavior("MyName")
+        runnable = behavior.create_runnable("R1")
+        self.assertIs(behavior.find_runnable("R1"), runnable)
+        runnable.name = "R2"
+        self.assertIs(behavior.find_runnable("R2"), runnable)
+        self.assertIsNone(behavior.find_runnable("R1"))
+        behavior.runnables = [ar_element.RunnableEntity("R3")]
+        self.assertIs(behavior.find_runnable("R3"), behavior.runnables[0])
+        self.assertIsNone(behavior.find_runnable("R2"))
+
+    def test_find_gives_first_element_with_same_name(self):
+        behavior = ar_element.SwcInternalBehavior("MyName")
+        behavior.runnables.extend([ar_element.RunnableEntity("R1"), ar_element.RunnableEntity("R1")])
+        for runnable in behavior.runnables:
+            runnable.parent = behavior
+        self.assertIs(behavior.find_runnable("R1"), behavior.runnables[0])
+        behavior.runnables[0].name = "R2"
+        self.assertIs(behavior.find_runnable("R1"), behavior.runnables[1])
+
+    def test_make_unique_with_same_names_gives_same_result_as_list_search(self):
+        elements = [ar_element.InitEvent("E"), ar_element.InitEvent("E_1"), ar_element.InitEvent("E")]
+        expected_elements = [ar_element.InitEvent(x.name) for x in elements]
+        registry = ar_element._NameRegistry(elements)
+        self.assertIs(registry.get("E"), elements[0])
+        self.assertEqual(registry.make_unique("E"), ar_element.make_unique_name_in_list(expected_elements, "E"))
+        self.assertEqual([x.name for x in elements], [x.name for x in expected_elements])
+        self.assertIs(registry.get("E"), elements[0])
+
+    def test_make_unique_event_name(self):
+        behavior = ar_element.SwcInternalBehavior("MyName")
+        names = []
+        for _ in range(3):
+            event = ar_element.InitEvent(behavior._make_unique_event_name("MyEvent"))
+            behavior.append_event(event)
+            names.append(event.name)
+        self.assertEqual(names, ["MyEvent", "MyEvent_1", "MyEvent_2"])
+        self.assertEqual([x.name for x in behavior.events], ["MyEvent_0", "MyEvent_1", "MyEvent_2"])
+
+    def test_access_points_with_same_name(self):
+        runnable = ar_element.RunnableEntity("MyRunnable")
+        for _ in range(3):
+            runnable.append_data_read_access(ar_element.VariableAccess("MyAccess"))
+        self.assertEqual([x.name for x in runnable.data_read_access], ["MyAccess_0", "MyAccess_1", "MyAccess_2"])
+
+
 if __name__ == '__main__':
     unittest.main()
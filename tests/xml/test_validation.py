@@ -0,0 +1,177 @@
+"""Unit tests for ConstraintValidator"""
+
+# pylint: disable=missing-class-docstring, missing-function-docstring
+import math
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.enumeration as ar_enum  # noqa E402
+import autosar.xml  # noqa E402
+
+
+def create_workspace() -> autosar.xml.Workspace:
+    """
+    Creates workspace with implementation and application data types referencing data constraints
+    """
+    workspace = autosar.xml.Workspace()
+    constraints, impl_types, app_types, constants = workspace.make_packages("DataConstrs",
+                                                                            "ImplementationDataTypes",
+                                                                            "ApplicationDataTypes",
+                                                                            "Constants")
+    uint8_constr = ar_element.DataConstraint.make_internal("uint8_DataConstr", 0, 255)
+    percent_constr = ar_element.DataConstraint.make_internal("Percent_DataConstr", 0, 200)
+    speed_constr = ar_element.DataConstraint.make_physical("Speed_DataConstr", 0, 300,
+                                                           upper_limit_type=ar_enum.IntervalType.OPEN)
+    invalid_scale = ar_element.ScaleConstraint(lower_limit=250, upper_limit=255,
+                                               validity=ar_enum.ScaleConstraintValidity.NOT_VALID)
+    level_constr = ar_element.DataConstraint.make_internal("Level_DataConstr", 0, 255, scale_constr=[invalid_scale])
+    for constraint in (uint8_constr, percent_constr, speed_constr, level_constr):
+        constraints.append(constraint)
+    uint8_type = ar_element.ImplementationDataType(
+        "uint8", category="VALUE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(data_constraint_ref=uint8_constr.ref()))
+    percent_type = ar_element.ImplementationDataType(
+        "Percent_T", category="TYPE_REFERENCE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(data_constraint_ref=percent_constr.ref(),
+                                                               impl_data_type_ref=uint8_type.ref()))
+    level_type = ar_element.ImplementationDataType(
+        "Level_T", category="VALUE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(data_constraint_ref=level_constr.ref()))
+    for data_type in (uint8_type, percent_type, level_type):
+        impl_types.append(data_type)
+    array_type = ar_element.ImplementationDataType("Percent4_T", category="ARRAY")
+    array_type.append(ar_element.ImplementationDataTypeElement(
+        "Element", category="TYPE_REFERENCE", array_size=4,
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(impl_data_type_ref=percent_type.ref())))
+    impl_types.append(array_type)
+    record_type = ar_element.ImplementationDataType("Record_T", category="STRUCTURE")
+    record_type.append(ar_element.ImplementationDataTypeElement(
+        "First", category="TYPE_REFERENCE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(impl_data_type_ref=uint8_type.ref())))
+    record_type.append(ar_element.ImplementationDataTypeElement(
+        "Second", category="TYPE_REFERENCE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(impl_data_type_ref=array_type.ref())))
+    impl_types.append(record_type)
+    speed_type = ar_element.ApplicationPrimitiveDataType(
+        "Speed_T", category="VALUE",
+        sw_data_def_props=ar_element.SwDataDefPropsConditional(data_constraint_ref=speed_constr.ref()))
+    app_types.append(speed_type)
+    app_types.append(ar_element.ApplicationArrayDataType(
+        "SpeedArray_T", element=ar_element.ApplicationArrayElement("Element", type_ref=speed_type.ref())))
+    app_types.append(ar_element.ApplicationRecordDataType(
+        "SpeedRecord_T", elements=[ar_element.ApplicationRecordElement("Front", type_ref=speed_type.ref()),
+                                   ar_element.ApplicationRecordElement("Rear", type_ref=speed_type.ref())]))
+    constants.append(ar_element.ConstantSpecification.make_constant("MaxPercent", 250))
+    return workspace
+
+
+class TestConstraintValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = create_workspace()
+        self.validator = autosar.xml.ConstraintValidator(self.workspace)
+
+    def test_scalar_value(self):
+        value = ar_element.NumericalValueSpecification(value=256)
+        violations = self.validator.validate(value, "/ImplementationDataTypes/uint8", "/Test/Value")
+        self.assertEqual(len(violations), 1)
+        violation = violations[0]
+        self.assertEqual(violation.element_ref, "/Test/Value")
+        self.assertEqual(violation.path, "")
+        self.assertEqual(violation.value, 256)
+        self.assertEqual(violation.constraint_ref, "/DataConstrs/uint8_DataConstr")
+        self.assertEqual((violation.lower_limit, violation.upper_limit), (0, 255))
+        self.assertFalse(violation.is_invalid_scale)
+        value = ar_element.NumericalValueSpecification(value=255)
+        self.assertEqual(self.validator.validate(value, "/ImplementationDataTypes/uint8"), [])
+
+    def test_type_reference_uses_its_own_constraint(self):
+        value = ar_element.NumericalValueSpecification(value=201)
+        violations = self.validator.validate(value, "/ImplementationDataTypes/Percent_T")
+        self.assertEqual([x.constraint_ref for x in violations], ["/DataConstrs/Percent_DataConstr"])
+
+    def test_array_and_record(self):
+        value = ar_element.ValueSpecification.make_value(["R", 300, ["A", 0, 201, 50, 250]])
+        violations = self.validator.validate(value, "/ImplementationDataTypes/Record_T")
+        self.assertEqual([(x.path, x.value) for x in violations],
+                         [(".First", 300), (".Second[1]", 201), (".Second[3]", 250)])
+
+    def test_constant_specification(self):
+        constant = self.workspace.find("/Constants/MaxPercent")
+        violations = self.validator.validate(constant, "/ImplementationDataTypes/Percent_T")
+        self.assertEqual([(x.element_ref, x.value) for x in violations], [("/Constants/MaxPercent", 250)])
+
+    def test_constant_reference(self):
+        value = ar_element.ArrayValueSpecification(elements=[ar_element.NumericalValueSpecification(value=1),
+                                                             ar_element.ConstantReference("/Constants/MaxPercent")])
+        violations = self.validator.validate(value, "/ImplementationDataTypes/Percent4_T")
+        self.assertEqual([(x.path, x.value) for x in violations], [("[1]", 250)])
+
+    def test_application_types_use_physical_constraint(self):
+        value = ar_element.ValueSpecification.make_value(["A", 0, 299.5, 300, -1, "Text"])
+        violations = self.validator.validate(value, "/ApplicationDataTypes/SpeedArray_T")
+        self.assertEqual([(x.path, x.value) for x in violations], [("[2]", 300), ("[3]", -1)])
+        value = ar_element.ValueSpecification.make_value(["R", 10, 301])
+        violations = self.validator.validate(value, "/ApplicationDataTypes/SpeedRecord_T")
+        self.assertEqual([x.path for x in violations], [".Rear"])
+        self.assertEqual(self.validator.validate(value, "/ImplementationDataTypes/Record_T"), [])
+
+    def test_record_element_without_type(self):
+        speed_ref = self.workspace.find("/ApplicationDataTypes/Speed_T").ref()
+        data_type = ar_element.ApplicationRecordDataType(
+            "Record_T", elements=[ar_element.ApplicationRecordElement("Untyped"),
+                                  ar_element.ApplicationRecordElement("Front", type_ref=speed_ref)])
+        value = ar_element.ValueSpecification.make_value(["R", 500, 301])
+        violations = self.validator.validate(value, data_type)
+        self.assertEqual([(x.path, x.value) for x in violations], [(".Front", 301)])
+
+    def test_application_value_specification(self):
+        sw_values = ar_element.SwValues([10, 400, ar_element.ValueGroup(values=[20, -5])])
+        value = ar_element.ApplicationValueSpecification(
+            category="VALUE", sw_value_cont=ar_element.SwValueCont(sw_values_phys=sw_values))
+        violations = self.validator.validate(value, "/ApplicationDataTypes/Speed_T")
+        self.assertEqual([(x.path, x.value) for x in violations], [("[1]", 400), ("[2][1]", -5)])
+
+    def test_invalid_scale(self):
+        value = ar_element.ValueSpecification.make_value(["A", 249, 250, 255])
+        data_type = ar_element.ImplementationDataType("Level4_T", category="ARRAY",
+                                                      sub_elements=[self._level_element()])
+        violations = self.validator.validate(value, data_type)
+        self.assertEqual([(x.path, x.is_invalid_scale) for x in violations], [("[1]", True), ("[2]", True)])
+
+    def test_nan_is_a_violation(self):
+        value = ar_element.ValueSpecification.make_value(["A", 1, math.nan, 2])
+        violations = self.validator.validate(value, "/ApplicationDataTypes/SpeedArray_T")
+        self.assertEqual([x.path for x in violations], ["[1]"])
+
+    def test_validate_many(self):
+        items = [(ar_element.NumericalValueSpecification(value=x), "/ImplementationDataTypes/uint8", f"/Test/V{i}")
+                 for i, x in enumerate([0, 256, 10, -1])]
+        items.append((self.workspace.find("/Constants/MaxPercent"), "/ImplementationDataTypes/Percent_T"))
+        violations = self.validator.validate_many(items)
+        self.assertEqual([x.element_ref for x in violations], ["/Test/V1", "/Test/V3", "/Constants/MaxPercent"])
+
+    def test_unknown_type(self):
+        with self.assertRaises(KeyError):
+            self.validator.validate(ar_element.NumericalValueSpecification(value=1), "/ImplementationDataTypes/X")
+
+    def test_equal_to_element_wise_check(self):
+        rng = random.Random(4)
+        constraint = self.workspace.find("/DataConstrs/Speed_DataConstr").rules[0].physical
+        values = [rng.choice([rng.uniform(-10, 310), 0, 300]) for _ in range(1000)]
+        value = ar_element.ValueSpecification.make_value(["A"] + values)
+        violations = self.validator.validate(value, "/ApplicationDataTypes/SpeedArray_T")
+        expected = [f"[{i}]" for i, x in enumerate(values) if not constraint.check_value(x)]
+        self.assertEqual(sorted(x.path for x in violations), sorted(expected))
+
+    def _level_element(self) -> ar_element.ImplementationDataTypeElement:
+        props = ar_element.SwDataDefPropsConditional(impl_data_type_ref="/ImplementationDataTypes/Level_T")
+        return ar_element.ImplementationDataTypeElement("Element", category="TYPE_REFERENCE", array_size=4,
+                                                        sw_data_def_props=props)
+
+
+if __name__ == '__main__':
+    unittest.main()
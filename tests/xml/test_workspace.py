@@ -1,13 +1,18 @@
 """Unit tests for workspace"""
 
 # pylint: disable=missing-class-docstring, missing-function-docstring
+import gzip
 import os
 import sys
+import tempfile
 import unittest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 import autosar.xml.workspace as ar_workspace # noqa E402
 import autosar.xml.enumeration as ar_enum  # noqa E402
 import autosar.xml.element as ar_element  # noqa E402
+import autosar.xml.document as ar_document  # noqa E402
+import autosar.xml.exception as ar_exception  # noqa E402
+from autosar.xml.writer import Writer  # noqa E402
 
 
 class NamespaceTests(unittest.TestCase):
@@ -200,5 +205,210 @@ class BehaviorSettingsTests(unittest.TestCase):
         self.assertEqual(workspace.behavior_settings.timing_event_prefix, "TMT")
 
 
+class LoadDocumentsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_document(self, file_name: str, package_ref: str, element_names: list[str]) -> str:
+        document = ar_document.Document()
+        package = document.make_packages(package_ref)
+        for name in element_names:
+            package.append(ar_element.SwBaseType(name))
+        file_path = os.path.join(self.tmp_dir.name, file_name)
+        Writer().write_file(document, file_path)
+        return file_path
+
+    def create_files(self) -> list[str]:
+        return [self.write_document("BaseTypes1.arxml", "DataTypes/BaseTypes", ["uint8", "uint16"]),
+                self.write_document("BaseTypes2.arxml", "DataTypes/BaseTypes", ["uint32"]),
+                self.write_document("Platform.arxml", "AUTOSAR_Platform/BaseTypes", ["boolean"])]
+
+    def test_load_serial(self):
+        file_paths = self.create_files()
+        workspace = ar_workspace.Workspace()
+        reports = workspace.load_documents(file_paths)
+        self.assertEqual([x.file_path for x in reports], file_paths)
+        self.assertEqual([x.name for x in workspace.packages], ["DataTypes", "AUTOSAR_Platform"])
+        package = workspace.find("/DataTypes/BaseTypes")
+        self.assertEqual([x.name for x in package.elements], ["uint8", "uint16", "uint32"])
+        elem = workspace.find("/DataTypes/BaseTypes/uint32")
+        self.assertEqual(str(elem.ref()), "/DataTypes/BaseTypes/uint32")
+
+    def test_load_parallel(self):
+        file_paths = self.create_files()
+        workspace = ar_workspace.Workspace()
+        reports = workspace.load_documents(file_paths, workers=2)
+        self.assertEqual([x.file_path for x in reports], file_paths)
+        for report in reports:
+            self.assertGreater(report.elapsed, 0.0)
+        package = workspace.find("/DataTypes/BaseTypes")
+        self.assertEqual([x.name for x in package.elements], ["uint8", "uint16", "uint32"])
+        self.assertIsInstance(workspace.find("/AUTOSAR_Platform/BaseTypes/boolean"), ar_element.SwBaseType)
+
+    def test_load_duplicate_element(self):
+        file_paths = [self.write_document("BaseTypes1.arxml", "DataTypes/BaseTypes", ["uint8"]),
+                      self.write_document("BaseTypes2.arxml", "DataTypes/BaseTypes", ["uint8"])]
+        workspace = ar_workspace.Workspace()
+        with self.assertRaises(ar_exception.DuplicateElement):
+            workspace.load_documents(file_paths, workers=2)
+
+
+class ReferenceIndexTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        package = workspace.make_packages("DataTypes/BaseTypes")
+        package.append(ar_element.SwBaseType("uint8"))
+        return workspace
+
+    def test_find_after_enable(self):
+        workspace = self.create_workspace()
+        workspace.enable_reference_index()
+        self.assertIn("/DataTypes/BaseTypes/uint8", workspace._ref_index)
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        self.assertIsInstance(elem, ar_element.SwBaseType)
+        self.assertIs(workspace.find("DataTypes/BaseTypes/uint8"), elem)
+        self.assertIsNone(workspace.find("/DataTypes/BaseTypes/uint16"))
+
+    def test_index_updated_on_append(self):
+        workspace = self.create_workspace()
+        workspace.enable_reference_index()
+        package = workspace.find("/DataTypes/BaseTypes")
+        elem = ar_element.SwBaseType("uint16")
+        package.append(elem)
+        self.assertIs(workspace._ref_index["/DataTypes/BaseTypes/uint16"], elem)
+        sub_package = ar_element.Package("ComponentTypes")
+        swc = ar_element.CompositionSwComponentType("MyComposition")
+        swc.append_port(ar_element.ProvidePortPrototype("MyPort"))
+        sub_package.append(swc)
+        workspace.append(sub_package)
+        port = workspace._ref_index["/ComponentTypes/MyComposition/MyPort"]
+        self.assertIs(workspace.find("/ComponentTypes/MyComposition/MyPort"), port)
+        component = ar_element.SwComponentPrototype("Inner")
+        swc.append_component(component)
+        self.assertIs(workspace._ref_index["/ComponentTypes/MyComposition/Inner"], component)
+
+    def test_renamed_element(self):
+        workspace = self.create_workspace()
+        workspace.enable_reference_index()
+        elem = workspace.find("/DataTypes/BaseTypes/uint8")
+        elem.name = "uint16"
+        self.assertIsNone(workspace._lookup_reference_index("/DataTypes/BaseTypes/uint8"))
+
+    def test_moved_package(self):
+        workspace = self.create_workspace()
+        workspace.enable_reference_index()
+        package = workspace.find("/DataTypes")
+        document = ar_document.Document()
+        document.append(package)
+        self.assertIsNone(workspace._lookup_reference_index("/DataTypes/BaseTypes/uint8"))
+
+
+class ReferrersIndexTests(unittest.TestCase):
+
+    def create_workspace(self) -> ar_workspace.Workspace:
+        workspace = ar_workspace.Workspace()
+        base_types, impl_types = workspace.make_packages("DataTypes/BaseTypes", "DataTypes/ImplementationTypes")
+        base_type = ar_element.SwBaseType("uint8")
+        base_types.append(base_type)
+        for name in ["MyUint8", "MyOtherUint8"]:
+            sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref=base_type.ref())
+            impl_types.append(ar_element.ImplementationDataType(name,
+                                                                category="VALUE",
+                                                                sw_data_def_props=sw_data_def_props))
+        return workspace
+
+    def test_referrers(self):
+        workspace = self.create_workspace()
+        referrers = workspace.referrers("/DataTypes/BaseTypes/uint8")
+        self.assertEqual([x.name for x in referrers], ["MyUint8", "MyOtherUint8"])
+        base_type_ref = workspace.find("/DataTypes/BaseTypes/uint8").ref()
+        self.assertEqual(len(workspace.referrers(base_type_ref, ar_enum.IdentifiableSubTypes.SW_BASE_TYPE)), 2)
+        self.assertEqual(workspace.referrers(base_type_ref, ar_enum.IdentifiableSubTypes.CONSTANT_SPECIFICATION), [])
+        self.assertEqual(workspace.referrers("/DataTypes/BaseTypes/uint16"), [])
+
+    def test_referrers_updated_on_append(self):
+        workspace = self.create_workspace()
+        workspace.enable_referrers_index()
+        package = workspace.find("/DataTypes/ImplementationTypes")
+        sw_data_def_props = ar_element.SwDataDefPropsConditional(base_type_ref="/DataTypes/BaseTypes/uint8")
+        impl_type = ar_element.ImplementationDataType("MyThirdUint8",
+                                                      category="VALUE",
+                                                      sw_data_def_props=sw_data_def_props)
+        package.append(impl_type)
+        referrers = workspace.referrers("/DataTypes/BaseTypes/uint8")
+        self.assertEqual(len(referrers), 3)
+        self.assertIs(referrers[2], impl_type)
+
+
+class WriteDocumentsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_documents(self,
+                        sub_dir: str,
+                        workers: int | None,
+                        skip_unchanged: bool = False,
+                        base_type_size: int = 8,
+                        compression: str | None = None) -> list[ar_workspace.DocumentReport]:
+        workspace = ar_workspace.Workspace(document_root=os.path.join(self.tmp_dir.name, sub_dir))
+        os.makedirs(workspace.document_root, exist_ok=True)
+        base_types, component_types = workspace.make_packages("DataTypes/BaseTypes", "ComponentTypes")
+        base_types.append(ar_element.SwBaseType("uint8", size=base_type_size))
+        for name in ["SwcA", "SwcB", "SwcC"]:
+            component_types.append(ar_element.ApplicationSoftwareComponentType(name))
+        workspace.create_document("DataTypes.arxml", "/DataTypes")
+        workspace.create_document_mapping("/ComponentTypes", ar_element.SwComponentType, [])
+        return workspace.write_documents(workers=workers, skip_unchanged=skip_unchanged, compression=compression)
+
+    def read_files(self, reports: list[ar_workspace.DocumentReport]) -> list[bytes]:
+        result = []
+        for report in reports:
+            with open(report.file_path, "rb") as fh:
+                result.append(fh.read())
+        return result
+
+    def test_serial_and_parallel_output_is_identical(self):
+        serial_reports = self.write_documents("serial", None)
+        parallel_reports = self.write_documents("parallel", 2)
+        self.assertEqual([os.path.basename(x.file_path) for x in serial_reports],
+                         ["DataTypes.arxml", "SwcA.arxml", "SwcB.arxml", "SwcC.arxml"])
+        self.assertEqual([os.path.basename(x.file_path) for x in parallel_reports],
+                         [os.path.basename(x.file_path) for x in serial_reports])
+        self.assertEqual(self.read_files(parallel_reports), self.read_files(serial_reports))
+        for report in parallel_reports:
+            self.assertEqual(report.size, os.path.getsize(report.file_path))
+            self.assertGreater(report.elapsed, 0.0)
+
+    def test_skip_unchanged(self):
+        reports = self.write_documents("output", None)
+        self.assertEqual([x.skipped for x in reports], [False] * 4)
+        reports = self.write_documents("output", None, skip_unchanged=True)
+        self.assertEqual([x.skipped for x in reports], [True] * 4)
+        reports = self.write_documents("output", 2, skip_unchanged=True, base_type_size=16)
+        self.assertEqual([x.skipped for x in reports], [False, True, True, True])
+        with open(reports[0].file_path, encoding="utf-8") as fh:
+            self.assertIn("<BASE-TYPE-SIZE>16</BASE-TYPE-SIZE>", fh.read())
+
+    def test_compression(self):
+        reports = self.write_documents("plain", None)
+        compressed_reports = self.write_documents("compressed", 2, compression="gzip")
+        self.assertEqual([os.path.basename(x.file_path) for x in compressed_reports],
+                         ["DataTypes.arxml.gz", "SwcA.arxml.gz", "SwcB.arxml.gz", "SwcC.arxml.gz"])
+        self.assertEqual([gzip.decompress(x) for x in self.read_files(compressed_reports)], self.read_files(reports))
+        compressed_reports = self.write_documents("compressed", None, skip_unchanged=True, compression="gzip")
+        self.assertEqual([x.skipped for x in compressed_reports], [True] * 4)
+        with self.assertRaises(ValueError):
+            self.write_documents("compressed", None, compression="zip")
+
+
 if __name__ == '__main__':
     unittest.main()